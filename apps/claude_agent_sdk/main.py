@@ -7,6 +7,7 @@ from claude_agent_sdk import Agent
 
 from hilo_eda.config import OutputConfig, SnowflakeConfig, TableConfig
 from hilo_eda.orchestrator import run_hilo_eda
+from hilo_eda.pool import get_pool
 
 app = typer.Typer(add_completion=False)
 
@@ -37,7 +38,8 @@ def run(
     table_config = TableConfig(database=database, schema=schema, table=table)
     output_config = OutputConfig(output_dir=output_dir, write_csv=write_csv)
 
-    agent.run(lambda: run_hilo_eda(config, table_config, output_config))
+    pool = get_pool(config)
+    agent.run(lambda: run_hilo_eda(config, table_config, output_config, pool=pool))
 
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ from crewai import Agent, Crew, Task
 
 from hilo_eda.config import OutputConfig, SnowflakeConfig, TableConfig
 from hilo_eda.orchestrator import run_hilo_eda
+from hilo_eda.pool import get_pool
 
 app = typer.Typer(add_completion=False)
 
@@ -55,7 +56,9 @@ def run(
             "snowflake": config,
             "table": table_config,
             "output": output_config,
-            "run": lambda: run_hilo_eda(config, table_config, output_config),
+            "run": lambda: run_hilo_eda(
+                config, table_config, output_config, pool=get_pool(config)
+            ),
         }
     )
 
@@ -7,6 +7,7 @@ from langchain_core.runnables import RunnableLambda
 
 from hilo_eda.config import OutputConfig, SnowflakeConfig, TableConfig
 from hilo_eda.orchestrator import run_hilo_eda
+from hilo_eda.pool import get_pool
 
 app = typer.Typer(add_completion=False)
 
@@ -46,6 +47,7 @@ def run(
             "snowflake": config,
             "table": table_config,
             "output": output_config,
+            "pool": get_pool(config),
         }
     )
 
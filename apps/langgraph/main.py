@@ -8,6 +8,7 @@ from langgraph.graph import StateGraph
 
 from hilo_eda.config import OutputConfig, SnowflakeConfig, TableConfig
 from hilo_eda.orchestrator import run_hilo_eda
+from hilo_eda.pool import ConnectionPool, get_pool
 
 app = typer.Typer(add_completion=False)
 
@@ -16,6 +17,7 @@ class EDAState(TypedDict):
     snowflake: SnowflakeConfig
     table: TableConfig
     output: OutputConfig
+    pool: ConnectionPool
 
 
 def build_graph() -> StateGraph:
@@ -52,7 +54,14 @@ def run(
     output_config = OutputConfig(output_dir=output_dir, write_csv=write_csv)
 
     graph = build_graph().compile()
-    graph.invoke({"snowflake": config, "table": table_config, "output": output_config})
+    graph.invoke(
+        {
+            "snowflake": config,
+            "table": table_config,
+            "output": output_config,
+            "pool": get_pool(config),
+        }
+    )
 
 
 if __name__ == "__main__":
@@ -1,6 +1,21 @@
 """Shared core for HILO EDA."""
 
-from hilo_eda.config import OutputConfig, SnowflakeConfig, TableConfig
-from hilo_eda.orchestrator import run_hilo_eda
+from hilo_eda.config import (
+    OutputConfig,
+    ProfilingConfig,
+    SnowflakeConfig,
+    TableConfig,
+)
+from hilo_eda.orchestrator import run_hilo_eda, run_schema_eda
+from hilo_eda.pool import ConnectionPool, get_pool
 
-__all__ = ["OutputConfig", "SnowflakeConfig", "TableConfig", "run_hilo_eda"]
+__all__ = [
+    "ConnectionPool",
+    "OutputConfig",
+    "ProfilingConfig",
+    "SnowflakeConfig",
+    "TableConfig",
+    "get_pool",
+    "run_hilo_eda",
+    "run_schema_eda",
+]
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+from hilo_eda.columnar import ColumnarTableProfile
+from hilo_eda.models import EDAQueryResult, TableProfile
+from hilo_eda.report import write_profile_csv
+from hilo_eda.results import QueryResult
+
+ARTIFACT_FORMATS = {"arrow": ".arrow", "parquet": ".parquet"}
+PROFILE_ARTIFACT = "column_profiles"
+QUERY_DIR = "queries"
+BATCH_ROWS = 64_000
+
+
+def _slug(title: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", title.lower()).strip("_")[:60] or "query"
+
+
+def write_artifact(stem: Path, table: pa.Table, artifact_format: str = "arrow") -> Path:
+    if artifact_format not in ARTIFACT_FORMATS:
+        raise ValueError(f"Unknown artifact format: {artifact_format}")
+    path = stem.with_suffix(ARTIFACT_FORMATS[artifact_format])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Written one record batch at a time; Arrow IPC files can then be
+    # memory-mapped by readers without copying.
+    if artifact_format == "arrow":
+        with (
+            pa.OSFile(str(path), "wb") as sink,
+            pa.ipc.new_file(sink, table.schema) as writer,
+        ):
+            for batch in table.to_batches(max_chunksize=BATCH_ROWS):
+                writer.write_batch(batch)
+    else:
+        with pq.ParquetWriter(str(path), table.schema) as writer:
+            for batch in table.to_batches(max_chunksize=BATCH_ROWS):
+                writer.write_batch(batch)
+    return path
+
+
+def read_artifact(path: Path) -> pa.Table:
+    if path.suffix == ".parquet":
+        return pq.read_table(str(path), memory_map=True)
+    # The returned table's buffers point into the mapping; no copy is made.
+    return pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+
+
+def _iter_batches(path: Path) -> Iterator[pa.RecordBatch]:
+    if path.suffix == ".parquet":
+        yield from pq.ParquetFile(str(path)).iter_batches(batch_size=BATCH_ROWS)
+        return
+    reader = pa.ipc.open_file(pa.memory_map(str(path), "r"))
+    for index in range(reader.num_record_batches):
+        yield reader.get_batch(index)
+
+
+def write_artifacts(
+    output_dir: Path,
+    table_profile: TableProfile,
+    sample_rows: QueryResult,
+    executed_queries: list[EDAQueryResult],
+    artifact_format: str = "arrow",
+) -> list[Path]:
+    # Query artifacts are numbered by position, so a previous run's files
+    # would otherwise sit beside this run's under the same names.
+    query_dir = output_dir / QUERY_DIR
+    if query_dir.is_dir():
+        for stale in query_dir.iterdir():
+            stale.unlink()
+    columnar = ColumnarTableProfile.from_profile(table_profile)
+    paths = [
+        write_artifact(
+            output_dir / PROFILE_ARTIFACT, columnar.to_arrow(), artifact_format
+        ),
+        write_artifact(output_dir / "sample_rows", sample_rows.table, artifact_format),
+    ]
+    for index, result in enumerate(executed_queries):
+        stem = output_dir / QUERY_DIR / f"{index:02d}_{_slug(result.title)}"
+        paths.append(write_artifact(stem, result.rows.table, artifact_format))
+    return paths
+
+
+def artifact_paths(output_dir: Path, artifact_format: str = "arrow") -> list[Path]:
+    if artifact_format not in ARTIFACT_FORMATS:
+        raise ValueError(f"Unknown artifact format: {artifact_format}")
+    pattern = f"*{ARTIFACT_FORMATS[artifact_format]}"
+    return sorted(output_dir.glob(pattern)) + sorted(
+        (output_dir / QUERY_DIR).glob(pattern)
+    )
+
+
+def export_csv(paths: Iterable[Path]) -> list[Path]:
+    # CSV is derived from the typed artifacts on demand, never the reverse.
+    exported: list[Path] = []
+    for path in paths:
+        csv_path = path.with_suffix(".csv")
+        if path.stem == PROFILE_ARTIFACT:
+            columnar = ColumnarTableProfile.from_arrow(read_artifact(path))
+            write_profile_csv(csv_path, columnar.to_profile())
+        else:
+            batches = _iter_batches(path)
+            first = next(batches, None)
+            if first is None:
+                continue
+            with pa_csv.CSVWriter(str(csv_path), first.schema) as writer:
+                writer.write_batch(first)
+                for batch in batches:
+                    writer.write_batch(batch)
+        exported.append(csv_path)
+    return exported
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from hilo_eda.columnar import ColumnarTableProfile
+from hilo_eda.config import ProfilingConfig
+from hilo_eda.models import ColumnInfo, TableMetadata, TableProfile
+from hilo_eda.results import QueryResult
+
+# Only options that change the profile's content belong in the cache key.
+PROFILE_KEY_OPTIONS = (
+    "mode",
+    "approx_row_threshold",
+    "sample_limit",
+    "top_k",
+    "watermark_column",
+    "target_sample_rows",
+    "sample_method",
+    "scan_budget_bytes",
+)
+CACHE_SUFFIX = ".profile"
+# Bumped whenever the stored layout changes, so old entries simply miss.
+PROFILE_CACHE_FORMAT = 2
+SQL_TOKEN = re.compile(r"""('(?:[^']|'')*'|"(?:[^"]|"")*")|(\s+)|([^'"\s]+)""")
+
+
+def profile_cache_key(
+    table_fqn: str,
+    columns: list[ColumnInfo],
+    metadata: TableMetadata,
+    profiling: ProfilingConfig,
+) -> str:
+    payload = {
+        "format": PROFILE_CACHE_FORMAT,
+        "table": table_fqn,
+        "columns": [
+            [column.name, column.data_type, column.is_nullable] for column in columns
+        ],
+        "last_altered": str(metadata.last_altered),
+        "bytes": metadata.bytes,
+        "options": {name: getattr(profiling, name) for name in PROFILE_KEY_OPTIONS},
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+@dataclass
+class ProfileCache:
+    directory: Path
+    max_bytes: int
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{CACHE_SUFFIX}"
+
+    def get(self, key: str) -> tuple[TableProfile, QueryResult] | None:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        # Touching the entry on read keeps mtime order equal to LRU order.
+        os.utime(path)
+        columnar, sample_rows = pickle.loads(data)
+        return columnar.to_profile(), sample_rows
+
+    def put(
+        self, key: str, table_profile: TableProfile, sample_rows: QueryResult
+    ) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        # Profiles are stored columnar: one Arrow table per entry pickles far
+        # smaller and faster than thousands of ColumnProfile objects.
+        columnar = ColumnarTableProfile.from_profile(table_profile)
+        tmp_path.write_bytes(pickle.dumps((columnar, sample_rows)))
+        tmp_path.replace(path)
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for entry in self.directory.glob(f"*{CACHE_SUFFIX}"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:  # evicted by a concurrent writer
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+
+
+def sql_fingerprint(sql: str) -> str:
+    # Whitespace and case outside quoted literals and identifiers carry no
+    # meaning in Snowflake SQL, so they are normalized away before hashing.
+    parts: list[str] = []
+    for quoted, space, bare in SQL_TOKEN.findall(sql.strip()):
+        if quoted:
+            parts.append(quoted)
+        elif space:
+            parts.append(" ")
+        else:
+            parts.append(bare.upper())
+    return hashlib.sha256("".join(parts).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class QueryResultCache:
+    max_bytes: int
+    hits: int = 0
+    misses: int = 0
+    _entries: OrderedDict[str, QueryResult] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _versions: dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    _bytes: int = field(default=0, init=False, repr=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def set_table_version(self, table_fqn: str, version: Any) -> None:
+        with self._lock:
+            self._versions[table_fqn] = str(version)
+
+    def key_for(self, sql: str) -> str | None:
+        # Only queries over tables with a known version are cacheable; that
+        # keeps metadata lookups and unversioned tables always live.
+        with self._lock:
+            versions = sorted(
+                f"{table_fqn}@{version}"
+                for table_fqn, version in self._versions.items()
+                if table_fqn in sql
+            )
+        if not versions:
+            return None
+        return f"{sql_fingerprint(sql)}|{'|'.join(versions)}"
+
+    def get(self, key: str) -> QueryResult | None:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: str, result: QueryResult) -> None:
+        size = result.nbytes
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            self._entries[key] = result
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import hashlib
+import pickle
+import re
+import secrets
+import shutil
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TypeVar
+
+from hilo_eda.models import EDAQuery
+from hilo_eda.results import QueryResult
+
+RUNS_DIR = "runs"
+STAGE_SUFFIX = ".stage"
+QUERY_SUFFIX = ".query"
+RUN_ID = re.compile(r"[\w-]+")
+
+T = TypeVar("T")
+
+
+def _write_atomic(path: Path, value: Any) -> None:
+    # A run interrupted mid-write must leave the previous file or none.
+    tmp_path = path.with_name(f"{path.name}.{secrets.token_hex(4)}.tmp")
+    tmp_path.write_bytes(pickle.dumps(value))
+    tmp_path.replace(path)
+
+
+@dataclass
+class RunCheckpoint:
+    directory: Path
+    run_id: str
+
+    @classmethod
+    def start(cls, output_dir: Path, run_id: str | None = None) -> RunCheckpoint:
+        runs_dir = output_dir / RUNS_DIR
+        if run_id is None:
+            run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{secrets.token_hex(3)}"
+        elif not RUN_ID.fullmatch(run_id) or not (runs_dir / run_id).is_dir():
+            raise ValueError(f"No run {run_id!r} to resume under {runs_dir}.")
+        checkpoint = cls(runs_dir / run_id, run_id)
+        checkpoint.directory.mkdir(parents=True, exist_ok=True)
+        return checkpoint
+
+    def child(self, name: str) -> RunCheckpoint:
+        child = RunCheckpoint(self.directory / name, self.run_id)
+        child.directory.mkdir(parents=True, exist_ok=True)
+        return child
+
+    def finish(self) -> None:
+        # Stages hold sampled rows; nothing is kept once the report exists.
+        shutil.rmtree(self.directory)
+        runs_dir = self.directory.parent
+        if runs_dir.name == RUNS_DIR and not any(runs_dir.iterdir()):
+            runs_dir.rmdir()
+
+    def _stage_path(self, stage: str) -> Path:
+        return self.directory / f"{stage}{STAGE_SUFFIX}"
+
+    def load(self, stage: str) -> Any | None:
+        try:
+            return pickle.loads(self._stage_path(stage).read_bytes())
+        except FileNotFoundError:
+            return None
+
+    def save(self, stage: str, value: Any) -> None:
+        _write_atomic(self._stage_path(stage), value)
+
+    def run_stage(self, stage: str, func: Callable[..., T], *args: Any) -> T:
+        saved = self.load(stage)
+        if saved is not None:
+            return saved
+        value = func(*args)
+        self.save(stage, value)
+        return value
+
+    def _query_path(self, sql: str) -> Path:
+        digest = hashlib.sha256(sql.encode("utf-8")).hexdigest()
+        return self.directory / "queries" / f"{digest}{QUERY_SUFFIX}"
+
+    def track_query(self, query: EDAQuery, future: Future[QueryResult]) -> None:
+        # Saved from the worker as each query finishes, so an interrupt while
+        # waiting on one query keeps every query that already came back.
+        def save(done: Future[QueryResult]) -> None:
+            if done.cancelled() or done.exception() is not None:
+                return
+            path = self._query_path(query.sql)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _write_atomic(path, (query, done.result()))
+
+        future.add_done_callback(save)
+
+    def completed_queries(self) -> dict[EDAQuery, QueryResult]:
+        completed: dict[EDAQuery, QueryResult] = {}
+        for path in (self.directory / "queries").glob(f"*{QUERY_SUFFIX}"):
+            query, rows = pickle.loads(path.read_bytes())
+            completed[query] = rows
+        return completed
@@ -1,41 +1,313 @@
 from __future__ import annotations
 
+import functools
+import inspect
 import os
+from collections.abc import Callable
+from dataclasses import replace
 from pathlib import Path
+from typing import Any
 
 import typer
 
-from hilo_eda.config import OutputConfig, SnowflakeConfig, TableConfig
-from hilo_eda.orchestrator import run_hilo_eda
+from hilo_eda.artifacts import artifact_paths, export_csv
+from hilo_eda.config import (
+    OutputConfig,
+    ProfilingConfig,
+    SnowflakeConfig,
+    TableConfig,
+)
+from hilo_eda.orchestrator import run_hilo_eda, run_schema_eda
 
 app = typer.Typer(add_completion=False)
 
+# Options shared by `run` and `run-schema`, declared once so the two commands
+# cannot drift apart: name -> (annotation, option).
+_RUN_OPTIONS: dict[str, tuple[Any, Any]] = {
+    "database": (str, typer.Option(..., help="Database name")),
+    "schema": (str, typer.Option(..., help="Schema name")),
+    "output_dir": (Path, typer.Option(Path("outputs"), help="Output directory")),
+    "write_csv": (bool, typer.Option(True, help="Write CSV outputs")),
+    "resume": (
+        str | None,
+        typer.Option(
+            None, help="Run id to resume; finished stages and queries are reused"
+        ),
+    ),
+    "artifact_format": (
+        str,
+        typer.Option(
+            "arrow", help="Format of typed result artifacts: arrow or parquet"
+        ),
+    ),
+    "report_format": (
+        list[str],
+        typer.Option(
+            ["markdown", "html", "json"],
+            help="Report to write: markdown, html or json (repeatable)",
+        ),
+    ),
+    "approx": (
+        bool | None,
+        typer.Option(
+            None,
+            "--approx/--exact",
+            help="Force approximate or exact profiling (default: pick by row count)",
+        ),
+    ),
+    "approx_row_threshold": (
+        int,
+        typer.Option(
+            10_000_000, help="Row count at which auto mode switches to approximate"
+        ),
+    ),
+    "sampled": (
+        bool,
+        typer.Option(
+            False, help="Profile a TABLESAMPLE and refine kept columns afterwards"
+        ),
+    ),
+    "target_sample_rows": (
+        int,
+        typer.Option(1_000_000, help="Rows to sample per table in sampled mode"),
+    ),
+    "sample_method": (
+        str,
+        typer.Option(
+            "bernoulli", help="TABLESAMPLE method in sampled mode: bernoulli or system"
+        ),
+    ),
+    "metadata_first": (
+        bool,
+        typer.Option(
+            False, help="Profile from table metadata first; scan kept columns later"
+        ),
+    ),
+    "scan_budget_gb": (
+        float | None,
+        typer.Option(None, help="Cap estimated bytes scanned per run, in GB"),
+    ),
+    "cache_dir": (
+        Path | None,
+        typer.Option(
+            None, help="Reuse profiles of unchanged tables from this directory"
+        ),
+    ),
+    "cache_max_mb": (int, typer.Option(512, help="Profile cache size limit in MB")),
+    "incremental_dir": (
+        Path | None,
+        typer.Option(
+            None, help="Store mergeable profile state here and profile only new rows"
+        ),
+    ),
+    "account": (str, typer.Option(..., envvar="SNOWFLAKE_ACCOUNT")),
+    "user": (str, typer.Option(..., envvar="SNOWFLAKE_USER")),
+    "password": (str, typer.Option(..., envvar="SNOWFLAKE_PASSWORD")),
+    "warehouse": (str, typer.Option(..., envvar="SNOWFLAKE_WAREHOUSE")),
+    "role": (str | None, typer.Option(None, envvar="SNOWFLAKE_ROLE")),
+    "max_concurrency": (int, typer.Option(8, help="Maximum queries in flight")),
+    "adaptive_concurrency": (
+        bool,
+        typer.Option(
+            True,
+            "--adaptive-concurrency/--fixed-concurrency",
+            help="Tune queries in flight to warehouse queuing and latency",
+        ),
+    ),
+    "result_cache_mb": (
+        int,
+        typer.Option(
+            0, help="In-memory cache for repeated SELECT results, in MB (0 disables)"
+        ),
+    ),
+    "query_timeout": (
+        int | None,
+        typer.Option(
+            None, help="Cancel any single query running longer than this, in seconds"
+        ),
+    ),
+    "run_timeout": (
+        int | None,
+        typer.Option(
+            None,
+            help="Cancel outstanding queries once the run takes this long, in seconds",
+        ),
+    ),
+    "max_retries": (
+        int,
+        typer.Option(
+            3, help="Retries for queries failing with network or session errors"
+        ),
+    ),
+}
+# Keyword arguments a command decorated with _with_run_options receives.
+_RUN_CONFIGS = ("snowflake", "output", "profiling", "resume")
+
+
+def _profiling_config(
+    approx: bool | None,
+    approx_row_threshold: int,
+    cache_dir: Path | None,
+    cache_max_mb: int,
+    incremental_dir: Path | None,
+    watermark_column: str | None = None,
+    sampled: bool = False,
+    target_sample_rows: int = 1_000_000,
+    sample_method: str = "bernoulli",
+    metadata_first: bool = False,
+    scan_budget_gb: float | None = None,
+) -> ProfilingConfig:
+    mode = {None: "auto", True: "approx", False: "exact"}[approx]
+    if sampled:
+        mode = "sampled"
+    if metadata_first:
+        mode = "metadata"
+    return ProfilingConfig(
+        mode=mode,
+        approx_row_threshold=approx_row_threshold,
+        cache_dir=cache_dir,
+        cache_max_bytes=cache_max_mb * 1024 * 1024,
+        incremental_dir=incremental_dir,
+        watermark_column=watermark_column,
+        target_sample_rows=target_sample_rows,
+        sample_method=sample_method.upper(),
+        scan_budget_bytes=(
+            round(scan_budget_gb * 1024**3) if scan_budget_gb is not None else None
+        ),
+    )
+
+
+def _run_configs(
+    options: dict[str, Any],
+) -> tuple[SnowflakeConfig, OutputConfig, ProfilingConfig]:
+    snowflake = SnowflakeConfig(
+        account=options["account"],
+        user=options["user"],
+        password=options["password"],
+        warehouse=options["warehouse"],
+        database=options["database"],
+        schema=options["schema"],
+        role=options["role"],
+        max_concurrency=options["max_concurrency"],
+        adaptive_concurrency=options["adaptive_concurrency"],
+        result_cache_bytes=options["result_cache_mb"] * 1024 * 1024,
+        query_timeout_seconds=options["query_timeout"],
+        run_timeout_seconds=options["run_timeout"],
+        max_retries=options["max_retries"],
+    )
+    output = OutputConfig(
+        output_dir=options["output_dir"],
+        write_csv=options["write_csv"],
+        artifact_format=options["artifact_format"],
+        report_formats=tuple(options["report_format"]),
+    )
+    profiling = _profiling_config(
+        options["approx"],
+        options["approx_row_threshold"],
+        options["cache_dir"],
+        options["cache_max_mb"],
+        options["incremental_dir"],
+        sampled=options["sampled"],
+        target_sample_rows=options["target_sample_rows"],
+        sample_method=options["sample_method"],
+        metadata_first=options["metadata_first"],
+        scan_budget_gb=options["scan_budget_gb"],
+    )
+    return snowflake, output, profiling
+
+
+def _with_run_options(command: Callable[..., None]) -> Callable[..., None]:
+    # Typer reads options from the signature, so the shared ones are appended
+    # to the command's own and turned into config objects before it is called.
+    own = [
+        parameter
+        for name, parameter in inspect.signature(
+            command, eval_str=True
+        ).parameters.items()
+        if name not in _RUN_CONFIGS
+    ]
+    shared = [
+        inspect.Parameter(
+            name, inspect.Parameter.KEYWORD_ONLY, default=option, annotation=annotation
+        )
+        for name, (annotation, option) in _RUN_OPTIONS.items()
+    ]
+
+    @functools.wraps(command)
+    def wrapper(**kwargs: Any) -> None:
+        options = {name: kwargs.pop(name) for name in _RUN_OPTIONS}
+        snowflake, output, profiling = _run_configs(options)
+        command(
+            **kwargs,
+            snowflake=snowflake,
+            output=output,
+            profiling=profiling,
+            resume=options["resume"],
+        )
+
+    wrapper.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+        own + shared, return_annotation=None
+    )
+    wrapper.__annotations__ = {
+        parameter.name: parameter.annotation for parameter in own + shared
+    }
+    return wrapper
+
 
 @app.command()
+@_with_run_options
 def run(
     table: str = typer.Option(..., help="Table name"),
-    database: str = typer.Option(..., help="Database name"),
-    schema: str = typer.Option(..., help="Schema name"),
-    output_dir: Path = typer.Option(Path("outputs"), help="Output directory"),
-    write_csv: bool = typer.Option(True, help="Write CSV outputs"),
-    account: str = typer.Option(..., envvar="SNOWFLAKE_ACCOUNT"),
-    user: str = typer.Option(..., envvar="SNOWFLAKE_USER"),
-    password: str = typer.Option(..., envvar="SNOWFLAKE_PASSWORD"),
-    warehouse: str = typer.Option(..., envvar="SNOWFLAKE_WAREHOUSE"),
-    role: str | None = typer.Option(None, envvar="SNOWFLAKE_ROLE"),
+    watermark_column: str | None = typer.Option(
+        None, help="Column that orders appended rows (default: last time column)"
+    ),
+    *,
+    snowflake: SnowflakeConfig,
+    output: OutputConfig,
+    profiling: ProfilingConfig,
+    resume: str | None,
+) -> None:
+    table_config = TableConfig(
+        database=snowflake.database, schema=snowflake.schema, table=table
+    )
+    profiling = replace(profiling, watermark_column=watermark_column)
+    run_hilo_eda(snowflake, table_config, output, profiling, resume=resume)
+
+
+@app.command("run-schema")
+@_with_run_options
+def run_schema(
+    pattern: str = typer.Option("*", help="Glob pattern for table names"),
+    workers: int = typer.Option(4, help="Tables profiled in parallel"),
+    *,
+    snowflake: SnowflakeConfig,
+    output: OutputConfig,
+    profiling: ProfilingConfig,
+    resume: str | None,
 ) -> None:
-    config = SnowflakeConfig(
-        account=account,
-        user=user,
-        password=password,
-        warehouse=warehouse,
-        database=database,
-        schema=schema,
-        role=role,
+    run_schema_eda(
+        snowflake,
+        snowflake.database,
+        snowflake.schema,
+        output,
+        profiling,
+        pattern=pattern,
+        workers=workers,
+        resume=resume,
     )
-    table_config = TableConfig(database=database, schema=schema, table=table)
-    output_config = OutputConfig(output_dir=output_dir, write_csv=write_csv)
-    run_hilo_eda(config, table_config, output_config)
+
+
+@app.command("export-csv")
+def export_csv_command(
+    output_dir: Path = typer.Argument(
+        ..., help="Output directory of a previously profiled table"
+    ),
+    artifact_format: str = typer.Option(
+        "arrow", help="Format the run wrote its artifacts in: arrow or parquet"
+    ),
+) -> None:
+    for path in export_csv(artifact_paths(output_dir, artifact_format)):
+        typer.echo(f"Wrote {path}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from hilo_eda.models import ColumnProfile, Distribution, TableProfile
+
+# Profile values are heterogeneous (numbers, dates, text), so each is stored
+# as text next to a dictionary-encoded kind that restores its Python type.
+VALUE_FIELDS = [("kind", pa.dictionary(pa.int8(), pa.string())), ("text", pa.string())]
+VALUE_TYPE = pa.struct(VALUE_FIELDS)
+INTERVAL_TYPE = pa.list_(pa.int64(), 2)
+
+PROFILE_SCHEMA = pa.schema(
+    [
+        ("name", pa.string()),
+        ("data_type", pa.dictionary(pa.int32(), pa.string())),
+        ("total_count", pa.int64()),
+        ("null_count", pa.int64()),
+        ("distinct_count", pa.int64()),
+        ("min_value", VALUE_TYPE),
+        ("max_value", VALUE_TYPE),
+        (
+            "top_values",
+            pa.list_(pa.struct([*VALUE_FIELDS, ("count", pa.int64())])),
+        ),
+        ("median_value", VALUE_TYPE),
+        ("precision", pa.dictionary(pa.int8(), pa.string())),
+        ("distinct_error", pa.float64()),
+        ("null_count_ci", INTERVAL_TYPE),
+        ("distinct_count_ci", INTERVAL_TYPE),
+        ("sample_fraction", pa.float64()),
+        (
+            "distribution",
+            pa.struct(
+                [
+                    (
+                        "quantiles",
+                        pa.list_(
+                            pa.struct([("quantile", pa.float64()), *VALUE_FIELDS])
+                        ),
+                    ),
+                    ("low", VALUE_TYPE),
+                    ("high", VALUE_TYPE),
+                    ("counts", pa.list_(pa.int64())),
+                ]
+            ),
+        ),
+    ]
+)
+
+
+def _encode(value: Any) -> dict[str, str] | None:
+    if value is None:
+        return None
+    # bool before int and datetime before date: each is a subclass of the next.
+    if isinstance(value, bool):
+        return {"kind": "bool", "text": str(value)}
+    if isinstance(value, int):
+        return {"kind": "int", "text": str(value)}
+    if isinstance(value, float):
+        return {"kind": "float", "text": repr(value)}
+    if isinstance(value, Decimal):
+        return {"kind": "decimal", "text": str(value)}
+    if isinstance(value, datetime):
+        return {"kind": "datetime", "text": value.isoformat()}
+    if isinstance(value, date):
+        return {"kind": "date", "text": value.isoformat()}
+    if isinstance(value, time):
+        return {"kind": "time", "text": value.isoformat()}
+    return {"kind": "str", "text": str(value)}
+
+
+def _decode(encoded: dict[str, Any] | None) -> Any:
+    if encoded is None or encoded["kind"] is None:
+        return None
+    kind, text = encoded["kind"], encoded["text"]
+    if kind == "bool":
+        return text == "True"
+    if kind == "int":
+        return int(text)
+    if kind == "float":
+        return float(text)
+    if kind == "decimal":
+        return Decimal(text)
+    if kind == "datetime":
+        return datetime.fromisoformat(text)
+    if kind == "date":
+        return date.fromisoformat(text)
+    if kind == "time":
+        return time.fromisoformat(text)
+    return text
+
+
+def _interval(values: list[int] | None) -> tuple[int, int] | None:
+    return None if values is None else (values[0], values[1])
+
+
+def _row(profile: ColumnProfile) -> dict[str, Any]:
+    distribution = profile.distribution
+    return {
+        "name": profile.name,
+        "data_type": profile.data_type,
+        "total_count": profile.total_count,
+        "null_count": profile.null_count,
+        "distinct_count": profile.distinct_count,
+        "min_value": _encode(profile.min_value),
+        "max_value": _encode(profile.max_value),
+        "top_values": [
+            (
+                {**_encode(value), "count": count}
+                if value is not None
+                else {"kind": None, "text": None, "count": count}
+            )
+            for value, count in profile.top_values
+        ],
+        "median_value": _encode(profile.median_value),
+        "precision": profile.precision,
+        "distinct_error": profile.distinct_error,
+        "null_count_ci": profile.null_count_ci,
+        "distinct_count_ci": profile.distinct_count_ci,
+        "sample_fraction": profile.sample_fraction,
+        "distribution": (
+            None
+            if distribution is None
+            else {
+                "quantiles": [
+                    {"quantile": quantile, **(_encode(value) or {})}
+                    for quantile, value in distribution.quantiles
+                ],
+                "low": _encode(distribution.low),
+                "high": _encode(distribution.high),
+                "counts": distribution.counts,
+            }
+        ),
+    }
+
+
+def _view(row: dict[str, Any]) -> ColumnProfile:
+    distribution = row["distribution"]
+    return ColumnProfile(
+        name=row["name"],
+        data_type=row["data_type"],
+        total_count=row["total_count"],
+        null_count=row["null_count"],
+        distinct_count=row["distinct_count"],
+        min_value=_decode(row["min_value"]),
+        max_value=_decode(row["max_value"]),
+        top_values=[(_decode(item), item["count"]) for item in row["top_values"]],
+        median_value=_decode(row["median_value"]),
+        precision=row["precision"],
+        distinct_error=row["distinct_error"],
+        null_count_ci=_interval(row["null_count_ci"]),
+        distinct_count_ci=_interval(row["distinct_count_ci"]),
+        sample_fraction=row["sample_fraction"],
+        distribution=(
+            None
+            if distribution is None
+            else Distribution(
+                quantiles=[
+                    (item["quantile"], _decode(item))
+                    for item in distribution["quantiles"]
+                ],
+                low=_decode(distribution["low"]),
+                high=_decode(distribution["high"]),
+                counts=distribution["counts"],
+            )
+        ),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnarTableProfile:
+    # One Arrow row per column profile; ColumnProfile objects are only built
+    # when a column is asked for.
+    table_fqn: str
+    row_count: int
+    table: pa.Table
+
+    @classmethod
+    def from_profile(cls, table_profile: TableProfile) -> ColumnarTableProfile:
+        table = pa.Table.from_pylist(
+            [_row(profile) for profile in table_profile.columns], PROFILE_SCHEMA
+        )
+        return cls(table_profile.table_fqn, table_profile.row_count, table)
+
+    @classmethod
+    def from_arrow(cls, table: pa.Table) -> ColumnarTableProfile:
+        metadata = table.schema.metadata or {}
+        return cls(
+            metadata.get(b"table_fqn", b"").decode("utf-8"),
+            int(metadata.get(b"row_count", b"0")),
+            table.replace_schema_metadata(None),
+        )
+
+    def to_arrow(self) -> pa.Table:
+        # Table-level fields travel as schema metadata so the file stands alone.
+        return self.table.replace_schema_metadata(
+            {"table_fqn": self.table_fqn, "row_count": str(self.row_count)}
+        )
+
+    def to_profile(self) -> TableProfile:
+        return TableProfile(self.table_fqn, self.row_count, list(self))
+
+    @property
+    def nbytes(self) -> int:
+        return self.table.nbytes
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    def __iter__(self) -> Iterator[ColumnProfile]:
+        for batch in self.table.to_batches():
+            for row in batch.to_pylist():
+                yield _view(row)
+
+    def column(self, name: str) -> ColumnProfile:
+        index = pc.index(self.table.column("name"), name).as_py()
+        if index < 0:
+            raise KeyError(name)
+        return _view(self.table.slice(index, 1).to_pylist()[0])
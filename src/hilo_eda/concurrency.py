@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import CancelledError
+from dataclasses import dataclass
+
+INITIAL_LIMIT = 4
+DECREASE_FACTOR = 0.5
+# Time spent in the warehouse queue beyond this is read as congestion.
+QUEUED_TOLERANCE_SECONDS = 0.5
+# Recent execution time this many times the long-run average is congestion too.
+LATENCY_TOLERANCE = 2.0
+SHORT_ALPHA = 0.3
+LONG_ALPHA = 0.05
+WARMUP_SAMPLES = 5
+
+
+@dataclass
+class AimdLimiter:
+    max_limit: int
+    min_limit: int = 1
+
+    def __post_init__(self) -> None:
+        if self.min_limit < 1 or self.max_limit < self.min_limit:
+            raise ValueError("Concurrency limits must satisfy 1 <= min <= max.")
+        self.limit = float(min(self.max_limit, max(self.min_limit, INITIAL_LIMIT)))
+        self.in_flight = 0
+        self.decreases = 0
+        self._samples = 0
+        self._short_latency = 0.0
+        self._long_latency = 0.0
+        self._last_decrease = time.monotonic()
+        self._condition = threading.Condition()
+
+    @property
+    def adaptive(self) -> bool:
+        return self.min_limit < self.max_limit
+
+    def acquire(self, cancelled: Callable[[], bool] | None = None) -> float:
+        # A waiter whose work was cancelled gives up instead of taking a slot.
+        with self._condition:
+            while True:
+                if cancelled is not None and cancelled():
+                    raise CancelledError("Cancelled while waiting for a slot.")
+                if self.in_flight < int(self.limit):
+                    break
+                self._condition.wait()
+            self.in_flight += 1
+        return time.monotonic()
+
+    def wake(self) -> None:
+        with self._condition:
+            self._condition.notify_all()
+
+    def release(
+        self, started: float, latency: float | None, queued_seconds: float = 0.0
+    ) -> None:
+        # latency is None for queries that failed; they say nothing about load.
+        with self._condition:
+            self.in_flight -= 1
+            if latency is not None:
+                self._adjust(started, latency, queued_seconds)
+            self._condition.notify_all()
+
+    def _adjust(self, started: float, latency: float, queued_seconds: float) -> None:
+        execution = max(latency - queued_seconds, 0.0)
+        if self._samples == 0:
+            self._short_latency = self._long_latency = execution
+        else:
+            self._short_latency += SHORT_ALPHA * (execution - self._short_latency)
+            self._long_latency += LONG_ALPHA * (execution - self._long_latency)
+        self._samples += 1
+
+        congested = queued_seconds > QUEUED_TOLERANCE_SECONDS or (
+            self._samples > WARMUP_SAMPLES
+            and self._short_latency > LATENCY_TOLERANCE * self._long_latency
+        )
+        if not congested:
+            # Additive increase: about one more slot per limit's worth of
+            # completed queries.
+            self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+        elif started > self._last_decrease:
+            # Queries sent before the last cut were admitted under the old
+            # limit, so their slowness is not a reason to cut again.
+            self.limit = max(float(self.min_limit), self.limit * DECREASE_FACTOR)
+            self.decreases += 1
+            self._last_decrease = time.monotonic()
+            # Start the next window from the baseline so one slow burst is
+            # not counted against the reduced limit as well.
+            self._short_latency = self._long_latency
@@ -13,6 +13,12 @@ class SnowflakeConfig:
     database: str
     schema: str
     role: str | None = None
+    max_concurrency: int = 8
+    result_cache_bytes: int = 0
+    query_timeout_seconds: int | None = None
+    run_timeout_seconds: int | None = None
+    max_retries: int = 3
+    adaptive_concurrency: bool = True
 
 
 @dataclass(frozen=True)
@@ -26,3 +32,20 @@ class TableConfig:
 class OutputConfig:
     output_dir: Path
     write_csv: bool = True
+    artifact_format: str = "arrow"
+    report_formats: tuple[str, ...] = ("markdown", "html", "json")
+
+
+@dataclass(frozen=True)
+class ProfilingConfig:
+    mode: str = "auto"
+    approx_row_threshold: int = 10_000_000
+    sample_limit: int = 50
+    top_k: int = 10
+    cache_dir: Path | None = None
+    cache_max_bytes: int = 512 * 1024 * 1024
+    incremental_dir: Path | None = None
+    watermark_column: str | None = None
+    target_sample_rows: int = 1_000_000
+    sample_method: str = "BERNOULLI"
+    scan_budget_bytes: int | None = None
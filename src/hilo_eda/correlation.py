@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from itertools import combinations
+
+import numpy as np
+import pyarrow as pa
+
+from hilo_eda.results import QueryResult
+from hilo_eda.sql_safety import quote_ident
+
+# 50 columns is 1,225 CORR aggregates, which still fits one statement.
+MAX_CORRELATION_COLUMNS = 50
+
+
+def correlation_alias(column_a: str, column_b: str) -> str:
+    return f"{column_a}__CORR__{column_b}"
+
+
+def correlation_aggregates(columns: list[str]) -> dict[str, str]:
+    # Every pair is an aggregate over the same scan, so the whole matrix costs
+    # one pass over the numeric columns however many pairs there are.
+    return {
+        correlation_alias(column_a, column_b): (
+            f"CORR({quote_ident(column_a)}, {quote_ident(column_b)})"
+        )
+        for column_a, column_b in combinations(columns, 2)
+    }
+
+
+def correlation_selects(columns: list[str]) -> list[str]:
+    return [
+        f"{expression} AS {quote_ident(alias)}"
+        for alias, expression in correlation_aggregates(columns).items()
+    ]
+
+
+def correlation_matrix(columns: list[str], results: list[QueryResult]) -> np.ndarray:
+    matrix = np.full((len(columns), len(columns)), np.nan)
+    np.fill_diagonal(matrix, 1.0)
+    for result in results:
+        names = set(result.column_names)
+        for i, j in combinations(range(len(columns)), 2):
+            alias = correlation_alias(columns[i], columns[j])
+            if alias not in names:
+                continue
+            value = result.value(alias)
+            if value is not None:
+                matrix[i, j] = matrix[j, i] = float(value)
+    return matrix
+
+
+def correlation_table(columns: list[str], matrix: np.ndarray) -> pa.Table:
+    return pa.table(
+        {"COLUMN": columns, **{name: matrix[:, i] for i, name in enumerate(columns)}}
+    )
+
+
+def top_pairs(
+    columns: list[str], matrix: np.ndarray, limit: int = 10
+) -> list[tuple[str, str, float]]:
+    rows, cols = np.triu_indices(len(columns), k=1)
+    values = matrix[rows, cols]
+    known = ~np.isnan(values)
+    rows, cols, values = rows[known], cols[known], values[known]
+    order = np.argsort(-np.abs(values), kind="stable")[:limit]
+    return [
+        (columns[rows[index]], columns[cols[index]], float(values[index]))
+        for index in order
+    ]
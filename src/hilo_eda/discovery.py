@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from fnmatch import fnmatchcase
+
 from hilo_eda.config import TableConfig
-from hilo_eda.models import ColumnInfo
-from hilo_eda.sql_safety import quote_ident
+from hilo_eda.models import ColumnInfo, TableMetadata
+from hilo_eda.sql_safety import quote_ident, quote_literal
 from hilo_eda.snowflake import SnowflakeClient
 
 
@@ -10,8 +12,8 @@ def fetch_columns(client: SnowflakeClient, table: TableConfig) -> list[ColumnInf
     sql = (
         "SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE "
         "FROM INFORMATION_SCHEMA.COLUMNS "
-        f"WHERE TABLE_SCHEMA = '{table.schema}' "
-        f"AND TABLE_NAME = '{table.table}' "
+        f"WHERE TABLE_SCHEMA = {quote_literal(table.schema)} "
+        f"AND TABLE_NAME = {quote_literal(table.table)} "
         "ORDER BY ORDINAL_POSITION"
     )
     rows = client.execute_query(sql)
@@ -25,15 +27,76 @@ def fetch_columns(client: SnowflakeClient, table: TableConfig) -> list[ColumnInf
     ]
 
 
-def table_exists(client: SnowflakeClient, table: TableConfig) -> bool:
+def fetch_table_metadata(
+    client: SnowflakeClient, table: TableConfig
+) -> TableMetadata | None:
     sql = (
-        "SELECT COUNT(*) AS COUNT "
+        "SELECT ROW_COUNT, BYTES, LAST_ALTERED "
         "FROM INFORMATION_SCHEMA.TABLES "
-        f"WHERE TABLE_SCHEMA = '{table.schema}' "
-        f"AND TABLE_NAME = '{table.table}'"
+        f"WHERE TABLE_SCHEMA = {quote_literal(table.schema)} "
+        f"AND TABLE_NAME = {quote_literal(table.table)}"
     )
     rows = client.execute_query(sql)
-    return rows[0]["COUNT"] > 0
+    if not rows:
+        return None
+    row = rows[0]
+    return TableMetadata(
+        row_count=int(row["ROW_COUNT"] or 0),
+        bytes=int(row["BYTES"] or 0),
+        last_altered=row["LAST_ALTERED"],
+    )
+
+
+def _glob_to_like(pattern: str) -> str | None:
+    # Character classes have no LIKE equivalent; those patterns are only
+    # applied client-side.
+    if "[" in pattern:
+        return None
+    escaped = "".join(f"!{char}" if char in "!%_" else char for char in pattern)
+    return escaped.replace("*", "%").replace("?", "_")
+
+
+def fetch_schema_tables(
+    client: SnowflakeClient, schema: str, pattern: str = "*"
+) -> dict[str, tuple[TableMetadata, list[ColumnInfo]]]:
+    # One round trip for every table's metadata and columns in the schema.
+    like = _glob_to_like(pattern)
+    name_filter = (
+        f"AND c.TABLE_NAME ILIKE {quote_literal(like)} ESCAPE '!' "
+        if like is not None
+        else ""
+    )
+    sql = (
+        "SELECT c.TABLE_NAME, c.COLUMN_NAME, c.DATA_TYPE, c.IS_NULLABLE, "
+        "t.ROW_COUNT, t.BYTES, t.LAST_ALTERED "
+        "FROM INFORMATION_SCHEMA.COLUMNS c "
+        "JOIN INFORMATION_SCHEMA.TABLES t "
+        "ON t.TABLE_SCHEMA = c.TABLE_SCHEMA AND t.TABLE_NAME = c.TABLE_NAME "
+        f"WHERE c.TABLE_SCHEMA = {quote_literal(schema)} "
+        "AND t.TABLE_TYPE = 'BASE TABLE' "
+        f"{name_filter}"
+        "ORDER BY c.TABLE_NAME, c.ORDINAL_POSITION"
+    )
+    tables: dict[str, tuple[TableMetadata, list[ColumnInfo]]] = {}
+    for row in client.execute_query(sql):
+        name = row["TABLE_NAME"]
+        if not fnmatchcase(name.upper(), pattern.upper()):
+            continue
+        if name not in tables:
+            metadata = TableMetadata(
+                row_count=int(row["ROW_COUNT"] or 0),
+                bytes=int(row["BYTES"] or 0),
+                last_altered=row["LAST_ALTERED"],
+            )
+            tables[name] = (metadata, [])
+        tables[name][1].append(
+            ColumnInfo(
+                name=row["COLUMN_NAME"],
+                data_type=row["DATA_TYPE"],
+                is_nullable=row["IS_NULLABLE"] == "YES",
+            )
+        )
+    return tables
 
 
 def column_in_table(columns: list[ColumnInfo], name: str) -> bool:
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from html import escape
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+from hilo_eda.models import (
+    EDAQueryResult,
+    HumanSelections,
+    InferenceResult,
+    TableProfile,
+)
+from hilo_eda.planner import ProfilePlan
+from hilo_eda.report import (
+    column_record,
+    inference_record,
+    plan_records,
+    query_record,
+)
+from hilo_eda.tracing import Tracer
+
+PAGE_SIZE = 200
+
+# Pages are plain scripts rather than JSON so the report also works when
+# opened from disk, where browsers refuse fetch() on file:// URLs.
+_SCRIPT = """
+const pages = {};
+function hiloPage(section, page, records) {
+  pages[section + ":" + page] = records;
+  render(section, page);
+}
+function cell(value) {
+  const td = document.createElement("td");
+  if (value !== null && typeof value === "object") {
+    const pre = document.createElement("pre");
+    pre.textContent = JSON.stringify(value);
+    td.appendChild(pre);
+  } else {
+    td.textContent = value === null ? "" : String(value);
+  }
+  return td;
+}
+function render(section, page) {
+  const node = document.getElementById(section);
+  const records = pages[section + ":" + page];
+  node.dataset.page = page;
+  node.querySelector(".status").textContent =
+    "Page " + (page + 1) + " of " + node.dataset.pages;
+  const table = node.querySelector("table");
+  table.replaceChildren();
+  if (!records.length) return;
+  const head = table.insertRow();
+  for (const key of Object.keys(records[0])) {
+    const th = document.createElement("th");
+    th.textContent = key;
+    head.appendChild(th);
+  }
+  for (const record of records) {
+    const row = table.insertRow();
+    for (const value of Object.values(record)) row.appendChild(cell(value));
+  }
+}
+function load(section, page) {
+  const node = document.getElementById(section);
+  if (page < 0 || page >= Number(node.dataset.pages)) return;
+  if (pages[section + ":" + page]) return render(section, page);
+  const script = document.createElement("script");
+  script.src = node.dataset.dir + "/" + section + "_" + page + ".js";
+  document.body.appendChild(script);
+}
+function step(section, delta) {
+  load(section, Number(document.getElementById(section).dataset.page) + delta);
+}
+for (const node of document.querySelectorAll("details[data-pages]")) {
+  node.addEventListener("toggle", () => {
+    if (node.open && node.dataset.page === undefined) load(node.id, 0);
+  });
+}
+"""
+
+_STYLE = """
+body { font-family: sans-serif; margin: 2em; }
+table { border-collapse: collapse; font-size: 0.9em; }
+td, th { border: 1px solid #ccc; padding: 2px 6px; vertical-align: top; }
+pre { margin: 0; white-space: pre-wrap; max-width: 60em; }
+"""
+
+
+def _write_pages(
+    page_dir: Path, section: str, records: Iterable[dict[str, Any]], page_size: int
+) -> int:
+    iterator = iter(records)
+    pages = 0
+    while page := list(islice(iterator, page_size)):
+        payload = json.dumps(page, default=str)
+        (page_dir / f"{section}_{pages}.js").write_text(
+            f"hiloPage({json.dumps(section)}, {pages}, {payload});\n", "utf-8"
+        )
+        pages += 1
+    return pages
+
+
+def _paged_section(section: str, title: str, pages: int, page_dir: str) -> str:
+    if pages == 0:
+        return f"<h2>{escape(title)}</h2>\n<p>None.</p>\n"
+    return (
+        f'<details id="{section}" data-pages="{pages}" '
+        f'data-dir="{escape(page_dir)}">\n'
+        f'<summary><h2 style="display:inline">{escape(title)}</h2></summary>\n'
+        f"<button onclick=\"step('{section}', -1)\">Previous</button>\n"
+        f"<button onclick=\"step('{section}', 1)\">Next</button>\n"
+        '<span class="status"></span>\n<table></table>\n</details>\n'
+    )
+
+
+def _list(items: Iterable[str]) -> str:
+    return "<ul>\n" + "".join(f"<li>{item}</li>\n" for item in items) + "</ul>\n"
+
+
+def write_html_report(
+    output_path: Path,
+    table_profile: TableProfile,
+    inferences: list[InferenceResult],
+    human: HumanSelections,
+    executed_queries: list[EDAQueryResult],
+    tracer: Tracer | None = None,
+    plan: ProfilePlan | None = None,
+    correlations: list[tuple[str, str, float]] | None = None,
+    page_size: int = PAGE_SIZE,
+) -> None:
+    # The page itself stays small whatever the column count: each large
+    # section is split into page files loaded only when the section is opened.
+    page_dir = output_path.with_name(f"{output_path.stem}_pages")
+    page_dir.mkdir(parents=True, exist_ok=True)
+    for stale in page_dir.glob("*.js"):
+        stale.unlink()
+    paged = [
+        ("columns", "Column Profiles", map(column_record, table_profile.columns)),
+        ("inferences", "Behavioral Inference", map(inference_record, inferences)),
+        ("queries", "SQL Executed", map(query_record, executed_queries)),
+    ]
+    if plan is not None:
+        paged.append(("plan", "Scan Plan", plan_records(plan)))
+    counts = {
+        section: _write_pages(page_dir, section, records, page_size)
+        for section, _, records in paged
+    }
+
+    with output_path.open("w", encoding="utf-8") as handle:
+        title = escape(table_profile.table_fqn)
+        handle.write(
+            f'<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+            f"<title>EDA Report: {title}</title>\n<style>{_STYLE}</style>\n"
+            f"</head>\n<body>\n<h1>EDA Report: {title}</h1>\n"
+            f"<p>{table_profile.row_count} rows, "
+            f"{len(table_profile.columns)} columns.</p>\n"
+        )
+        handle.write("<h2>Assumptions</h2>\n")
+        handle.write(
+            _list(
+                escape(f"{label}: {value}")
+                for label, value in (
+                    ("Identifier", human.identifier),
+                    ("Time column", human.time_column),
+                    ("Status column", human.status_column),
+                    ("Ignored columns", ", ".join(human.ignore_columns) or "None"),
+                    ("EDA direction", human.eda_direction),
+                )
+            )
+        )
+        for section, heading, _ in paged:
+            handle.write(
+                _paged_section(section, heading, counts[section], page_dir.name)
+            )
+        if correlations:
+            handle.write("<h2>Top Correlations</h2>\n")
+            handle.write(
+                _list(
+                    escape(f"{column_a} vs {column_b}: {value:+.3f}")
+                    for column_a, column_b, value in correlations
+                )
+            )
+        if plan is not None and plan.skipped_queries:
+            handle.write("<h2>Skipped Over Budget</h2>\n")
+            handle.write(_list(map(escape, plan.skipped_queries)))
+        if tracer is not None and tracer.queries:
+            handle.write("<h2>Query Trace</h2>\n<table>\n<tr>")
+            handle.write(
+                "<th>Stage</th><th>Queries</th><th>Wall s</th><th>Rows</th>"
+                "<th>Bytes fetched</th><th>Bytes scanned</th></tr>\n"
+            )
+            for summary in tracer.summary():
+                handle.write(
+                    f"<tr><td>{escape(summary.stage)}</td><td>{summary.queries}</td>"
+                    f"<td>{summary.wall_seconds:.2f}</td><td>{summary.rows}</td>"
+                    f"<td>{summary.bytes_fetched}</td>"
+                    f"<td>{summary.bytes_scanned}</td></tr>\n"
+                )
+            handle.write("</table>\n")
+        handle.write(f"<script>{_SCRIPT}</script>\n</body>\n</html>\n")
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import hashlib
+import pickle
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from hilo_eda.models import ColumnInfo
+from hilo_eda.sketches import HyperLogLog, TopKCounter
+
+STATE_SUFFIX = ".state"
+
+
+def _pick(current: Any, new: Any, choose: Any) -> Any:
+    if current is None:
+        return new
+    if new is None:
+        return current
+    return choose(current, new)
+
+
+@dataclass
+class ColumnState:
+    name: str
+    data_type: str
+    total_count: int
+    non_null_count: int
+    min_value: Any | None
+    max_value: Any | None
+    hll: HyperLogLog
+    top: TopKCounter
+
+    def merge(self, other: ColumnState) -> None:
+        self.total_count += other.total_count
+        self.non_null_count += other.non_null_count
+        self.min_value = _pick(self.min_value, other.min_value, min)
+        self.max_value = _pick(self.max_value, other.max_value, max)
+        self.hll.merge(other.hll)
+        self.top.merge(other.top)
+
+
+@dataclass
+class IncrementalState:
+    table_fqn: str
+    watermark_column: str | None
+    watermark: Any | None = None
+    columns: list[ColumnState] = field(default_factory=list)
+
+    def matches(self, columns: list[ColumnInfo]) -> bool:
+        return [(state.name, state.data_type) for state in self.columns] == [
+            (column.name, column.data_type) for column in columns
+        ]
+
+
+@dataclass
+class IncrementalStore:
+    directory: Path
+
+    def _path(self, table_fqn: str) -> Path:
+        digest = hashlib.sha256(table_fqn.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}{STATE_SUFFIX}"
+
+    def load(self, table_fqn: str) -> IncrementalState | None:
+        try:
+            return pickle.loads(self._path(table_fqn).read_bytes())
+        except FileNotFoundError:
+            return None
+
+    def save(self, state: IncrementalState) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(state.table_fqn)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(pickle.dumps(state))
+        tmp_path.replace(path)
+
+    def watermark_column(self, table_fqn: str) -> str | None:
+        state = self.load(table_fqn)
+        return state.watermark_column if state else None
+
+    def remember_watermark_column(self, table_fqn: str, column: str) -> None:
+        # The human's time column becomes the watermark for the next run; a
+        # different column invalidates any state accumulated over the old one.
+        state = self.load(table_fqn)
+        if state is None or state.watermark_column != column:
+            self.save(IncrementalState(table_fqn=table_fqn, watermark_column=column))
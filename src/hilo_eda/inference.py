@@ -1,53 +1,81 @@
 from __future__ import annotations
 
 from hilo_eda.models import ColumnProfile, InferenceResult
+from hilo_eda.type_families import (
+    BOOLEAN,
+    DATETIME,
+    NUMERIC,
+    SEMI_STRUCTURED,
+    TEXT,
+    type_family,
+)
+
+APPROX_CONFIDENCE_PENALTY = 0.1
+LOW_DISTINCT = 20
+SPARSE_NULL_PCT = 0.9
+HIGH_DISTINCT_RATIO = 0.9
+
+
+def _estimated(
+    profile: ColumnProfile, behavior_class: str, confidence: float, rationale: str
+) -> InferenceResult:
+    # Distinct-driven decisions are less certain when counts are estimates.
+    if profile.is_approximate:
+        return InferenceResult(
+            profile.name,
+            behavior_class,
+            round(confidence - APPROX_CONFIDENCE_PENALTY, 2),
+            f"{rationale} (estimated)",
+        )
+    return InferenceResult(profile.name, behavior_class, confidence, rationale)
 
 
 def infer_behavior(profile: ColumnProfile, row_count: int) -> InferenceResult:
     null_pct = profile.null_pct
-    distinct = profile.distinct_count
-    dtype = profile.data_type.upper()
+    # Metadata-tier profiles defer distinct counts; only type rules apply.
+    distinct = profile.distinct_count if profile.has_distinct else None
+    low = distinct is not None and distinct <= LOW_DISTINCT
+    family = type_family(profile.data_type)
 
-    if "VARIANT" in dtype or "OBJECT" in dtype:
+    if family == SEMI_STRUCTURED:
         return InferenceResult(profile.name, "semi-structured", 0.8, "VARIANT type")
 
     if row_count == 0:
         return InferenceResult(profile.name, "empty", 0.5, "Empty table")
 
     if distinct == 1:
-        return InferenceResult(profile.name, "constant", 0.9, "Single distinct")
+        return _estimated(profile, "constant", 0.9, "Single distinct")
 
-    if null_pct >= 0.9:
+    if null_pct >= SPARSE_NULL_PCT:
         return InferenceResult(profile.name, "sparse", 0.8, "High null rate")
 
-    if dtype in {"BOOLEAN"}:
+    if family == BOOLEAN:
         return InferenceResult(profile.name, "boolean-like", 0.9, "Boolean type")
 
-    if "TEXT" in dtype or "CHAR" in dtype or "STRING" in dtype:
-        if distinct <= 20:
-            return InferenceResult(
-                profile.name, "low-cardinality categorical", 0.7, "Low distinct"
+    if family == TEXT:
+        if low:
+            return _estimated(
+                profile, "low-cardinality categorical", 0.7, "Low distinct"
             )
         return InferenceResult(profile.name, "text", 0.6, "Text type")
 
-    if "DATE" in dtype or "TIMESTAMP" in dtype:
+    if family == DATETIME:
         return InferenceResult(profile.name, "datetime", 0.85, "Date/time type")
 
-    if "NUMBER" in dtype or "INT" in dtype or "FLOAT" in dtype:
-        if distinct <= 20:
-            return InferenceResult(
-                profile.name, "numeric discrete", 0.7, "Low distinct"
-            )
+    if family == NUMERIC:
+        if low:
+            return _estimated(profile, "numeric discrete", 0.7, "Low distinct")
         return InferenceResult(profile.name, "numeric continuous", 0.7, "Numeric type")
 
-    if distinct <= 20:
-        return InferenceResult(
-            profile.name, "low-cardinality categorical", 0.6, "Low distinct"
-        )
+    if distinct is None:
+        return InferenceResult(profile.name, "unknown", 0.4, "Distinct pending")
 
-    if distinct / max(row_count, 1) > 0.9:
-        return InferenceResult(
-            profile.name, "high-cardinality categorical", 0.6, "High distinct ratio"
+    if low:
+        return _estimated(profile, "low-cardinality categorical", 0.6, "Low distinct")
+
+    if distinct / max(row_count, 1) > HIGH_DISTINCT_RATIO:
+        return _estimated(
+            profile, "high-cardinality categorical", 0.6, "High distinct ratio"
         )
 
     return InferenceResult(profile.name, "unknown", 0.4, "Fallback")
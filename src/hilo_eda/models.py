@@ -3,15 +3,32 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any
 
+from hilo_eda.results import QueryResult
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ColumnInfo:
     name: str
     data_type: str
     is_nullable: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class TableMetadata:
+    row_count: int
+    bytes: int
+    last_altered: Any
+
+
+@dataclass(frozen=True, slots=True)
+class Distribution:
+    quantiles: list[tuple[float, Any]]
+    low: Any
+    high: Any
+    counts: list[int] = field(default_factory=list)
+
+
+@dataclass(frozen=True, slots=True)
 class ColumnProfile:
     name: str
     data_type: str
@@ -21,6 +38,13 @@ class ColumnProfile:
     min_value: Any | None
     max_value: Any | None
     top_values: list[tuple[Any, int]] = field(default_factory=list)
+    median_value: Any | None = None
+    precision: str = "exact"
+    distinct_error: float = 0.0
+    null_count_ci: tuple[int, int] | None = None
+    distinct_count_ci: tuple[int, int] | None = None
+    sample_fraction: float | None = None
+    distribution: Distribution | None = None
 
     @property
     def null_pct(self) -> float:
@@ -28,23 +52,32 @@ class ColumnProfile:
             return 0.0
         return self.null_count / self.total_count
 
+    @property
+    def is_approximate(self) -> bool:
+        return self.precision != "exact"
 
-@dataclass(frozen=True)
+    @property
+    def has_distinct(self) -> bool:
+        return self.precision != "metadata"
+
+
+@dataclass(frozen=True, slots=True)
 class TableProfile:
     table_fqn: str
     row_count: int
     columns: list[ColumnProfile]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InferenceResult:
     column: str
     behavior_class: str
     confidence: float
     rationale: str
+    pattern: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HumanSelections:
     identifier: str | None
     time_column: str | None
@@ -53,8 +86,19 @@ class HumanSelections:
     eda_direction: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class EDAQuery:
+    title: str
+    sql: str
+    table_fqn: str
+    # Column-named aliases of a fused aggregate in SELECT order; empty for
+    # queries that can only stand in for themselves.
+    aliases: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
 class EDAQueryResult:
     title: str
     sql: str
-    rows: list[dict[str, Any]]
+    rows: QueryResult
+    source: str = "query"
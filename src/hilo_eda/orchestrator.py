@@ -1,154 +1,880 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import replace
 from pathlib import Path
-from typing import Iterable
+from typing import Any
 
 import typer
 
-from hilo_eda.config import OutputConfig, SnowflakeConfig, TableConfig
-from hilo_eda.discovery import fetch_columns, table_exists
+from hilo_eda.artifacts import export_csv, write_artifact, write_artifacts
+from hilo_eda.cache import ProfileCache, profile_cache_key
+from hilo_eda.checkpoint import RunCheckpoint
+from hilo_eda.config import (
+    OutputConfig,
+    ProfilingConfig,
+    SnowflakeConfig,
+    TableConfig,
+)
+from hilo_eda.correlation import (
+    MAX_CORRELATION_COLUMNS,
+    correlation_aggregates,
+    correlation_matrix,
+    correlation_table,
+    top_pairs,
+)
+from hilo_eda.discovery import fetch_columns, fetch_schema_tables, fetch_table_metadata
+from hilo_eda.html_report import write_html_report
 from hilo_eda.human import collect_human_selections
+from hilo_eda.incremental import IncrementalStore
 from hilo_eda.inference import infer_all
-from hilo_eda.models import EDAQueryResult
-from hilo_eda.profiling import profile_table
-from hilo_eda.report import write_csv_outputs, write_markdown_report
+from hilo_eda.patterns import apply_patterns, detect_patterns
+from hilo_eda.models import (
+    ColumnInfo,
+    ColumnProfile,
+    EDAQuery,
+    EDAQueryResult,
+    InferenceResult,
+    TableMetadata,
+    TableProfile,
+)
+from hilo_eda.planner import (
+    ProfilePlan,
+    ScanBudget,
+    column_scan_bytes,
+    plan_columns,
+    plan_queries,
+)
+from hilo_eda.pool import ConnectionPool
+from hilo_eda.profiling import (
+    DEFERRED_PRECISIONS,
+    distribution_columns,
+    profile_distributions,
+    profile_table,
+    profile_table_incremental,
+    refine_profile,
+    resolve_mode,
+)
+from hilo_eda.report import write_index, write_json_report, write_markdown_report
+from hilo_eda.results import QueryResult
 from hilo_eda.sql_safety import qualify_table, quote_ident
 from hilo_eda.snowflake import SnowflakeClient
+from hilo_eda.tracing import Tracer, stage, tracing
 
 
 def _format_inference(inferences: Iterable[str]) -> str:
     return ", ".join(inferences) if inferences else "None"
 
 
-def _run_query(
-    client: SnowflakeClient, title: str, sql: str
-) -> EDAQueryResult:
-    rows = client.execute_query(sql)
-    return EDAQueryResult(title=title, sql=sql, rows=rows)
+# Values listed per categorical column in the EDA section of the report.
+EDA_TOP_VALUES = 10
+# Only these profiles are reported as EDA results in place of a query; the
+# other tiers hold estimates (sampled, scaled or approximate counts).
+EXACT_PRECISIONS = {"exact", "incremental"}
+
+REPORT_WRITERS: dict[str, tuple[str, Callable[..., None]]] = {
+    "markdown": ("eda_report.md", write_markdown_report),
+    "html": ("eda_report.html", write_html_report),
+    "json": ("eda_report.json", write_json_report),
+}
+
+
+def _match_prefetched(
+    query: EDAQuery, prefetched: dict[EDAQuery, Future[QueryResult]]
+) -> EDAQuery | None:
+    # Identical SQL is reused as is; a fused aggregate is also served by any
+    # prefetched fused query over the same table that selects a superset of
+    # its column-named aliases.
+    for candidate in prefetched:
+        if candidate.sql == query.sql:
+            return candidate
+    if not query.aliases:
+        return None
+    for candidate in prefetched:
+        same_table = candidate.table_fqn == query.table_fqn
+        if same_table and set(query.aliases) <= set(candidate.aliases):
+            return candidate
+    return None
+
+
+def _completed(rows: QueryResult) -> Future[QueryResult]:
+    future: Future[QueryResult] = Future()
+    future.set_result(rows)
+    return future
+
+
+def _run_queries(
+    client: SnowflakeClient,
+    queries: list[EDAQuery],
+    prefetched: dict[EDAQuery, Future[QueryResult]] | None = None,
+    checkpoint: RunCheckpoint | None = None,
+) -> list[EDAQueryResult]:
+    prefetched = prefetched or {}
+    # Each query's future and the statement that actually produces its rows.
+    pending: list[tuple[Future[QueryResult], EDAQuery]] = []
+    for query in queries:
+        match = _match_prefetched(query, prefetched)
+        if match is None:
+            future = client.submit(query.sql)
+            if checkpoint is not None:
+                checkpoint.track_query(query, future)
+            pending.append((future, query))
+        else:
+            pending.append((prefetched[match], match))
+    used = {source for _, source in pending}
+    for candidate, future in prefetched.items():
+        if candidate not in used:
+            # Also stops the statement if it is already on the warehouse.
+            client.cancel(future)
+
+    executed: list[EDAQueryResult] = []
+    for query, (future, source) in zip(queries, pending, strict=True):
+        rows = future.result()
+        if source.sql != query.sql:
+            rows = QueryResult(rows.table.select(list(query.aliases)))
+        executed.append(EDAQueryResult(title=query.title, sql=source.sql, rows=rows))
+    return executed
+
+
+def _prefetch_queries(
+    client: SnowflakeClient,
+    table: TableConfig,
+    table_profile: TableProfile,
+    inferences: list[InferenceResult],
+    skip: set[EDAQuery] | None = None,
+) -> dict[EDAQuery, Future[QueryResult]]:
+    # The likely EDA queries, assuming nothing is ignored, run while the human
+    # is still answering the checkpoint prompts.
+    numeric_columns = [i.column for i in inferences if "numeric" in i.behavior_class]
+    categorical_columns = [
+        i.column for i in inferences if "categorical" in i.behavior_class
+    ]
+    _, queries = _build_eda_queries(
+        table, table_profile, numeric_columns, categorical_columns, None
+    )
+    skip = skip or set()
+    return {query: client.submit(query.sql) for query in queries if query not in skip}
+
+
+@contextmanager
+def _client_session(
+    snowflake: SnowflakeConfig,
+    client: SnowflakeClient | None,
+    pool: ConnectionPool | None,
+) -> Iterator[SnowflakeClient]:
+    # Injected clients and pooled sessions outlive the run; only a client
+    # created here is closed here.
+    if client is not None:
+        with _guarded(client, snowflake):
+            yield client
+    elif pool is not None:
+        with pool.connection() as pooled, _guarded(pooled, snowflake):
+            yield pooled
+    else:
+        owned = SnowflakeClient(snowflake)
+        try:
+            with _guarded(owned, snowflake):
+                yield owned
+        finally:
+            owned.close()
+
+
+@contextmanager
+def _guarded(client: SnowflakeClient, snowflake: SnowflakeConfig) -> Iterator[None]:
+    # A failed or interrupted run cancels what it still has in flight rather
+    # than leaving the warehouse to finish work nobody will read.
+    try:
+        with client.run_deadline(snowflake.run_timeout_seconds):
+            yield
+    except BaseException:
+        client.cancel_running()
+        raise
+    finally:
+        _report_query_counters(client)
+
+
+def _register_table_version(
+    client: SnowflakeClient, table: TableConfig, metadata: TableMetadata
+) -> None:
+    if client.result_cache is not None:
+        table_fqn = qualify_table(table.database, table.schema, table.table)
+        client.result_cache.set_table_version(
+            table_fqn, f"{metadata.last_altered}/{metadata.bytes}"
+        )
+
+
+def _report_query_counters(client: SnowflakeClient) -> None:
+    counters = client.counters
+    if counters.retries or counters.timeouts or counters.cancelled or counters.failed:
+        typer.echo(
+            f"Queries: {counters.queries} sent, {counters.retries} retried, "
+            f"{counters.timeouts} timed out, {counters.cancelled} cancelled, "
+            f"{counters.failed} failed"
+        )
+    limiter = client.limiter
+    if limiter.adaptive:
+        typer.echo(
+            f"Concurrency: {int(limiter.limit)} of {limiter.max_limit} queries "
+            f"in flight after {limiter.decreases} congestion backoffs"
+        )
+
+
+def _report_result_cache(client: SnowflakeClient) -> None:
+    cache = client.result_cache
+    if cache is not None:
+        typer.echo(
+            f"Result cache: {cache.hits} hits, {cache.misses} misses, "
+            f"{cache.total_bytes} bytes held"
+        )
+
+
+def _profile_stage(
+    client: SnowflakeClient,
+    table: TableConfig,
+    columns: list[ColumnInfo],
+    metadata: TableMetadata,
+    profiling: ProfilingConfig,
+    budget: ScanBudget | None = None,
+) -> tuple[TableProfile, QueryResult, ProfilePlan | None]:
+    table_fqn = qualify_table(table.database, table.schema, table.table)
+    cache = None
+    if profiling.cache_dir is not None:
+        cache = ProfileCache(profiling.cache_dir, profiling.cache_max_bytes)
+        key = profile_cache_key(table_fqn, columns, metadata, profiling)
+        cached = cache.get(key)
+        if cached is not None:
+            typer.echo("Using cached profile; table unchanged since last run.")
+            return (*cached, None)
+
+    watermark_column = None
+    if profiling.incremental_dir is not None:
+        store = IncrementalStore(profiling.incremental_dir)
+        watermark_column = profiling.watermark_column or store.watermark_column(
+            table_fqn
+        )
+
+    plan = None
+    if watermark_column is not None:
+        table_profile, sample_rows = profile_table_incremental(
+            client,
+            table,
+            columns,
+            store,
+            watermark_column,
+            sample_limit=profiling.sample_limit,
+            top_k=profiling.top_k,
+        )
+    else:
+        if budget is not None:
+            remaining = budget.remaining_bytes
+            planned = plan_columns(
+                columns,
+                column_scan_bytes(metadata, columns),
+                metadata.row_count,
+                budget,
+                resolve_mode(
+                    profiling.mode, metadata.row_count, profiling.approx_row_threshold
+                ),
+                profiling.target_sample_rows,
+                profiling.sample_method,
+            )
+            plan = ProfilePlan(table_fqn, remaining, planned)
+        table_profile, sample_rows = profile_table(
+            client,
+            table,
+            columns,
+            sample_limit=profiling.sample_limit,
+            top_k=profiling.top_k,
+            mode=profiling.mode,
+            approx_row_threshold=profiling.approx_row_threshold,
+            target_sample_rows=profiling.target_sample_rows,
+            sample_method=profiling.sample_method,
+            row_count=metadata.row_count,
+            plan=plan,
+        )
+    if cache is not None:
+        cache.put(key, table_profile, sample_rows)
+    return table_profile, sample_rows, plan
+
+
+def _has_range(column: ColumnProfile) -> bool:
+    if column.precision not in EXACT_PRECISIONS:
+        return False
+    return column.min_value is not None or column.null_count == column.total_count
+
+
+def _has_top_values(column: ColumnProfile) -> bool:
+    # A profile profiled with a smaller top_k only answers the EDA query when
+    # its list already holds every distinct value.
+    if column.precision not in EXACT_PRECISIONS:
+        return False
+    top_count = len(column.top_values)
+    return top_count >= EDA_TOP_VALUES or 0 < column.distinct_count <= top_count
+
+
+def _agg_alias(column: str, stat: str) -> str:
+    # Aliases are named after the column rather than its position, so a fused
+    # result stays addressable whichever subset of columns it was built for.
+    return f"{column}__{stat}"
 
 
 def _build_eda_queries(
     table: TableConfig,
+    table_profile: TableProfile,
     numeric_columns: list[str],
     categorical_columns: list[str],
     time_column: str | None,
-) -> list[tuple[str, str]]:
+) -> tuple[list[EDAQueryResult], list[EDAQuery]]:
     table_fqn = qualify_table(table.database, table.schema, table.table)
-    queries: list[tuple[str, str]] = []
-
-    if numeric_columns:
-        for column in numeric_columns[:3]:
-            col_ident = quote_ident(column)
-            queries.append(
-                (
-                    f"Summary stats for {column}",
-                    "SELECT "
-                    f"MIN({col_ident}) AS MIN_VALUE, "
-                    f"MAX({col_ident}) AS MAX_VALUE, "
-                    f"AVG({col_ident}) AS AVG_VALUE, "
-                    f"STDDEV({col_ident}) AS STDDEV_VALUE "
-                    f"FROM {table_fqn}",
+    profiles = {column.name.lower(): column for column in table_profile.columns}
+    answered: list[EDAQueryResult] = []
+    queries: list[EDAQuery] = []
+    fused_titles: list[str] = []
+    # Alias to aggregate expression for everything fused into one scan.
+    fused: dict[str, str] = {}
+
+    for column in numeric_columns[:3]:
+        col_ident = quote_ident(column)
+        profile = profiles.get(column.lower())
+        if profile is not None and _has_range(profile):
+            answered.append(
+                EDAQueryResult(
+                    title=f"Summary stats for {column}",
+                    sql="",
+                    rows=QueryResult.from_rows(
+                        [
+                            {
+                                "MIN_VALUE": profile.min_value,
+                                "MAX_VALUE": profile.max_value,
+                            }
+                        ]
+                    ),
+                    source="profile",
                 )
             )
+        else:
+            fused[_agg_alias(column, "MIN")] = f"MIN({col_ident})"
+            fused[_agg_alias(column, "MAX")] = f"MAX({col_ident})"
+        fused_titles.append(f"moments of {column}")
+        fused[_agg_alias(column, "AVG")] = f"AVG({col_ident})"
+        fused[_agg_alias(column, "STDDEV")] = f"STDDEV({col_ident})"
 
-    if categorical_columns:
-        for column in categorical_columns[:3]:
-            col_ident = quote_ident(column)
-            queries.append(
-                (
-                    f"Top values for {column}",
-                    "SELECT "
-                    f"{col_ident} AS VALUE, COUNT(*) AS COUNT "
-                    f"FROM {table_fqn} "
-                    f"GROUP BY {col_ident} "
-                    "ORDER BY COUNT DESC NULLS LAST "
-                    "LIMIT 10",
+    for column in categorical_columns[:3]:
+        profile = profiles.get(column.lower())
+        if profile is not None and _has_top_values(profile):
+            answered.append(
+                EDAQueryResult(
+                    title=f"Top values for {column}",
+                    sql="",
+                    rows=QueryResult.from_rows(
+                        [
+                            {"VALUE": value, "COUNT": count}
+                            for value, count in profile.top_values[:EDA_TOP_VALUES]
+                        ]
+                    ),
+                    source="profile",
                 )
             )
-
-    if time_column:
-        time_ident = quote_ident(time_column)
+            continue
+        col_ident = quote_ident(column)
         queries.append(
-            (
-                f"Recent range for {time_column}",
+            EDAQuery(
+                f"Top values for {column}",
                 "SELECT "
-                f"MIN({time_ident}) AS MIN_TS, "
-                f"MAX({time_ident}) AS MAX_TS "
-                f"FROM {table_fqn}",
+                f"{col_ident} AS VALUE, COUNT(*) AS COUNT "
+                f"FROM {table_fqn} "
+                f"GROUP BY {col_ident} "
+                "ORDER BY COUNT DESC NULLS LAST "
+                f"LIMIT {EDA_TOP_VALUES}",
+                table_fqn,
             )
         )
 
-    if len(numeric_columns) >= 2:
-        col_a = quote_ident(numeric_columns[0])
-        col_b = quote_ident(numeric_columns[1])
+    if time_column:
+        profile = profiles.get(time_column.lower())
+        if profile is not None and _has_range(profile):
+            answered.append(
+                EDAQueryResult(
+                    title=f"Recent range for {time_column}",
+                    sql="",
+                    rows=QueryResult.from_rows(
+                        [{"MIN_TS": profile.min_value, "MAX_TS": profile.max_value}]
+                    ),
+                    source="profile",
+                )
+            )
+        else:
+            time_ident = quote_ident(time_column)
+            fused_titles.append(f"range of {time_column}")
+            fused[_agg_alias(time_column, "MIN")] = f"MIN({time_ident})"
+            fused[_agg_alias(time_column, "MAX")] = f"MAX({time_ident})"
+
+    correlated = numeric_columns[:MAX_CORRELATION_COLUMNS]
+    if len(correlated) >= 2:
+        fused_titles.append(f"correlation matrix of {len(correlated)} columns")
+        fused.update(correlation_aggregates(correlated))
+
+    # Everything the profile could not answer shares a single scan.
+    if fused:
+        selects = ", ".join(
+            f"{expression} AS {quote_ident(alias)}"
+            for alias, expression in fused.items()
+        )
         queries.append(
-            (
-                f"Correlation {numeric_columns[0]} vs {numeric_columns[1]}",
-                f"SELECT CORR({col_a}, {col_b}) AS CORR_VALUE "
-                f"FROM {table_fqn}",
+            EDAQuery(
+                f"Aggregates: {', '.join(fused_titles)}",
+                f"SELECT {selects} FROM {table_fqn}",
+                table_fqn,
+                tuple(fused),
             )
         )
 
-    return queries
+    return answered, queries
 
 
-def run_hilo_eda(
-    snowflake: SnowflakeConfig,
+def _inferences(
+    table_profile: TableProfile, patterns: dict[str, tuple[str, float]]
+) -> list[InferenceResult]:
+    return apply_patterns(
+        infer_all(table_profile.columns, table_profile.row_count), patterns
+    )
+
+
+def _infer_stage(
+    table_profile: TableProfile, sample_rows: QueryResult
+) -> tuple[dict[str, tuple[str, float]], list[InferenceResult]]:
+    # Content patterns come from the sample, which refinement never changes.
+    patterns = detect_patterns(sample_rows)
+    return patterns, _inferences(table_profile, patterns)
+
+
+def _refine_stage(
+    client: SnowflakeClient,
+    columns: list[ColumnInfo],
+    table_profile: TableProfile,
+    patterns: dict[str, tuple[str, float]],
+    inferences: list[InferenceResult],
+    ignore_set: set[str],
+    profiling: ProfilingConfig,
+    plan: ProfilePlan | None,
+    budget: ScanBudget | None,
+    column_bytes: int,
+) -> tuple[TableProfile, list[InferenceResult], ProfilePlan | None, list[str]]:
+    planning = budget is not None
+    deferred = [
+        column.name
+        for column in table_profile.columns
+        if column.precision in DEFERRED_PRECISIONS
+        and column.name.lower() not in ignore_set
+    ]
+    if deferred:
+        refine_mode = "exact"
+        if profiling.mode == "metadata":
+            refine_mode = resolve_mode(
+                "auto", table_profile.row_count, profiling.approx_row_threshold
+            )
+        refine_modes = {name: refine_mode for name in deferred}
+        if planning:
+            # Columns the budget cannot afford a full pass for keep their
+            # first-pass profile.
+            refined = [
+                column_plan
+                for column_plan in plan_columns(
+                    [column for column in columns if column.name in refine_modes],
+                    column_bytes,
+                    table_profile.row_count,
+                    budget,
+                    refine_mode,
+                    profiling.target_sample_rows,
+                    profiling.sample_method,
+                )
+                if column_plan.mode in {"exact", "approx"}
+            ]
+            plan = replace(plan, refined=refined)
+            refine_modes = {item.column: item.mode for item in refined}
+
+        if refine_modes:
+            typer.echo(f"Refining {len(refine_modes)} kept columns.")
+        with stage("profiling"):
+            for mode in sorted(set(refine_modes.values())):
+                table_profile = refine_profile(
+                    client,
+                    table_profile,
+                    columns,
+                    [name for name, item in refine_modes.items() if item == mode],
+                    mode=mode,
+                    top_k=profiling.top_k,
+                )
+        inferences = _inferences(table_profile, patterns)
+
+    kept = [column.name for column in columns if column.name.lower() not in ignore_set]
+    skipped: list[str] = []
+    distributed = distribution_columns(table_profile, columns, kept)
+    if planning and not budget.try_spend(len(distributed) * column_bytes):
+        skipped.append("Distributions")
+        distributed = []
+    if distributed:
+        with stage("distribution"):
+            table_profile = profile_distributions(
+                client, table_profile, columns, [column.name for column in distributed]
+            )
+
+    return table_profile, inferences, plan, skipped
+
+
+def _analysis_stage(
+    client: SnowflakeClient,
     table: TableConfig,
+    columns: list[ColumnInfo],
+    table_profile: TableProfile,
+    sample_rows: QueryResult,
+    profiling: ProfilingConfig,
     output: OutputConfig,
-) -> None:
-    client = SnowflakeClient(snowflake)
-    try:
-        if not table_exists(client, table):
-            raise ValueError("Table not found in INFORMATION_SCHEMA.")
+    checkpoint: RunCheckpoint,
+    tracer: Tracer | None = None,
+    metadata: TableMetadata | None = None,
+    plan: ProfilePlan | None = None,
+    budget: ScanBudget | None = None,
+) -> Path:
+    reported = checkpoint.load("report")
+    if reported is not None:
+        typer.echo(f"{table_profile.table_fqn} already reported in this run.")
+        return reported
+    patterns, inferences = checkpoint.run_stage(
+        "inferences", _infer_stage, table_profile, sample_rows
+    )
 
-        columns = fetch_columns(client, table)
-        if not columns:
-            raise ValueError("No columns found for table.")
+    typer.echo(f"\nProfiling completed for {table_profile.table_fqn}.")
+    typer.echo(f"Columns: {[col.name for col in columns]}")
+    behaviors = _format_inference(i.behavior_class for i in inferences)
+    typer.echo(f"Inferred behaviors: {behaviors}")
 
-        table_profile, sample_rows = profile_table(client, table, columns)
-        inferences = infer_all(table_profile.columns, table_profile.row_count)
+    # Queries finished by an earlier attempt of this run are reused like
+    # prefetched ones.
+    prefetched: dict[EDAQuery, Future[QueryResult]] = {
+        query: _completed(rows)
+        for query, rows in checkpoint.completed_queries().items()
+    }
+    planning = budget is not None and metadata is not None
+    human = checkpoint.load("selections")
+    if human is None:
+        # Speculative queries would bypass the scan budget, so a budgeted run
+        # waits for the human instead.
+        if not planning:
+            with stage("prefetch"):
+                speculative = _prefetch_queries(
+                    client, table, table_profile, inferences, set(prefetched)
+                )
+            for query, future in speculative.items():
+                checkpoint.track_query(query, future)
+            prefetched.update(speculative)
 
-        typer.echo("\nProfiling completed.")
-        typer.echo(f"Columns: {[col.name for col in columns]}")
-        typer.echo(
-            f"Inferred behaviors: {_format_inference(i.behavior_class for i in inferences)}"
+        with stage("checkpoint"):
+            human = collect_human_selections([col.name for col in columns])
+        checkpoint.save("selections", human)
+    if (
+        profiling.incremental_dir is not None
+        and profiling.watermark_column is None
+        and human.time_column
+    ):
+        IncrementalStore(profiling.incremental_dir).remember_watermark_column(
+            table_profile.table_fqn, human.time_column
         )
 
-        human = collect_human_selections([col.name for col in columns])
+    ignore_set = {name.lower() for name in human.ignore_columns}
+    if planning and plan is None:
+        plan = ProfilePlan(table_profile.table_fqn, budget.remaining_bytes, [])
+    column_bytes = column_scan_bytes(metadata, columns) if planning else 0
+    table_profile, inferences, plan, skipped = checkpoint.run_stage(
+        "refined",
+        _refine_stage,
+        client,
+        columns,
+        table_profile,
+        patterns,
+        inferences,
+        ignore_set,
+        profiling,
+        plan,
+        budget if planning else None,
+        column_bytes,
+    )
 
-        ignore_set = {name.lower() for name in human.ignore_columns}
-        filtered_inferences = [
-            inference
-            for inference in inferences
-            if inference.column.lower() not in ignore_set
-        ]
+    filtered_inferences = [
+        inference
+        for inference in inferences
+        if inference.column.lower() not in ignore_set
+    ]
 
-        numeric_columns = [
-            inf.column
-            for inf in filtered_inferences
-            if "numeric" in inf.behavior_class
-        ]
-        categorical_columns = [
-            inf.column
-            for inf in filtered_inferences
-            if "categorical" in inf.behavior_class
-        ]
+    numeric_columns = [
+        inf.column for inf in filtered_inferences if "numeric" in inf.behavior_class
+    ]
+    categorical_columns = [
+        inf.column for inf in filtered_inferences if "categorical" in inf.behavior_class
+    ]
 
-        queries = _build_eda_queries(
-            table, numeric_columns, categorical_columns, human.time_column
+    answered, queries = _build_eda_queries(
+        table, table_profile, numeric_columns, categorical_columns, human.time_column
+    )
+    if planning:
+        queries, over_budget = plan_queries(queries, columns, column_bytes, budget)
+        plan = replace(plan, skipped_queries=skipped + over_budget)
+    with stage("eda"):
+        executed_queries = answered + _run_queries(
+            client, queries, prefetched, checkpoint
         )
-        executed_queries = [
-            _run_query(client, title, sql) for title, sql in queries
-        ]
 
-        output.output_dir.mkdir(parents=True, exist_ok=True)
-        report_path = Path(output.output_dir) / "eda_report.md"
-        write_markdown_report(report_path, table_profile, inferences, human, executed_queries)
+    correlated = numeric_columns[:MAX_CORRELATION_COLUMNS]
+    matrix = correlation_matrix(
+        correlated, [result.rows for result in executed_queries]
+    )
+
+    output.output_dir.mkdir(parents=True, exist_ok=True)
+    artifacts = []
+    if len(correlated) >= 2:
+        artifacts.append(
+            write_artifact(
+                output.output_dir / "correlation_matrix",
+                correlation_table(correlated, matrix),
+                output.artifact_format,
+            )
+        )
+    if tracer is not None:
+        tracer.attach_bytes_scanned(client.bytes_scanned(tracer.query_ids()))
+        tracer.write(Path(output.output_dir) / "trace.json")
+    correlations = top_pairs(correlated, matrix)
+    report_paths = []
+    for report_format in output.report_formats:
+        file_name, writer = REPORT_WRITERS[report_format]
+        report_paths.append(Path(output.output_dir) / file_name)
+        writer(
+            report_paths[-1],
+            table_profile,
+            inferences,
+            human,
+            executed_queries,
+            tracer,
+            plan,
+            correlations,
+        )
+    report_path = report_paths[0]
 
-        if output.write_csv:
-            write_csv_outputs(output.output_dir, table_profile, sample_rows)
+    artifacts += write_artifacts(
+        output.output_dir,
+        table_profile,
+        sample_rows,
+        executed_queries,
+        output.artifact_format,
+    )
+    if output.write_csv:
+        export_csv(artifacts)
 
-        typer.echo(f"Report written to {report_path}")
-    finally:
-        client.close()
+    checkpoint.save("report", report_path)
+    typer.echo(f"Report written to {report_path}")
+    return report_path
+
+
+def _scan_budget(profiling: ProfilingConfig) -> ScanBudget | None:
+    if profiling.scan_budget_bytes is None:
+        return None
+    return ScanBudget(profiling.scan_budget_bytes)
+
+
+def _check_report_formats(output: OutputConfig) -> None:
+    if not output.report_formats:
+        raise ValueError("At least one report format is required.")
+    for report_format in output.report_formats:
+        if report_format not in REPORT_WRITERS:
+            raise ValueError(f"Unknown report format: {report_format}")
+
+
+def _start_run(output: OutputConfig, resume: str | None) -> RunCheckpoint:
+    checkpoint = RunCheckpoint.start(output.output_dir, resume)
+    action = "Resuming" if resume else "Starting"
+    typer.echo(
+        f"{action} run {checkpoint.run_id}; "
+        f"continue it after an interruption with --resume {checkpoint.run_id}."
+    )
+    return checkpoint
+
+
+def _check_discovery(
+    checkpoint: RunCheckpoint, metadata: TableMetadata, columns: list[ColumnInfo]
+) -> None:
+    # Saved stages describe the table as it was; a changed table means they
+    # can no longer be trusted.
+    if checkpoint.load("discovery") not in (None, (metadata, columns)):
+        raise ValueError(
+            f"Table changed since run {checkpoint.run_id} started; "
+            "start a new run instead of resuming."
+        )
+    checkpoint.save("discovery", (metadata, columns))
+
+
+def _traced(tracer: Tracer, name: str, func: Callable[..., Any], *args: Any) -> Any:
+    # Scheduler threads start with an empty context; each table's work is
+    # traced into that table's own tracer.
+    with tracing(tracer), stage(name):
+        return func(*args)
+
+
+def run_hilo_eda(
+    snowflake: SnowflakeConfig,
+    table: TableConfig,
+    output: OutputConfig,
+    profiling: ProfilingConfig | None = None,
+    client: SnowflakeClient | None = None,
+    pool: ConnectionPool | None = None,
+    resume: str | None = None,
+) -> None:
+    profiling = profiling or ProfilingConfig()
+    _check_report_formats(output)
+    checkpoint = _start_run(output, resume)
+    budget = _scan_budget(profiling)
+    tracer = Tracer()
+    with tracing(tracer), _client_session(snowflake, client, pool) as session:
+        with stage("discovery"):
+            metadata = fetch_table_metadata(session, table)
+            if metadata is None:
+                raise ValueError("Table not found in INFORMATION_SCHEMA.")
+
+            columns = fetch_columns(session, table)
+            if not columns:
+                raise ValueError("No columns found for table.")
+
+        _check_discovery(checkpoint, metadata, columns)
+        _register_table_version(session, table, metadata)
+        with stage("profiling"):
+            table_profile, sample_rows, plan = checkpoint.run_stage(
+                "profile",
+                _profile_stage,
+                session,
+                table,
+                columns,
+                metadata,
+                profiling,
+                budget,
+            )
+        _analysis_stage(
+            session,
+            table,
+            columns,
+            table_profile,
+            sample_rows,
+            profiling,
+            output,
+            checkpoint,
+            tracer,
+            metadata,
+            plan,
+            budget,
+        )
+        _report_result_cache(session)
+    checkpoint.finish()
+
+
+def run_schema_eda(
+    snowflake: SnowflakeConfig,
+    database: str,
+    schema: str,
+    output: OutputConfig,
+    profiling: ProfilingConfig | None = None,
+    pattern: str = "*",
+    workers: int = 4,
+    client: SnowflakeClient | None = None,
+    pool: ConnectionPool | None = None,
+    resume: str | None = None,
+) -> Path:
+    profiling = profiling or ProfilingConfig()
+    _check_report_formats(output)
+    run = _start_run(output, resume)
+    with _client_session(snowflake, client, pool) as session:
+        tables = fetch_schema_tables(session, schema, pattern)
+        if not tables:
+            raise ValueError(f"No tables in {database}.{schema} match {pattern!r}.")
+        checkpoints = {name: run.child(name) for name in tables}
+        for name, (metadata, columns) in tables.items():
+            _check_discovery(checkpoints[name], metadata, columns)
+            _register_table_version(
+                session,
+                TableConfig(database=database, schema=schema, table=name),
+                metadata,
+            )
+
+        # Tables profile in the background while the human works through the
+        # checkpoints in order; every worker shares the one connection.
+        entries: list[tuple[str, Path | None, str]] = []
+        tracers = {name: Tracer() for name in tables}
+        # One budget covers every table in the run.
+        budget = _scan_budget(profiling)
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="hilo-eda-table"
+        ) as scheduler:
+            try:
+                futures = {
+                    name: scheduler.submit(
+                        _traced,
+                        tracers[name],
+                        "profiling",
+                        checkpoints[name].run_stage,
+                        "profile",
+                        _profile_stage,
+                        session,
+                        TableConfig(database=database, schema=schema, table=name),
+                        columns,
+                        metadata,
+                        profiling,
+                        budget,
+                    )
+                    for name, (metadata, columns) in tables.items()
+                }
+                for name, (metadata, columns) in tables.items():
+                    table = TableConfig(database=database, schema=schema, table=name)
+                    table_output = replace(output, output_dir=output.output_dir / name)
+                    try:
+                        table_profile, sample_rows, plan = futures[name].result()
+                        with tracing(tracers[name]):
+                            report_path = _analysis_stage(
+                                session,
+                                table,
+                                columns,
+                                table_profile,
+                                sample_rows,
+                                profiling,
+                                table_output,
+                                checkpoints[name],
+                                tracers[name],
+                                metadata,
+                                plan,
+                                budget,
+                            )
+                    except Exception as exc:
+                        # One broken table must not abort the rest of the batch.
+                        typer.echo(f"Failed to analyze {name}: {exc}")
+                        entries.append((name, None, f"failed: {exc}"))
+                        continue
+                    entries.append(
+                        (
+                            name,
+                            report_path,
+                            f"{table_profile.row_count} rows, {len(columns)} columns",
+                        )
+                    )
+            except BaseException:
+                # Leaving the with block would wait for every submitted table
+                # to be profiled; drop them and stop what is running instead.
+                scheduler.shutdown(wait=False, cancel_futures=True)
+                session.cancel_running()
+                raise
+
+        output.output_dir.mkdir(parents=True, exist_ok=True)
+        index_path = output.output_dir / "index.md"
+        write_index(index_path, f"{database}.{schema}", entries)
+        typer.echo(f"Index written to {index_path}")
+        _report_result_cache(session)
+    # Failed tables are retried by resuming, so their run is kept.
+    if all(report_path is not None for _, report_path, _ in entries):
+        run.finish()
+    return index_path
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from hilo_eda.models import InferenceResult
+from hilo_eda.results import QueryResult
+
+# RE2 syntax, checked in order; the first pattern most sampled values match wins.
+PATTERNS = (
+    (
+        "uuid",
+        r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$",
+    ),
+    ("email", r"^[^@\s]+@[^@\s]+\.[^@\s]+$"),
+    (
+        "iso-date",
+        r"^\d{4}-\d{2}-\d{2}([T ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}:?\d{2})?)?$",
+    ),
+    ("numeric-string", r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$"),
+    ("json", r"^\s*(\{.*\}|\[.*\])\s*$"),
+    ("identifier", r"^[A-Za-z]{0,6}[-_]?\d{3,}$"),
+)
+# Patterns that only describe identifiers when no sampled value repeats.
+UNIQUE_PATTERNS = {"identifier"}
+PATTERN_MATCH_SHARE = 0.9
+PATTERN_BEHAVIORS = {
+    "uuid": "identifier",
+    "identifier": "identifier",
+    "email": "email",
+    "iso-date": "date-like text",
+    "numeric-string": "number-like text",
+    "json": "semi-structured",
+}
+# Type- and count-based classes a content pattern is allowed to replace.
+OVERRIDABLE_BEHAVIORS = {"text", "unknown", "high-cardinality categorical"}
+
+
+def detect_patterns(sample: QueryResult) -> dict[str, tuple[str, float]]:
+    # Each regex runs over a whole column at once in Arrow's compute kernels.
+    detected: dict[str, tuple[str, float]] = {}
+    for name in sample.column_names:
+        column = sample.table.column(name)
+        if not (
+            pa.types.is_string(column.type) or pa.types.is_large_string(column.type)
+        ):
+            continue
+        values = pc.drop_null(column)
+        total = len(values)
+        if total == 0:
+            continue
+        unique = pc.count_distinct(values).as_py() == total
+        for pattern, regex in PATTERNS:
+            if pattern in UNIQUE_PATTERNS and not unique:
+                continue
+            matched = pc.sum(pc.match_substring_regex(values, regex)).as_py() or 0
+            share = matched / total
+            if share >= PATTERN_MATCH_SHARE:
+                detected[name] = (pattern, share)
+                break
+    return detected
+
+
+def apply_patterns(
+    inferences: list[InferenceResult], detected: dict[str, tuple[str, float]]
+) -> list[InferenceResult]:
+    results: list[InferenceResult] = []
+    for inference in inferences:
+        if inference.column not in detected:
+            results.append(inference)
+            continue
+        pattern, share = detected[inference.column]
+        rationale = f"{share:.0%} of sampled values look like {pattern}"
+        if inference.behavior_class in OVERRIDABLE_BEHAVIORS:
+            results.append(
+                InferenceResult(
+                    inference.column,
+                    PATTERN_BEHAVIORS[pattern],
+                    round(0.5 + 0.4 * share, 2),
+                    rationale,
+                    pattern,
+                )
+            )
+        else:
+            results.append(
+                replace(
+                    inference,
+                    rationale=f"{inference.rationale}; {rationale}",
+                    pattern=pattern,
+                )
+            )
+    return results
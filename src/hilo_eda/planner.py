@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+
+from hilo_eda.models import ColumnInfo, EDAQuery, TableMetadata
+from hilo_eda.sql_safety import quote_ident
+
+# Cheapest last; the planner walks down from the preferred tier until a
+# column's estimated scan fits in what is left of the budget.
+PLAN_TIERS = ("exact", "approx", "sampled", "metadata")
+
+
+@dataclass
+class ScanBudget:
+    limit_bytes: int
+    spent_bytes: int = 0
+
+    def __post_init__(self) -> None:
+        if self.limit_bytes < 0:
+            raise ValueError("Scan budget cannot be negative.")
+        self._lock = threading.Lock()
+
+    @property
+    def remaining_bytes(self) -> int:
+        return max(self.limit_bytes - self.spent_bytes, 0)
+
+    def try_spend(self, cost: int) -> bool:
+        with self._lock:
+            if cost > self.limit_bytes - self.spent_bytes:
+                return False
+            self.spent_bytes += cost
+            return True
+
+
+@dataclass(frozen=True)
+class ColumnPlan:
+    column: str
+    mode: str
+    estimated_bytes: int
+
+
+@dataclass(frozen=True)
+class ProfilePlan:
+    table_fqn: str
+    budget_remaining_bytes: int
+    columns: list[ColumnPlan]
+    refined: list[ColumnPlan] = field(default_factory=list)
+    skipped_queries: list[str] = field(default_factory=list)
+
+    @property
+    def estimated_bytes(self) -> int:
+        return sum(column.estimated_bytes for column in [*self.columns, *self.refined])
+
+    def modes(self) -> dict[str, str]:
+        return {column.column: column.mode for column in self.columns}
+
+
+def column_scan_bytes(metadata: TableMetadata, columns: list[ColumnInfo]) -> int:
+    # Storage is columnar, so a column's share of BYTES approximates what a
+    # scan of that column reads.
+    return metadata.bytes // max(len(columns), 1)
+
+
+def sample_fraction(row_count: int, target_sample_rows: int) -> float:
+    if row_count <= 0:
+        return 1.0
+    return min(1.0, target_sample_rows / row_count)
+
+
+def estimate_bytes(
+    mode: str, column_bytes: int, fraction: float, sample_method: str
+) -> int:
+    if mode == "metadata":
+        return 0
+    if mode == "exact" or (mode == "sampled" and fraction >= 1.0):
+        # The wide aggregate and the per-column top values GROUP BY.
+        return 2 * column_bytes
+    if mode == "sampled" and sample_method == "SYSTEM":
+        # Block sampling skips whole micro-partitions; BERNOULLI reads them all.
+        return round(column_bytes * fraction)
+    return column_bytes
+
+
+def plan_columns(
+    columns: list[ColumnInfo],
+    column_bytes: int,
+    row_count: int,
+    budget: ScanBudget,
+    preferred_mode: str,
+    target_sample_rows: int,
+    sample_method: str,
+) -> list[ColumnPlan]:
+    if preferred_mode not in PLAN_TIERS:
+        raise ValueError(f"Unknown plan tier: {preferred_mode}")
+    fraction = sample_fraction(row_count, target_sample_rows)
+    ladder = PLAN_TIERS[PLAN_TIERS.index(preferred_mode) :]
+
+    plans: list[ColumnPlan] = []
+    for column in columns:
+        mode, cost = "metadata", 0
+        for tier in ladder:
+            tier_cost = estimate_bytes(tier, column_bytes, fraction, sample_method)
+            if budget.try_spend(tier_cost):
+                mode, cost = tier, tier_cost
+                break
+        plans.append(ColumnPlan(column.name, mode, cost))
+    return plans
+
+
+def plan_queries(
+    queries: list[EDAQuery],
+    columns: list[ColumnInfo],
+    column_bytes: int,
+    budget: ScanBudget,
+) -> tuple[list[EDAQuery], list[str]]:
+    kept: list[EDAQuery] = []
+    skipped: list[str] = []
+    for query in queries:
+        referenced = sum(
+            1 for column in columns if quote_ident(column.name) in query.sql
+        )
+        if budget.try_spend(max(referenced, 1) * column_bytes):
+            kept.append(query)
+        else:
+            skipped.append(query.title)
+    return kept, skipped
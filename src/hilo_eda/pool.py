@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from hilo_eda.config import SnowflakeConfig
+from hilo_eda.snowflake import SnowflakeClient
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_IDLE_TIMEOUT = 300.0
+
+
+@dataclass
+class ConnectionPool:
+    config: SnowflakeConfig
+    max_size: int = DEFAULT_POOL_SIZE
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT
+    _idle: list[tuple[float, SnowflakeClient]] = field(
+        default_factory=list, init=False, repr=False
+    )
+    _in_use: int = field(default=0, init=False, repr=False)
+    _condition: threading.Condition = field(
+        default_factory=threading.Condition, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+
+    def acquire(self) -> SnowflakeClient:
+        stale: list[SnowflakeClient] = []
+        with self._condition:
+            while True:
+                stale.extend(self._expire_idle())
+                client = self._pop_healthy(stale)
+                if client is not None or self._in_use < self.max_size:
+                    break
+                self._condition.wait()
+            self._in_use += 1
+        for old in stale:
+            old.close()
+        if client is not None:
+            return client
+        try:
+            return SnowflakeClient(self.config)
+        except BaseException:
+            with self._condition:
+                self._in_use -= 1
+                self._condition.notify()
+            raise
+
+    def release(self, client: SnowflakeClient) -> None:
+        healthy = client.is_healthy()
+        with self._condition:
+            self._in_use -= 1
+            if healthy:
+                self._idle.append((time.monotonic(), client))
+            self._condition.notify()
+        if not healthy:
+            client.close()
+
+    @contextmanager
+    def connection(self) -> Iterator[SnowflakeClient]:
+        client = self.acquire()
+        try:
+            yield client
+        finally:
+            self.release(client)
+
+    def close(self) -> None:
+        with self._condition:
+            idle, self._idle = self._idle, []
+        for _, client in idle:
+            client.close()
+
+    def _pop_healthy(self, stale: list[SnowflakeClient]) -> SnowflakeClient | None:
+        while self._idle:
+            _, client = self._idle.pop()
+            if client.is_healthy():
+                return client
+            stale.append(client)
+        return None
+
+    def _expire_idle(self) -> list[SnowflakeClient]:
+        cutoff = time.monotonic() - self.idle_timeout
+        expired = [client for last_used, client in self._idle if last_used < cutoff]
+        self._idle = [entry for entry in self._idle if entry[0] >= cutoff]
+        return expired
+
+
+_POOLS: dict[SnowflakeConfig, ConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_pool(
+    config: SnowflakeConfig,
+    max_size: int = DEFAULT_POOL_SIZE,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+) -> ConnectionPool:
+    with _POOLS_LOCK:
+        pool = _POOLS.get(config)
+        if pool is None:
+            pool = ConnectionPool(config, max_size=max_size, idle_timeout=idle_timeout)
+            _POOLS[config] = pool
+        return pool
+
+
+@atexit.register
+def close_all_pools() -> None:
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
@@ -1,91 +1,681 @@
 from __future__ import annotations
 
+import calendar
+import json
+import math
+from collections.abc import Callable
+from dataclasses import replace
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from functools import cache
 from typing import Any
 
 from hilo_eda.config import TableConfig
-from hilo_eda.models import ColumnInfo, ColumnProfile, TableProfile
-from hilo_eda.sql_safety import qualify_table, quote_ident
+from hilo_eda.discovery import column_in_table
+from hilo_eda.incremental import ColumnState, IncrementalState, IncrementalStore
+from hilo_eda.models import ColumnInfo, ColumnProfile, Distribution, TableProfile
+from hilo_eda.planner import ProfilePlan, sample_fraction
+from hilo_eda.results import QueryResult
+from hilo_eda.sketches import HyperLogLog, TopKCounter
+from hilo_eda.sql_safety import qualify_table, quote_ident, quote_literal
 from hilo_eda.snowflake import SnowflakeClient
 
 NUMERIC_TYPES = {"NUMBER", "INT", "INTEGER", "FLOAT", "DOUBLE", "DECIMAL"}
 DATE_TYPES = {"DATE", "TIMESTAMP", "TIMESTAMP_NTZ", "TIMESTAMP_LTZ", "TIMESTAMP_TZ"}
+PROFILING_MODES = {"auto", "exact", "approx", "sampled", "metadata"}
+SAMPLE_METHODS = {"BERNOULLI", "SYSTEM"}
+# Profiles at these precisions are re-profiled for the columns kept at the
+# human checkpoint.
+DEFERRED_PRECISIONS = {"sampled", "metadata"}
 
+WIDE_BATCH_SIZE = 100
+MAX_SQL_LENGTH = 500_000
+APPROX_ROW_THRESHOLD = 10_000_000
+# Average relative error of Snowflake's HyperLogLog APPROX_COUNT_DISTINCT.
+HLL_RELATIVE_ERROR = 0.0162
+TOP_K_CAPACITY = 100
+TARGET_SAMPLE_ROWS = 1_000_000
+SAMPLE_SEED = 42
+Z_95 = 1.96
+DISTRIBUTION_QUANTILES = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+HISTOGRAM_BUCKETS = 10
 
+
+@cache
 def _is_numeric(data_type: str) -> bool:
     upper = data_type.upper()
     return any(token in upper for token in NUMERIC_TYPES)
 
 
+@cache
 def _is_date(data_type: str) -> bool:
     upper = data_type.upper()
     return any(token in upper for token in DATE_TYPES)
 
 
-def profile_table(
+def _has_min_max(column: ColumnInfo) -> bool:
+    return _is_numeric(column.data_type) or _is_date(column.data_type)
+
+
+def resolve_mode(mode: str, row_count: int, approx_row_threshold: int) -> str:
+    if mode not in PROFILING_MODES:
+        raise ValueError(f"Unknown profiling mode: {mode}")
+    if mode == "auto":
+        return "approx" if row_count >= approx_row_threshold else "exact"
+    return mode
+
+
+def _alias(index: int, stat: str) -> str:
+    return f"C{index}_{stat}"
+
+
+def _column_selects(index: int, column: ColumnInfo, mode: str, top_k: int) -> list[str]:
+    col_ident = quote_ident(column.name)
+    selects = [f"COUNT({col_ident}) AS {_alias(index, 'NON_NULL')}"]
+    if mode == "metadata":
+        # COUNT, MIN and MAX are answered from micro-partition metadata.
+        if _has_min_max(column):
+            selects.append(f"MIN({col_ident}) AS {_alias(index, 'MIN')}")
+            selects.append(f"MAX({col_ident}) AS {_alias(index, 'MAX')}")
+        return selects
+    if mode == "approx":
+        selects.append(
+            f"APPROX_COUNT_DISTINCT({col_ident}) AS {_alias(index, 'DISTINCT')}"
+        )
+    else:
+        selects.append(f"COUNT(DISTINCT {col_ident}) AS {_alias(index, 'DISTINCT')}")
+    if mode != "exact":
+        selects.append(f"APPROX_TOP_K({col_ident}, {top_k}) AS {_alias(index, 'TOP')}")
+    if _has_min_max(column):
+        selects.append(f"MIN({col_ident}) AS {_alias(index, 'MIN')}")
+        selects.append(f"MAX({col_ident}) AS {_alias(index, 'MAX')}")
+    if mode == "approx" and _is_numeric(column.data_type):
+        selects.append(
+            f"APPROX_PERCENTILE({col_ident}, 0.5) AS {_alias(index, 'MEDIAN')}"
+        )
+    return selects
+
+
+def _batch_selects(
+    columns: list[ColumnInfo],
+    selects_for: Callable[[int, ColumnInfo], list[str]],
+    batch_size: int,
+    max_sql_length: int,
+) -> list[list[tuple[int, ColumnInfo, list[str]]]]:
+    batches: list[list[tuple[int, ColumnInfo, list[str]]]] = []
+    current: list[tuple[int, ColumnInfo, list[str]]] = []
+    current_length = 0
+    for index, column in enumerate(columns):
+        selects = selects_for(index, column)
+        length = sum(len(select) + 2 for select in selects)
+        if current and (
+            len(current) >= batch_size or current_length + length > max_sql_length
+        ):
+            batches.append(current)
+            current, current_length = [], 0
+        current.append((index, column, selects))
+        current_length += length
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _wide_sql(source: str, selects: list[str], where: str = "") -> str:
+    sql = f"SELECT {', '.join(['COUNT(*) AS TOTAL_COUNT', *selects])} FROM {source}"
+    return f"{sql} WHERE {where}" if where else sql
+
+
+def _wide_sqls(
+    source: str,
+    batches: list[list[tuple[int, ColumnInfo, list[str]]]],
+    where: str = "",
+) -> list[str]:
+    return [
+        _wide_sql(source, [select for _, _, items in batch for select in items], where)
+        for batch in batches or [[]]
+    ]
+
+
+def _top_values_sql(table_fqn: str, column: ColumnInfo, top_k: int) -> str:
+    col_ident = quote_ident(column.name)
+    return (
+        f"SELECT {col_ident} AS VALUE, COUNT(*) AS COUNT "
+        f"FROM {table_fqn} "
+        f"GROUP BY {col_ident} "
+        f"ORDER BY COUNT DESC NULLS LAST "
+        f"LIMIT {top_k}"
+    )
+
+
+def _parse_top_k(raw: Any) -> list[tuple[Any, int]]:
+    # APPROX_TOP_K returns a VARIANT array of [value, count] pairs.
+    pairs = json.loads(raw) if isinstance(raw, str) else raw or []
+    return [(value, int(count)) for value, count in pairs]
+
+
+def _tablesample(table_fqn: str, fraction: float, method: str) -> str:
+    if method not in SAMPLE_METHODS:
+        raise ValueError(f"Unknown sample method: {method}")
+    return (
+        f"{table_fqn} TABLESAMPLE {method} ({fraction * 100:.6f}) SEED ({SAMPLE_SEED})"
+    )
+
+
+def _proportion_interval(hits: int, trials: int) -> tuple[float, float]:
+    if trials == 0:
+        return 0.0, 1.0
+    share = hits / trials
+    margin = Z_95 * math.sqrt(share * (1 - share) / trials)
+    return max(0.0, share - margin), min(1.0, share + margin)
+
+
+def _sampled_profile(
+    column: ColumnInfo,
+    row_count: int,
+    sample_total: int,
+    sample_non_null: int,
+    sample_distinct: int,
+    min_value: Any | None,
+    max_value: Any | None,
+    top_values: list[tuple[Any, int]],
+) -> ColumnProfile:
+    scale = row_count / max(sample_total, 1)
+    low, high = _proportion_interval(sample_non_null, sample_total)
+    non_null = round(sample_non_null * scale)
+    non_null_high = round(high * row_count)
+
+    # Values that repeat inside the sample have mostly been seen already, so
+    # only near-unique columns are scaled up to the table. The distinct range
+    # is a heuristic bound, not a confidence interval: the distinct values
+    # seen up to that scaled-up count.
+    scaled_distinct = min(round(sample_distinct * scale), non_null_high)
+    near_unique = sample_non_null and sample_distinct / sample_non_null >= 0.9
+    distinct = scaled_distinct if near_unique else sample_distinct
+
+    return ColumnProfile(
+        name=column.name,
+        data_type=column.data_type,
+        total_count=row_count,
+        null_count=row_count - non_null,
+        distinct_count=distinct,
+        min_value=min_value,
+        max_value=max_value,
+        top_values=[(value, round(count * scale)) for value, count in top_values],
+        precision="sampled",
+        null_count_ci=(round((1 - high) * row_count), round((1 - low) * row_count)),
+        distinct_count_ci=(sample_distinct, max(distinct, scaled_distinct)),
+        sample_fraction=1 / scale if scale else 1.0,
+    )
+
+
+def _profile_columns(
     client: SnowflakeClient,
-    table: TableConfig,
+    table_fqn: str,
     columns: list[ColumnInfo],
-    sample_limit: int = 50,
-    top_k: int = 5,
-) -> tuple[TableProfile, list[dict[str, Any]]]:
-    table_fqn = qualify_table(table.database, table.schema, table.table)
-    row_count_sql = f"SELECT COUNT(*) AS ROW_COUNT FROM {table_fqn}"
-    row_count = client.execute_query(row_count_sql)[0]["ROW_COUNT"]
+    mode: str,
+    top_k: int,
+    batch_size: int,
+    max_sql_length: int,
+    row_count: int | None = None,
+    target_sample_rows: int = TARGET_SAMPLE_ROWS,
+    sample_method: str = "BERNOULLI",
+) -> tuple[int, list[ColumnProfile]]:
+    source = table_fqn
+    if mode == "sampled":
+        fraction = sample_fraction(row_count or 0, target_sample_rows)
+        if fraction >= 1.0:
+            mode = "exact"
+        else:
+            source = _tablesample(table_fqn, fraction, sample_method)
+
+    # One wide aggregate per batch of columns replaces the per-column scans.
+    # Wide batches and top-k queries are independent, so they are submitted
+    # together and run concurrently.
+    batches = _batch_selects(
+        columns,
+        lambda index, column: _column_selects(index, column, mode, top_k),
+        batch_size,
+        max_sql_length,
+    )
+    wide_sqls = _wide_sqls(source, batches)
+    top_sqls = (
+        [_top_values_sql(table_fqn, column, top_k) for column in columns]
+        if mode == "exact"
+        else []
+    )
+    results = client.execute_many([*wide_sqls, *top_sqls])
+    wide_results = results[: len(wide_sqls)]
+    top_results = results[len(wide_sqls) :]
+
+    aggregates: dict[int, QueryResult] = {}
+    for batch, result in zip(batches or [[]], wide_results, strict=True):
+        for index, _, _ in batch:
+            aggregates[index] = result
+    sample_total = int(wide_results[0].value("TOTAL_COUNT"))
+    # The metadata tier keeps the row count the caller read from table
+    # metadata; the scanned COUNT(*) only stands in when there is none.
+    if row_count is None or mode not in {"sampled", "metadata"}:
+        row_count = sample_total
 
     profiles: list[ColumnProfile] = []
-    for column in columns:
-        col_ident = quote_ident(column.name)
-        base_sql = (
-            "SELECT COUNT(*) AS TOTAL_COUNT, "
-            f"COUNT({col_ident}) AS NON_NULL_COUNT, "
-            f"COUNT(DISTINCT {col_ident}) AS DISTINCT_COUNT "
-            f"FROM {table_fqn}"
-        )
-        base_row = client.execute_query(base_sql)[0]
-        total_count = int(base_row["TOTAL_COUNT"])
-        non_null_count = int(base_row["NON_NULL_COUNT"])
-        null_count = total_count - non_null_count
-        distinct_count = int(base_row["DISTINCT_COUNT"])
+    for index, column in enumerate(columns):
+        aggregate = aggregates[index]
+        non_null_count = int(aggregate.value(_alias(index, "NON_NULL")))
+        distinct_count = 0
+        if mode != "metadata":
+            distinct_count = int(aggregate.value(_alias(index, "DISTINCT")))
 
         min_value = None
         max_value = None
-        if _is_numeric(column.data_type) or _is_date(column.data_type):
-            min_max_sql = (
-                f"SELECT MIN({col_ident}) AS MIN_VALUE, "
-                f"MAX({col_ident}) AS MAX_VALUE "
-                f"FROM {table_fqn}"
+        if _has_min_max(column):
+            min_value = aggregate.value(_alias(index, "MIN"))
+            max_value = aggregate.value(_alias(index, "MAX"))
+
+        median_value = None
+        if mode == "approx" and _is_numeric(column.data_type):
+            median_value = aggregate.value(_alias(index, "MEDIAN"))
+
+        top_values: list[tuple[Any, int]] = []
+        if mode == "exact":
+            top_result = top_results[index]
+            top_values = [
+                (value, int(count))
+                for value, count in zip(
+                    top_result.column("VALUE"), top_result.column("COUNT"), strict=True
+                )
+            ]
+        elif mode != "metadata":
+            top_values = _parse_top_k(aggregate.value(_alias(index, "TOP")))
+
+        if mode == "sampled":
+            profiles.append(
+                _sampled_profile(
+                    column,
+                    row_count,
+                    sample_total,
+                    non_null_count,
+                    distinct_count,
+                    min_value,
+                    max_value,
+                    top_values,
+                )
             )
-            min_max_row = client.execute_query(min_max_sql)[0]
-            min_value = min_max_row["MIN_VALUE"]
-            max_value = min_max_row["MAX_VALUE"]
-
-        top_values_sql = (
-            f"SELECT {col_ident} AS VALUE, COUNT(*) AS COUNT "
-            f"FROM {table_fqn} "
-            f"GROUP BY {col_ident} "
-            f"ORDER BY COUNT DESC NULLS LAST "
-            f"LIMIT {top_k}"
-        )
-        top_rows = client.execute_query(top_values_sql)
-        top_values = [(row["VALUE"], int(row["COUNT"])) for row in top_rows]
+            continue
 
         profiles.append(
             ColumnProfile(
                 name=column.name,
                 data_type=column.data_type,
-                total_count=total_count,
-                null_count=null_count,
+                total_count=row_count,
+                null_count=row_count - non_null_count,
                 distinct_count=distinct_count,
                 min_value=min_value,
                 max_value=max_value,
                 top_values=top_values,
+                median_value=median_value,
+                precision=mode,
+                distinct_error=HLL_RELATIVE_ERROR if mode == "approx" else 0.0,
             )
         )
+    return row_count, profiles
+
+
+def profile_table(
+    client: SnowflakeClient,
+    table: TableConfig,
+    columns: list[ColumnInfo],
+    sample_limit: int = 50,
+    top_k: int = 5,
+    batch_size: int = WIDE_BATCH_SIZE,
+    max_sql_length: int = MAX_SQL_LENGTH,
+    mode: str = "auto",
+    approx_row_threshold: int = APPROX_ROW_THRESHOLD,
+    target_sample_rows: int = TARGET_SAMPLE_ROWS,
+    sample_method: str = "BERNOULLI",
+    row_count: int | None = None,
+    plan: ProfilePlan | None = None,
+) -> tuple[TableProfile, QueryResult]:
+    table_fqn = qualify_table(table.database, table.schema, table.table)
+    sample_future = client.submit(f"SELECT * FROM {table_fqn} LIMIT {sample_limit}")
+
+    # INFORMATION_SCHEMA.TABLES.ROW_COUNT, when the caller has it, saves a query.
+    if row_count is None and mode in {"auto", "sampled"}:
+        row_count_sql = f"SELECT COUNT(*) AS ROW_COUNT FROM {table_fqn}"
+        row_count = int(client.execute_arrow(row_count_sql).value("ROW_COUNT"))
+    mode = resolve_mode(mode, row_count or 0, approx_row_threshold)
 
+    # A budget plan may pick a different tier per column; each tier is
+    # profiled as its own group.
+    column_modes = plan.modes() if plan is not None else {}
+    groups: dict[str, list[ColumnInfo]] = {}
+    for column in columns:
+        groups.setdefault(column_modes.get(column.name, mode), []).append(column)
+
+    by_name: dict[str, ColumnProfile] = {}
+    for group_mode, group in groups.items():
+        group_row_count, profiles = _profile_columns(
+            client,
+            table_fqn,
+            group,
+            group_mode,
+            top_k,
+            batch_size,
+            max_sql_length,
+            row_count=row_count,
+            target_sample_rows=target_sample_rows,
+            sample_method=sample_method,
+        )
+        by_name.update((profile.name, profile) for profile in profiles)
+    table_profile = TableProfile(
+        table_fqn=table_fqn,
+        row_count=group_row_count if groups else row_count or 0,
+        columns=[by_name[column.name] for column in columns],
+    )
+    return table_profile, sample_future.result()
+
+
+def refine_profile(
+    client: SnowflakeClient,
+    table_profile: TableProfile,
+    columns: list[ColumnInfo],
+    keep: list[str],
+    mode: str = "exact",
+    top_k: int = 5,
+    batch_size: int = WIDE_BATCH_SIZE,
+    max_sql_length: int = MAX_SQL_LENGTH,
+) -> TableProfile:
+    # Re-profiles at full precision only the columns the human kept.
+    keep_set = {name.lower() for name in keep}
+    targets = [column for column in columns if column.name.lower() in keep_set]
+    if not targets:
+        return table_profile
+    row_count, refined = _profile_columns(
+        client,
+        table_profile.table_fqn,
+        targets,
+        mode,
+        top_k,
+        batch_size,
+        max_sql_length,
+    )
+    by_name = {profile.name: profile for profile in refined}
+    return TableProfile(
+        table_fqn=table_profile.table_fqn,
+        row_count=row_count,
+        columns=[by_name.get(column.name, column) for column in table_profile.columns],
+    )
+
+
+def _epoch(value: Any) -> float:
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=UTC)
+        return value.timestamp()
+    if isinstance(value, date):
+        return float(calendar.timegm(value.timetuple()))
+    return float(value)
+
+
+def _from_epoch(column: ColumnInfo, value: Any) -> Any:
+    if value is None or not _is_date(column.data_type):
+        return value
+    moment = datetime.fromtimestamp(float(value), UTC)
+    upper = column.data_type.upper()
+    if upper == "DATE":
+        return moment.date()
+    if "NTZ" in upper or "TZ" not in upper:
+        return moment.replace(tzinfo=None)
+    return moment
+
+
+def _distribution_selects(
+    index: int,
+    column: ColumnInfo,
+    low: float,
+    high: float,
+    quantiles: tuple[float, ...],
+    buckets: int,
+) -> list[str]:
+    # Dates are bucketed on epoch seconds so one code path serves both.
+    expr = quote_ident(column.name)
+    if _is_date(column.data_type):
+        expr = f"DATE_PART(EPOCH_SECOND, {expr})"
+    selects = [
+        f"APPROX_PERCENTILE({expr}, {quantile}) "
+        f"AS {_alias(index, f'Q{round(quantile * 1000)}')}"
+        for quantile in quantiles
+    ]
+    if high > low:
+        # WIDTH_BUCKET puts values below low in bucket 0 and the maximum itself
+        # in bucket buckets + 1; both ends are folded into the outer buckets,
+        # so a stale profile's bounds do not drop rows.
+        width_bucket = f"WIDTH_BUCKET({expr}, {low!r}, {high!r}, {buckets})"
+        for bucket in range(1, buckets + 1):
+            if buckets == 1:
+                condition = f"{expr} IS NOT NULL"
+            elif bucket == 1:
+                condition = f"{width_bucket} <= 1"
+            elif bucket == buckets:
+                condition = f"{width_bucket} >= {bucket}"
+            else:
+                condition = f"{width_bucket} = {bucket}"
+            selects.append(f"COUNT_IF({condition}) AS {_alias(index, f'B{bucket}')}")
+    return selects
+
+
+def distribution_columns(
+    table_profile: TableProfile, columns: list[ColumnInfo], keep: list[str]
+) -> list[ColumnInfo]:
+    # A sampled profile's min and max are only the sample's, so histograms
+    # are not drawn over them.
+    keep_set = {name.lower() for name in keep}
+    profiles = {profile.name: profile for profile in table_profile.columns}
+    return [
+        column
+        for column in columns
+        if column.name.lower() in keep_set
+        and _has_min_max(column)
+        and column.name in profiles
+        and profiles[column.name].precision != "sampled"
+        and profiles[column.name].min_value is not None
+        and profiles[column.name].max_value is not None
+    ]
+
+
+def profile_distributions(
+    client: SnowflakeClient,
+    table_profile: TableProfile,
+    columns: list[ColumnInfo],
+    keep: list[str],
+    quantiles: tuple[float, ...] = DISTRIBUTION_QUANTILES,
+    buckets: int = HISTOGRAM_BUCKETS,
+    batch_size: int = WIDE_BATCH_SIZE,
+    max_sql_length: int = MAX_SQL_LENGTH,
+) -> TableProfile:
+    profiles = {profile.name: profile for profile in table_profile.columns}
+    targets = distribution_columns(table_profile, columns, keep)
+    if not targets:
+        return table_profile
+    bounds = {
+        column.name: (
+            _epoch(profiles[column.name].min_value),
+            _epoch(profiles[column.name].max_value),
+        )
+        for column in targets
+    }
+
+    # Quantiles and histograms for every target share a few wide scans.
+    batches = _batch_selects(
+        targets,
+        lambda index, column: _distribution_selects(
+            index, column, *bounds[column.name], quantiles, buckets
+        ),
+        batch_size,
+        max_sql_length,
+    )
+    results = client.execute_many(_wide_sqls(table_profile.table_fqn, batches))
+
+    distributions: dict[str, Distribution] = {}
+    for batch, result in zip(batches, results, strict=True):
+        for index, column, _ in batch:
+            low, high = bounds[column.name]
+            counts = []
+            if high > low:
+                counts = [
+                    int(result.value(_alias(index, f"B{bucket}")))
+                    for bucket in range(1, buckets + 1)
+                ]
+            distributions[column.name] = Distribution(
+                quantiles=[
+                    (
+                        quantile,
+                        _from_epoch(
+                            column,
+                            result.value(_alias(index, f"Q{round(quantile * 1000)}")),
+                        ),
+                    )
+                    for quantile in quantiles
+                ],
+                low=profiles[column.name].min_value,
+                high=profiles[column.name].max_value,
+                counts=counts,
+            )
+    return replace(
+        table_profile,
+        columns=[
+            (
+                replace(profile, distribution=distributions[profile.name])
+                if profile.name in distributions
+                else profile
+            )
+            for profile in table_profile.columns
+        ],
+    )
+
+
+def _watermark_literal(value: Any) -> str:
+    if isinstance(value, int | float | Decimal):
+        return str(value)
+    if hasattr(value, "isoformat"):
+        value = value.isoformat()
+    return quote_literal(str(value))
+
+
+def _incremental_selects(index: int, column: ColumnInfo) -> list[str]:
+    col_ident = quote_ident(column.name)
+    selects = [
+        f"COUNT({col_ident}) AS {_alias(index, 'NON_NULL')}",
+        f"HLL_EXPORT(HLL_ACCUMULATE({col_ident})) AS {_alias(index, 'HLL')}",
+        f"APPROX_TOP_K({col_ident}, {TOP_K_CAPACITY}) AS {_alias(index, 'TOP')}",
+    ]
+    if _has_min_max(column):
+        selects.append(f"MIN({col_ident}) AS {_alias(index, 'MIN')}")
+        selects.append(f"MAX({col_ident}) AS {_alias(index, 'MAX')}")
+    return selects
+
+
+def _column_state(index: int, column: ColumnInfo, result: QueryResult) -> ColumnState:
+    top = TopKCounter(capacity=TOP_K_CAPACITY)
+    for value, count in _parse_top_k(result.value(_alias(index, "TOP"))):
+        top.add(value, count)
+    has_min_max = _has_min_max(column)
+    return ColumnState(
+        name=column.name,
+        data_type=column.data_type,
+        total_count=int(result.value("TOTAL_COUNT")),
+        non_null_count=int(result.value(_alias(index, "NON_NULL"))),
+        min_value=result.value(_alias(index, "MIN")) if has_min_max else None,
+        max_value=result.value(_alias(index, "MAX")) if has_min_max else None,
+        hll=HyperLogLog.from_export(result.value(_alias(index, "HLL"))),
+        top=top,
+    )
+
+
+def _state_profile(state: ColumnState, top_k: int) -> ColumnProfile:
+    return ColumnProfile(
+        name=state.name,
+        data_type=state.data_type,
+        total_count=state.total_count,
+        null_count=state.total_count - state.non_null_count,
+        distinct_count=min(state.hll.estimate(), state.non_null_count),
+        min_value=state.min_value,
+        max_value=state.max_value,
+        top_values=state.top.top(top_k),
+        precision="incremental",
+        distinct_error=HLL_RELATIVE_ERROR,
+    )
+
+
+def profile_table_incremental(
+    client: SnowflakeClient,
+    table: TableConfig,
+    columns: list[ColumnInfo],
+    store: IncrementalStore,
+    watermark_column: str,
+    sample_limit: int = 50,
+    top_k: int = 5,
+    batch_size: int = WIDE_BATCH_SIZE,
+    max_sql_length: int = MAX_SQL_LENGTH,
+) -> tuple[TableProfile, QueryResult]:
+    if not column_in_table(columns, watermark_column):
+        raise ValueError(f"Watermark column not found: {watermark_column}")
+    table_fqn = qualify_table(table.database, table.schema, table.table)
+    wm_ident = quote_ident(watermark_column)
+
+    state = store.load(table_fqn)
+    if (
+        state is None
+        or state.watermark_column != watermark_column
+        or (state.columns and not state.matches(columns))
+    ):
+        state = IncrementalState(table_fqn=table_fqn, watermark_column=watermark_column)
+
+    # Pin the upper bound first so every batch sees the same slice of rows.
+    watermark_sql = f"SELECT MAX({wm_ident}) AS WATERMARK FROM {table_fqn}"
+    new_watermark = client.execute_arrow(watermark_sql).value("WATERMARK")
     sample_sql = f"SELECT * FROM {table_fqn} LIMIT {sample_limit}"
-    sample_rows = client.execute_query(sample_sql)
 
+    has_new_rows = new_watermark is not None and (
+        state.watermark is None or new_watermark > state.watermark
+    )
+    if state.columns and not has_new_rows:
+        sample_rows = client.execute_arrow(sample_sql)
+    else:
+        if state.watermark is not None:
+            where = (
+                f"{wm_ident} > {_watermark_literal(state.watermark)} "
+                f"AND {wm_ident} <= {_watermark_literal(new_watermark)}"
+            )
+        elif new_watermark is not None:
+            where = (
+                f"{wm_ident} <= {_watermark_literal(new_watermark)} "
+                f"OR {wm_ident} IS NULL"
+            )
+        else:
+            where = ""
+        batches = _batch_selects(
+            columns, _incremental_selects, batch_size, max_sql_length
+        )
+        wide_sqls = _wide_sqls(table_fqn, batches, where)
+        results = client.execute_many([*wide_sqls, sample_sql])
+        sample_rows = results[-1]
+
+        new_states: dict[int, ColumnState] = {}
+        for batch, result in zip(batches, results[:-1], strict=True):
+            for index, column, _ in batch:
+                new_states[index] = _column_state(index, column, result)
+        if state.columns:
+            for index, column_state in enumerate(state.columns):
+                column_state.merge(new_states[index])
+        else:
+            state.columns = [new_states[index] for index in range(len(columns))]
+        state.watermark = new_watermark
+        store.save(state)
+
+    row_count = state.columns[0].total_count if state.columns else 0
     table_profile = TableProfile(
-        table_fqn=table_fqn, row_count=row_count, columns=profiles
+        table_fqn=table_fqn,
+        row_count=row_count,
+        columns=[_state_profile(column_state, top_k) for column_state in state.columns],
     )
     return table_profile, sample_rows
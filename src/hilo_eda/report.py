@@ -1,9 +1,148 @@
 from __future__ import annotations
 
 import csv
+import json
+import math
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict
 from pathlib import Path
+from typing import Any, TextIO
 
-from hilo_eda.models import EDAQueryResult, HumanSelections, InferenceResult, TableProfile
+from hilo_eda.models import (
+    ColumnProfile,
+    Distribution,
+    EDAQueryResult,
+    HumanSelections,
+    InferenceResult,
+    TableProfile,
+)
+from hilo_eda.planner import ProfilePlan
+from hilo_eda.tracing import Tracer
+
+
+def _format_interval(interval: tuple[int, int] | None) -> str:
+    if interval is None:
+        return ""
+    return f"{interval[0]}-{interval[1]}"
+
+
+def _format_distinct(column: ColumnProfile) -> str:
+    if not column.has_distinct:
+        return "pending"
+    if column.distinct_count_ci is not None:
+        return (
+            f"~{column.distinct_count} ({_format_interval(column.distinct_count_ci)})"
+        )
+    if column.is_approximate:
+        return f"~{column.distinct_count} (±{column.distinct_error:.1%})"
+    return str(column.distinct_count)
+
+
+SPARK_BLOCKS = "▁▂▃▄▅▆▇█"
+
+
+def _format_quantiles(distribution: Distribution) -> str:
+    return "; ".join(
+        f"p{quantile * 100:g}={value}" for quantile, value in distribution.quantiles
+    )
+
+
+def _sparkline(counts: list[int]) -> str:
+    peak = max(counts, default=0)
+    if peak == 0:
+        return ""
+    top = len(SPARK_BLOCKS) - 1
+    return "".join(SPARK_BLOCKS[round(count / peak * top)] for count in counts)
+
+
+def _format_column(column: ColumnProfile) -> str:
+    line = (
+        f"- **{column.name}** ({column.data_type}): "
+        f"null % {column.null_pct:.2%}, distinct {_format_distinct(column)}"
+    )
+    if column.null_count_ci is not None:
+        line += f", nulls {_format_interval(column.null_count_ci)}"
+    if column.median_value is not None:
+        line += f", median ~{column.median_value}"
+    if column.sample_fraction is not None:
+        line += f", sampled {column.sample_fraction:.2%}"
+    distribution = column.distribution
+    if distribution is not None:
+        line += f"\n  - quantiles: {_format_quantiles(distribution)}"
+        if distribution.counts:
+            line += (
+                f"\n  - histogram {distribution.low} .. {distribution.high}: "
+                f"`{_sparkline(distribution.counts)}` "
+                f"({', '.join(str(count) for count in distribution.counts)})"
+            )
+    return line + "\n"
+
+
+# Past this many columns the Markdown report lists the first ones only and
+# points at the HTML/JSON reports, which page through all of them.
+MARKDOWN_COLUMN_LIMIT = 500
+MARKDOWN_SQL_LENGTH = 4_000
+QUERY_PREVIEW_ROWS = 20
+
+
+def _assumption_lines(human: HumanSelections) -> Iterator[str]:
+    yield "## Assumptions\n"
+    yield f"- Identifier: {human.identifier}\n"
+    yield f"- Time column: {human.time_column}\n"
+    yield f"- Status column: {human.status_column}\n"
+    yield f"- Ignored columns: {', '.join(human.ignore_columns) or 'None'}\n"
+    yield f"- EDA direction: {human.eda_direction}\n"
+
+
+def _profile_lines(table_profile: TableProfile) -> Iterator[str]:
+    yield "## Column Profiles\n"
+    if any(column.is_approximate for column in table_profile.columns):
+        yield (
+            "Values marked ~ are estimates. Null ranges are 95% confidence "
+            "bounds; distinct ranges are heuristic bounds, from the distinct "
+            "values seen in the sample up to that count scaled to the table.\n"
+        )
+    for column in table_profile.columns[:MARKDOWN_COLUMN_LIMIT]:
+        yield _format_column(column)
+    hidden = len(table_profile.columns) - MARKDOWN_COLUMN_LIMIT
+    if hidden > 0:
+        yield (
+            f"{hidden} more columns are listed in eda_report.html "
+            "and eda_report.json.\n"
+        )
+
+
+def _inference_lines(inferences: list[InferenceResult]) -> Iterator[str]:
+    yield "\n## Behavioral Inference\n"
+    for inference in inferences:
+        yield (
+            f"- **{inference.column}**: {inference.behavior_class} "
+            f"(confidence {inference.confidence:.2f}) — {inference.rationale}\n"
+        )
+
+
+def _sql_lines(executed_queries: list[EDAQueryResult]) -> Iterator[str]:
+    yield "\n## SQL Executed\n"
+    for result in executed_queries:
+        yield f"### {result.title}\n"
+        if result.source == "profile":
+            yield "Answered from the column profile; no query was run.\n"
+        else:
+            yield "```sql\n"
+            if len(result.sql) > MARKDOWN_SQL_LENGTH:
+                yield result.sql[:MARKDOWN_SQL_LENGTH]
+                yield "-- truncated; full SQL in eda_report.json"
+            else:
+                yield result.sql
+            yield "\n```\n"
+        yield f"Rows returned: {result.rows.num_rows}\n"
+
+
+def _correlation_lines(correlations: list[tuple[str, str, float]]) -> Iterator[str]:
+    yield "\n## Top Correlations\n"
+    yield "Full matrix in the correlation_matrix artifact.\n"
+    for column_a, column_b, value in correlations:
+        yield f"- **{column_a}** vs **{column_b}**: {value:+.3f}"
 
 
 def write_markdown_report(
@@ -12,49 +151,214 @@ def write_markdown_report(
     inferences: list[InferenceResult],
     human: HumanSelections,
     executed_queries: list[EDAQueryResult],
+    tracer: Tracer | None = None,
+    plan: ProfilePlan | None = None,
+    correlations: list[tuple[str, str, float]] | None = None,
 ) -> None:
-    lines: list[str] = []
-    lines.append(f"# EDA Report: {table_profile.table_fqn}\n")
-    lines.append("## Assumptions\n")
-    lines.append(f"- Identifier: {human.identifier}\n")
-    lines.append(f"- Time column: {human.time_column}\n")
-    lines.append(f"- Status column: {human.status_column}\n")
-    lines.append(f"- Ignored columns: {', '.join(human.ignore_columns) or 'None'}\n")
-    lines.append(f"- EDA direction: {human.eda_direction}\n")
-
-    lines.append("## Column Profiles\n")
-    for column in table_profile.columns:
-        lines.append(
-            f"- **{column.name}** ({column.data_type}): "
-            f"null % {column.null_pct:.2%}, distinct {column.distinct_count}\n"
-        )
+    sections: list[Iterable[str]] = [
+        [f"# EDA Report: {table_profile.table_fqn}\n"],
+        _assumption_lines(human),
+        _profile_lines(table_profile),
+        _inference_lines(inferences),
+        _sql_lines(executed_queries),
+    ]
+    if correlations:
+        sections.append(_correlation_lines(correlations))
+    if plan is not None:
+        sections.append(_plan_lines(plan))
+    if tracer is not None and tracer.queries:
+        sections.append(_trace_lines(tracer))
 
-    lines.append("\n## Behavioral Inference\n")
-    for inference in inferences:
-        lines.append(
-            f"- **{inference.column}**: {inference.behavior_class} "
-            f"(confidence {inference.confidence:.2f}) — {inference.rationale}\n"
-        )
+    # Sections are generators, so lines go to disk as they are formatted.
+    with output_path.open("w", encoding="utf-8") as handle:
+        for section in sections:
+            for line in section:
+                handle.write(line)
+                handle.write("\n")
 
-    lines.append("\n## SQL Executed\n")
-    for result in executed_queries:
-        lines.append(f"### {result.title}\n")
-        lines.append("```sql\n")
-        lines.append(result.sql)
-        lines.append("\n```\n")
-        lines.append(f"Rows returned: {len(result.rows)}\n")
 
-    output_path.write_text("\n".join(lines), encoding="utf-8")
+def _json_value(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    return str(value)
+
+
+def column_record(column: ColumnProfile) -> dict[str, Any]:
+    distribution = column.distribution
+    return {
+        "name": column.name,
+        "data_type": column.data_type,
+        "total_count": column.total_count,
+        "null_count": column.null_count,
+        "null_pct": column.null_pct,
+        "distinct_count": column.distinct_count if column.has_distinct else None,
+        "min_value": _json_value(column.min_value),
+        "max_value": _json_value(column.max_value),
+        "median_value": _json_value(column.median_value),
+        "top_values": [
+            [_json_value(value), count] for value, count in column.top_values
+        ],
+        "precision": column.precision,
+        "null_count_ci": column.null_count_ci,
+        "distinct_count_ci": column.distinct_count_ci,
+        "sample_fraction": column.sample_fraction,
+        "quantiles": (
+            None
+            if distribution is None
+            else [[q, _json_value(value)] for q, value in distribution.quantiles]
+        ),
+        "histogram": (
+            None
+            if distribution is None
+            else {
+                "low": _json_value(distribution.low),
+                "high": _json_value(distribution.high),
+                "counts": distribution.counts,
+            }
+        ),
+    }
+
 
+def inference_record(inference: InferenceResult) -> dict[str, Any]:
+    return {
+        "column": inference.column,
+        "behavior_class": inference.behavior_class,
+        "confidence": inference.confidence,
+        "rationale": inference.rationale,
+        "pattern": inference.pattern,
+    }
 
-def write_csv_outputs(
-    output_dir: Path,
+
+def query_record(
+    result: EDAQueryResult, preview_rows: int = QUERY_PREVIEW_ROWS
+) -> dict[str, Any]:
+    preview = result.rows.table.slice(0, preview_rows).to_pylist()
+    return {
+        "title": result.title,
+        "source": result.source,
+        "rows": result.rows.num_rows,
+        "columns": result.rows.column_names,
+        "preview": [[_json_value(value) for value in row.values()] for row in preview],
+        "sql": result.sql,
+    }
+
+
+def plan_records(plan: ProfilePlan) -> Iterator[dict[str, Any]]:
+    for label, column_plans in (("first", plan.columns), ("refine", plan.refined)):
+        for item in column_plans:
+            yield {
+                "column": item.column,
+                "pass": label,
+                "mode": item.mode,
+                "estimated_bytes": item.estimated_bytes,
+            }
+
+
+def _write_json_object(handle: TextIO, fields: list[tuple[str, Any]]) -> None:
+    # Iterator values become arrays written one element at a time, so the
+    # column list is never held as a single JSON string.
+    handle.write("{")
+    for index, (key, value) in enumerate(fields):
+        handle.write(f"{',' if index else ''}\n  {json.dumps(key)}: ")
+        if isinstance(value, Iterator):
+            handle.write("[")
+            for position, item in enumerate(value):
+                handle.write(f"{',' if position else ''}\n    ")
+                handle.write(json.dumps(item, default=str))
+            handle.write("\n  ]")
+        else:
+            handle.write(json.dumps(value, default=str))
+    handle.write("\n}")
+
+
+def write_json_report(
+    output_path: Path,
     table_profile: TableProfile,
-    sample_rows: list[dict[str, object]],
+    inferences: list[InferenceResult],
+    human: HumanSelections,
+    executed_queries: list[EDAQueryResult],
+    tracer: Tracer | None = None,
+    plan: ProfilePlan | None = None,
+    correlations: list[tuple[str, str, float]] | None = None,
 ) -> None:
-    output_dir.mkdir(parents=True, exist_ok=True)
+    fields: list[tuple[str, Any]] = [
+        ("table_fqn", table_profile.table_fqn),
+        ("row_count", table_profile.row_count),
+        ("assumptions", asdict(human)),
+        ("columns", map(column_record, table_profile.columns)),
+        ("inferences", map(inference_record, inferences)),
+        ("queries", map(query_record, executed_queries)),
+        ("correlations", [list(pair) for pair in correlations or []]),
+        (
+            "plan",
+            (
+                None
+                if plan is None
+                else {
+                    "budget_remaining_bytes": plan.budget_remaining_bytes,
+                    "estimated_bytes": plan.estimated_bytes,
+                    "columns": list(plan_records(plan)),
+                    "skipped_queries": plan.skipped_queries,
+                }
+            ),
+        ),
+        (
+            "trace",
+            (
+                None
+                if tracer is None
+                else [asdict(summary) for summary in tracer.summary()]
+            ),
+        ),
+    ]
+    with output_path.open("w", encoding="utf-8") as handle:
+        _write_json_object(handle, fields)
+        handle.write("\n")
+
 
-    profile_path = output_dir / "column_profiles.csv"
+def _plan_lines(plan: ProfilePlan) -> list[str]:
+    lines = ["\n## Scan Plan\n"]
+    lines.append(
+        f"Budget remaining at planning: {plan.budget_remaining_bytes} bytes; "
+        f"estimated scan: {plan.estimated_bytes} bytes.\n"
+    )
+    if plan.columns or plan.refined:
+        lines.append("| Column | Pass | Mode | Estimated bytes |")
+        lines.append("|---|---|---|---|")
+    for label, column_plans in (("first", plan.columns), ("refine", plan.refined)):
+        for item in column_plans:
+            lines.append(
+                f"| {item.column} | {label} | {item.mode} | {item.estimated_bytes} |"
+            )
+    if plan.skipped_queries:
+        lines.append("\nSkipped over budget:\n")
+        lines.extend(f"- {title}" for title in plan.skipped_queries)
+    return lines
+
+
+def _trace_lines(tracer: Tracer) -> list[str]:
+    lines = ["\n## Query Trace\n"]
+    lines.append("Full per-query timings are in trace.json (Chrome trace format).\n")
+    lines.append("| Stage | Queries | Wall s | Rows | Bytes fetched | Bytes scanned |")
+    lines.append("|---|---|---|---|---|---|")
+    for summary in tracer.summary():
+        lines.append(
+            f"| {summary.stage} | {summary.queries} | {summary.wall_seconds:.2f} "
+            f"| {summary.rows} | {summary.bytes_fetched} | {summary.bytes_scanned} |"
+        )
+    lines.append("\nSlowest queries:\n")
+    for record in tracer.slowest():
+        preview = " ".join(record.sql.split())[:80]
+        lines.append(
+            f"- {record.wall_seconds:.2f}s [{record.stage}] "
+            f"{record.query_id or 'cached'}: `{preview}`"
+        )
+    return lines
+
+
+def write_profile_csv(profile_path: Path, table_profile: TableProfile) -> None:
     with profile_path.open("w", newline="", encoding="utf-8") as handle:
         writer = csv.DictWriter(
             handle,
@@ -67,6 +371,13 @@ def write_csv_outputs(
                 "distinct_count",
                 "min_value",
                 "max_value",
+                "median_value",
+                "precision",
+                "null_count_ci",
+                "distinct_count_ci",
+                "sample_fraction",
+                "quantiles",
+                "histogram",
             ],
         )
         writer.writeheader()
@@ -78,16 +389,40 @@ def write_csv_outputs(
                     "total_count": profile.total_count,
                     "null_count": profile.null_count,
                     "null_pct": f"{profile.null_pct:.4f}",
-                    "distinct_count": profile.distinct_count,
+                    "distinct_count": (
+                        profile.distinct_count if profile.has_distinct else None
+                    ),
                     "min_value": profile.min_value,
                     "max_value": profile.max_value,
+                    "median_value": profile.median_value,
+                    "precision": profile.precision,
+                    "null_count_ci": _format_interval(profile.null_count_ci),
+                    "distinct_count_ci": _format_interval(profile.distinct_count_ci),
+                    "sample_fraction": profile.sample_fraction,
+                    "quantiles": (
+                        _format_quantiles(profile.distribution)
+                        if profile.distribution is not None
+                        else None
+                    ),
+                    "histogram": (
+                        " ".join(str(count) for count in profile.distribution.counts)
+                        if profile.distribution is not None
+                        else None
+                    ),
                 }
             )
 
-    if sample_rows:
-        sample_path = output_dir / "sample_rows.csv"
-        fieldnames = list(sample_rows[0].keys())
-        with sample_path.open("w", newline="", encoding="utf-8") as handle:
-            writer = csv.DictWriter(handle, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(sample_rows)
+
+def write_index(
+    output_path: Path,
+    schema_fqn: str,
+    entries: list[tuple[str, Path | None, str]],
+) -> None:
+    lines: list[str] = [f"# EDA Index: {schema_fqn}\n"]
+    for name, report_path, summary in entries:
+        if report_path is None:
+            lines.append(f"- **{name}**: {summary}")
+            continue
+        link = report_path.relative_to(output_path.parent).as_posix()
+        lines.append(f"- [{name}]({link}): {summary}")
+    output_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import pyarrow as pa
+
+
+@dataclass(frozen=True)
+class QueryResult:
+    table: pa.Table
+
+    @classmethod
+    def from_rows(cls, rows: list[dict[str, Any]]) -> QueryResult:
+        return cls(pa.Table.from_pylist(rows))
+
+    @property
+    def column_names(self) -> list[str]:
+        return self.table.column_names
+
+    @property
+    def num_rows(self) -> int:
+        return self.table.num_rows
+
+    @property
+    def nbytes(self) -> int:
+        return self.table.nbytes
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        # Row dicts are built one record batch at a time, only when asked for.
+        for batch in self.table.to_batches():
+            yield from batch.to_pylist()
+
+    def column(self, name: str) -> list[Any]:
+        return self.table.column(name).to_pylist()
+
+    def value(self, name: str, index: int = 0) -> Any:
+        return self.table.column(name)[index].as_py()
+
+    def first(self) -> dict[str, Any]:
+        return self.table.slice(0, 1).to_pylist()[0]
+
+    def to_pylist(self) -> list[dict[str, Any]]:
+        return self.table.to_pylist()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import dataclass, field
+from typing import Any
+
+HLL_PRECISION = 12
+
+
+@dataclass
+class HyperLogLog:
+    precision: int = HLL_PRECISION
+    registers: bytearray = field(default_factory=bytearray)
+
+    def __post_init__(self) -> None:
+        if not self.registers:
+            self.registers = bytearray(1 << self.precision)
+
+    @classmethod
+    def from_export(cls, exported: Any) -> HyperLogLog:
+        # Accepts the OBJECT produced by Snowflake's HLL_EXPORT, either as a
+        # dict or as its JSON text. NULL (no rows accumulated) is an empty sketch.
+        if isinstance(exported, str):
+            exported = json.loads(exported)
+        if not exported:
+            return cls()
+        sketch = cls(precision=int(exported.get("precision", HLL_PRECISION)))
+        if "dense" in exported:
+            sketch.registers = bytearray(exported["dense"])
+        else:
+            sparse = exported.get("sparse", {})
+            for index, count in zip(
+                sparse.get("indices", []), sparse.get("maxLzCounts", []), strict=True
+            ):
+                sketch.registers[index] = max(sketch.registers[index], count)
+        return sketch
+
+    def merge(self, other: HyperLogLog) -> None:
+        if other.precision != self.precision:
+            raise ValueError(
+                "Cannot merge HyperLogLog sketches of different precision."
+            )
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def estimate(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / sum(2.0**-register for register in self.registers)
+        zeros = self.registers.count(0)
+        if raw <= 2.5 * m and zeros:
+            return round(m * math.log(m / zeros))
+        return round(raw)
+
+
+@dataclass
+class TopKCounter:
+    capacity: int
+    counts: dict[str, tuple[Any, int]] = field(default_factory=dict)
+
+    def add(self, value: Any, count: int) -> None:
+        key = json.dumps(value, sort_keys=True, default=str)
+        _, current = self.counts.get(key, (value, 0))
+        self.counts[key] = (value, current + count)
+
+    def merge(self, other: TopKCounter) -> None:
+        for value, count in other.counts.values():
+            self.add(value, count)
+        self._truncate()
+
+    def top(self, k: int) -> list[tuple[Any, int]]:
+        return sorted(self.counts.values(), key=lambda item: item[1], reverse=True)[:k]
+
+    def _truncate(self) -> None:
+        if len(self.counts) > self.capacity:
+            kept = self.top(self.capacity)
+            self.counts = {}
+            for value, count in kept:
+                self.add(value, count)
@@ -1,19 +1,85 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import contextvars
+import random
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field
 from typing import Any
 
 import snowflake.connector
+from snowflake.connector.constants import QueryStatus
+from snowflake.connector.errors import Error, InterfaceError, OperationalError
 
+from hilo_eda.cache import QueryResultCache
+from hilo_eda.concurrency import AimdLimiter
 from hilo_eda.config import SnowflakeConfig
-from hilo_eda.sql_safety import ensure_select_only
+from hilo_eda.results import QueryResult
+from hilo_eda.sql_safety import ensure_select_only, quote_literal
+from hilo_eda.tracing import current_tracer
+
+# Network and session faults; SQL and permission errors are not retried.
+RETRYABLE_ERRORS = (OperationalError, InterfaceError)
+RETRY_BASE_SECONDS = 0.5
+RETRY_MAX_SECONDS = 30.0
+POLL_INITIAL_SECONDS = 0.05
+POLL_MAX_SECONDS = 1.0
+
+
+def backoff_seconds(attempt: int) -> float:
+    # Full jitter: concurrent workers retrying the same outage spread out
+    # instead of hitting the warehouse again in lockstep.
+    return random.uniform(0, min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * 2**attempt))
+
+
+@dataclass
+class QueryCounters:
+    queries: int = 0
+    retries: int = 0
+    timeouts: int = 0
+    cancelled: int = 0
+    failed: int = 0
+
+
+@dataclass
+class _Submission:
+    generation: int
+    cancelled: bool = False
+    query_id: str | None = None
 
 
 @dataclass
 class SnowflakeClient:
     config: SnowflakeConfig
+    result_cache: QueryResultCache | None = None
+    counters: QueryCounters = field(default_factory=QueryCounters)
 
     def __post_init__(self) -> None:
+        if self.config.max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        if self.config.max_retries < 0:
+            raise ValueError("max_retries cannot be negative.")
+        session_parameters = {}
+        if self.config.query_timeout_seconds is not None:
+            # Server-side backstop for statements this process can no longer
+            # cancel, e.g. after it is killed.
+            session_parameters["STATEMENT_TIMEOUT_IN_SECONDS"] = (
+                self.config.query_timeout_seconds
+            )
+        self._lock = threading.Lock()
+        self._deadline: float | None = None
+        # Bumped by cancel_running and close; work sent under an older
+        # generation is dropped before it reaches the warehouse.
+        self._generation = 0
+        self._running: set[str] = set()
+        self._pending: dict[Future[QueryResult], _Submission] = {}
+        self.limiter = AimdLimiter(
+            self.config.max_concurrency,
+            1 if self.config.adaptive_concurrency else self.config.max_concurrency,
+        )
         self._connection = snowflake.connector.connect(
             account=self.config.account,
             user=self.config.user,
@@ -22,13 +88,234 @@ class SnowflakeClient:
             database=self.config.database,
             schema=self.config.schema,
             role=self.config.role,
+            session_parameters=session_parameters,
         )
+        if self.result_cache is None and self.config.result_cache_bytes > 0:
+            self.result_cache = QueryResultCache(self.config.result_cache_bytes)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.config.max_concurrency,
+            thread_name_prefix="hilo-eda-query",
+        )
+
+    def execute_arrow(self, sql: str) -> QueryResult:
+        return self._execute(sql, _Submission(self._generation))
+
+    def _execute(self, sql: str, submission: _Submission) -> QueryResult:
+        ensure_select_only(sql)
+        tracer = current_tracer()
+        start = time.perf_counter()
+        cache = self.result_cache
+        key = cache.key_for(sql) if cache is not None else None
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                if tracer is not None:
+                    tracer.record_query(
+                        sql, None, start, cached.num_rows, 0, cached=True
+                    )
+                return cached
+        result, query_id = self._fetch_with_retry(sql, submission)
+        if tracer is not None:
+            tracer.record_query(sql, query_id, start, result.num_rows, result.nbytes)
+        if key is not None:
+            cache.put(key, result)
+        return result
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self.counters, name, getattr(self.counters, name) + 1)
+
+    def _timeout(self) -> float | None:
+        timeouts = []
+        if self.config.query_timeout_seconds is not None:
+            timeouts.append(float(self.config.query_timeout_seconds))
+        if self._deadline is not None:
+            timeouts.append(self._deadline - time.monotonic())
+        if not timeouts:
+            return None
+        if min(timeouts) <= 0:
+            self._count("timeouts")
+            raise TimeoutError("Run timeout reached; no further queries are sent.")
+        return min(timeouts)
+
+    def _cancelled(self, submission: _Submission) -> bool:
+        return submission.cancelled or submission.generation != self._generation
+
+    def _fetch_with_retry(
+        self, sql: str, submission: _Submission
+    ) -> tuple[QueryResult, str | None]:
+        attempt = 0
+        while True:
+            try:
+                return self._fetch_arrow(sql, submission)
+            except CancelledError:
+                raise
+            except RETRYABLE_ERRORS:
+                if attempt >= self.config.max_retries:
+                    self._count("failed")
+                    raise
+                self._count("retries")
+                time.sleep(backoff_seconds(attempt))
+                attempt += 1
+            except Exception:
+                self._count("failed")
+                raise
+
+    def _fetch_arrow(
+        self, sql: str, submission: _Submission
+    ) -> tuple[QueryResult, str | None]:
+        # Worker threads are capped at max_concurrency; the limiter decides
+        # how many of them may have a statement on the warehouse right now.
+        # Workers waiting for a slot are already running futures, which
+        # future.cancel() cannot stop, so they check for cancellation here.
+        started = self.limiter.acquire(lambda: self._cancelled(submission))
+        latency = None
+        queued_seconds = 0.0
+        try:
+            timeout = self._timeout()
+            if self._cancelled(submission):
+                self._count("cancelled")
+                raise CancelledError("Query cancelled before it was sent.")
+            self._count("queries")
+            with self._connection.cursor() as cursor:
+                cursor.execute_async(sql)
+                query_id = cursor.sfqid
+                with self._lock:
+                    self._running.add(query_id)
+                    submission.query_id = query_id
+                    # Cancelled while the statement was being sent.
+                    sent_cancelled = self._cancelled(submission)
+                try:
+                    if sent_cancelled:
+                        self._cancel(query_id)
+                        raise CancelledError(f"Query {query_id} was cancelled.")
+                    queued_seconds = self._wait(query_id, timeout)
+                except (TimeoutError, KeyboardInterrupt, *RETRYABLE_ERRORS):
+                    # Abandoning (or retrying) the statement here would leave
+                    # it running, and billing, on the warehouse.
+                    self._cancel(query_id)
+                    raise
+                finally:
+                    with self._lock:
+                        self._running.discard(query_id)
+                latency = time.monotonic() - started
+                cursor.get_results_from_sfqid(query_id)
+                table = cursor.fetch_arrow_all(force_return_table=True)
+                return QueryResult(table), query_id
+        finally:
+            self.limiter.release(started, latency, queued_seconds)
+
+    def _wait(self, query_id: str, timeout: float | None) -> float:
+        # Returns the time the statement spent in the warehouse queue.
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = POLL_INITIAL_SECONDS
+        queued_seconds = 0.0
+        polled = time.monotonic()
+        while True:
+            status = self._connection.get_query_status_throw_if_error(query_id)
+            now = time.monotonic()
+            if status == QueryStatus.QUEUED:
+                queued_seconds += now - polled
+            polled = now
+            if not self._connection.is_still_running(status):
+                return queued_seconds
+            if deadline is not None and now >= deadline:
+                self._count("timeouts")
+                raise TimeoutError(f"Query {query_id} exceeded {timeout:.0f}s.")
+            time.sleep(delay)
+            delay = min(delay * 2, POLL_MAX_SECONDS)
+
+    def _cancel(self, query_id: str) -> None:
+        self._count("cancelled")
+        # Best effort: a dropped connection cannot cancel anything either.
+        with suppress(Error), self._connection.cursor() as cursor:
+            cursor.execute(f"SELECT SYSTEM$CANCEL_QUERY({quote_literal(query_id)})")
+
+    def cancel(self, future: Future[QueryResult]) -> None:
+        # Stops one submitted query wherever it is: queued in the executor,
+        # waiting for a limiter slot or already on the warehouse.
+        if future.cancel():
+            return
+        with self._lock:
+            submission = self._pending.get(future)
+            if submission is None:
+                return
+            submission.cancelled = True
+            query_id = submission.query_id
+            running = query_id in self._running
+        self.limiter.wake()
+        if running:
+            self._cancel(query_id)
+
+    def cancel_running(self) -> None:
+        with self._lock:
+            self._generation += 1
+            pending = list(self._pending)
+            running = list(self._running)
+        for future in pending:
+            future.cancel()
+        self.limiter.wake()
+        for query_id in running:
+            self._cancel(query_id)
+
+    @contextmanager
+    def run_deadline(self, seconds: float | None) -> Iterator[None]:
+        previous = self._deadline
+        if seconds is not None:
+            self._deadline = time.monotonic() + seconds
+        try:
+            yield
+        finally:
+            self._deadline = previous
+
+    def bytes_scanned(self, query_ids: list[str]) -> dict[str, int]:
+        # Query history is read directly so the lookup itself is not traced.
+        if not query_ids:
+            return {}
+        ids = ", ".join(quote_literal(query_id) for query_id in query_ids)
+        sql = (
+            "SELECT QUERY_ID, BYTES_SCANNED FROM TABLE("
+            "INFORMATION_SCHEMA.QUERY_HISTORY_BY_SESSION(RESULT_LIMIT => 10000)) "
+            f"WHERE QUERY_ID IN ({ids})"
+        )
+        ensure_select_only(sql)
+        result, _ = self._fetch_with_retry(sql, _Submission(self._generation))
+        return {
+            query_id: int(scanned or 0)
+            for query_id, scanned in zip(
+                result.column("QUERY_ID"), result.column("BYTES_SCANNED"), strict=True
+            )
+        }
 
     def execute_query(self, sql: str) -> list[dict[str, Any]]:
+        return self.execute_arrow(sql).to_pylist()
+
+    def submit(self, sql: str) -> Future[QueryResult]:
+        # Validate up front so unsafe SQL fails in the caller, not in a worker,
+        # and carry the caller's tracer and stage over to the worker.
         ensure_select_only(sql)
-        with self._connection.cursor(snowflake.connector.DictCursor) as cursor:
-            cursor.execute(sql)
-            return list(cursor.fetchall())
+        context = contextvars.copy_context()
+        submission = _Submission(self._generation)
+        future = self._executor.submit(context.run, self._execute, sql, submission)
+        with self._lock:
+            self._pending[future] = submission
+        future.add_done_callback(self._forget)
+        return future
+
+    def _forget(self, future: Future[QueryResult]) -> None:
+        with self._lock:
+            self._pending.pop(future, None)
+
+    def execute_many(self, sqls: Iterable[str]) -> list[QueryResult]:
+        futures = [self.submit(sql) for sql in sqls]
+        return [future.result() for future in futures]
+
+    def is_healthy(self) -> bool:
+        return not self._connection.is_closed()
 
     def close(self) -> None:
+        with self._lock:
+            self._generation += 1
+        self.limiter.wake()
+        self._executor.shutdown(wait=True, cancel_futures=True)
         self._connection.close()
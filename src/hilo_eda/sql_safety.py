@@ -29,6 +29,11 @@ def quote_ident(identifier: str) -> str:
     return f'"{escaped}"'
 
 
+def quote_literal(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace("'", "''")
+    return f"'{escaped}'"
+
+
 def qualify_table(database: str, schema: str, table: str) -> str:
     return ".".join(
         [quote_ident(database), quote_ident(schema), quote_ident(table)]
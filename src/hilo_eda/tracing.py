@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any
+
+_TRACER: ContextVar[Tracer | None] = ContextVar("hilo_eda_tracer", default=None)
+_STAGE: ContextVar[str] = ContextVar("hilo_eda_stage", default="unscoped")
+
+SQL_PREVIEW_LENGTH = 200
+
+
+@dataclass(frozen=True)
+class QueryRecord:
+    sql: str
+    stage: str
+    query_id: str | None
+    start: float
+    wall_seconds: float
+    rows: int
+    bytes_fetched: int
+    thread: str
+    cached: bool = False
+    bytes_scanned: int | None = None
+
+
+@dataclass(frozen=True)
+class SpanRecord:
+    name: str
+    start: float
+    wall_seconds: float
+    thread: str
+
+
+@dataclass(frozen=True)
+class StageSummary:
+    stage: str
+    queries: int
+    wall_seconds: float
+    rows: int
+    bytes_fetched: int
+    bytes_scanned: int
+
+
+@dataclass
+class Tracer:
+    origin: float = field(default_factory=time.perf_counter)
+    queries: list[QueryRecord] = field(default_factory=list)
+    spans: list[SpanRecord] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def record_query(
+        self,
+        sql: str,
+        query_id: str | None,
+        start: float,
+        rows: int,
+        bytes_fetched: int,
+        cached: bool = False,
+    ) -> None:
+        record = QueryRecord(
+            sql=sql,
+            stage=_STAGE.get(),
+            query_id=query_id,
+            start=start - self.origin,
+            wall_seconds=time.perf_counter() - start,
+            rows=rows,
+            bytes_fetched=bytes_fetched,
+            thread=threading.current_thread().name,
+            cached=cached,
+        )
+        with self._lock:
+            self.queries.append(record)
+
+    def record_span(self, name: str, start: float) -> None:
+        record = SpanRecord(
+            name=name,
+            start=start - self.origin,
+            wall_seconds=time.perf_counter() - start,
+            thread=threading.current_thread().name,
+        )
+        with self._lock:
+            self.spans.append(record)
+
+    def query_ids(self) -> list[str]:
+        return [record.query_id for record in self.queries if record.query_id]
+
+    def attach_bytes_scanned(self, scanned: dict[str, int]) -> None:
+        with self._lock:
+            self.queries = [
+                replace(record, bytes_scanned=scanned.get(record.query_id))
+                for record in self.queries
+            ]
+
+    def summary(self) -> list[StageSummary]:
+        stages: dict[str, list[QueryRecord]] = {}
+        for record in self.queries:
+            stages.setdefault(record.stage, []).append(record)
+        return [
+            StageSummary(
+                stage=stage,
+                queries=len(records),
+                wall_seconds=sum(record.wall_seconds for record in records),
+                rows=sum(record.rows for record in records),
+                bytes_fetched=sum(record.bytes_fetched for record in records),
+                bytes_scanned=sum(record.bytes_scanned or 0 for record in records),
+            )
+            for stage, records in stages.items()
+        ]
+
+    def slowest(self, limit: int = 5) -> list[QueryRecord]:
+        return sorted(self.queries, key=lambda r: r.wall_seconds, reverse=True)[:limit]
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        # Chrome's trace viewer (and Perfetto) want integer thread ids, so
+        # thread names are numbered and announced with metadata events.
+        threads: dict[str, int] = {}
+        events: list[dict[str, Any]] = []
+
+        def tid(name: str) -> int:
+            if name not in threads:
+                threads[name] = len(threads) + 1
+                events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": 1,
+                        "tid": threads[name],
+                        "args": {"name": name},
+                    }
+                )
+            return threads[name]
+
+        for span in self.spans:
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": "stage",
+                    "ph": "X",
+                    "ts": span.start * 1e6,
+                    "dur": span.wall_seconds * 1e6,
+                    "pid": 1,
+                    "tid": tid(span.thread),
+                }
+            )
+        for record in self.queries:
+            events.append(
+                {
+                    "name": record.sql[:SQL_PREVIEW_LENGTH],
+                    "cat": f"query,{record.stage}",
+                    "ph": "X",
+                    "ts": record.start * 1e6,
+                    "dur": record.wall_seconds * 1e6,
+                    "pid": 1,
+                    "tid": tid(record.thread),
+                    "args": {
+                        "query_id": record.query_id,
+                        "stage": record.stage,
+                        "rows": record.rows,
+                        "bytes_fetched": record.bytes_fetched,
+                        "bytes_scanned": record.bytes_scanned,
+                        "cached": record.cached,
+                        "sql": record.sql,
+                    },
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, path: Path) -> None:
+        path.write_text(json.dumps(self.to_chrome_trace(), default=str), "utf-8")
+
+
+def current_tracer() -> Tracer | None:
+    return _TRACER.get()
+
+
+@contextmanager
+def tracing(tracer: Tracer) -> Iterator[Tracer]:
+    token = _TRACER.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _TRACER.reset(token)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    tracer = _TRACER.get()
+    token = _STAGE.set(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _STAGE.reset(token)
+        if tracer is not None:
+            tracer.record_span(name, start)
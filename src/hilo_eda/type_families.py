@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from functools import cache
+
+# Type strings are resolved to a family once; wide tables repeat a handful
+# of types many times over.
+SEMI_STRUCTURED = 0
+BOOLEAN = 1
+TEXT = 2
+DATETIME = 3
+NUMERIC = 4
+OTHER = 5
+
+
+@cache
+def type_family(data_type: str) -> int:
+    # Checked in the same precedence order as the inference rules.
+    dtype = data_type.upper()
+    if "VARIANT" in dtype or "OBJECT" in dtype:
+        return SEMI_STRUCTURED
+    if dtype == "BOOLEAN":
+        return BOOLEAN
+    if "TEXT" in dtype or "CHAR" in dtype or "STRING" in dtype:
+        return TEXT
+    if "DATE" in dtype or "TIMESTAMP" in dtype:
+        return DATETIME
+    if "NUMBER" in dtype or "INT" in dtype or "FLOAT" in dtype:
+        return NUMERIC
+    return OTHER
@@ -0,0 +1,84 @@
+from collections.abc import Callable
+from typing import Any
+
+import pyarrow as pa
+import pytest
+import snowflake.connector
+from snowflake.connector.constants import QueryStatus
+
+import hilo_eda.snowflake as hilo_snowflake
+from hilo_eda.config import SnowflakeConfig
+from hilo_eda.snowflake import SnowflakeClient
+
+
+class FakeCursor:
+    def __init__(self, connection: "FakeConnection") -> None:
+        self.connection = connection
+        self.sql = ""
+        self.sfqid = "01-query"
+
+    def __enter__(self) -> "FakeCursor":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def execute(self, sql: str) -> None:
+        self.connection.executed.append(sql)
+        self.sql = sql
+
+    def execute_async(self, sql: str) -> None:
+        self.execute(sql)
+
+    def get_results_from_sfqid(self, query_id: str) -> None:
+        return None
+
+    def fetch_arrow_all(self, force_return_table: bool = False) -> pa.Table:
+        return pa.table({"SQL": [self.sql]})
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.executed: list[str] = []
+        # Status polls to answer with before each query reports success.
+        self.statuses: list[Any] = []
+
+    def cursor(self, *args: Any) -> FakeCursor:
+        return FakeCursor(self)
+
+    def get_query_status_throw_if_error(self, query_id: str) -> Any:
+        if self.statuses:
+            status = self.statuses.pop(0)
+            if isinstance(status, Exception):
+                raise status
+            return status
+        return QueryStatus.SUCCESS
+
+    @staticmethod
+    def is_still_running(status: Any) -> bool:
+        return status in (QueryStatus.RUNNING, QueryStatus.QUEUED)
+
+    def close(self) -> None:
+        return None
+
+
+@pytest.fixture
+def make_client(monkeypatch: pytest.MonkeyPatch) -> Callable[..., SnowflakeClient]:
+    # Builds clients whose connection is a FakeConnection and whose retries
+    # do not sleep.
+    def make(**overrides: Any) -> SnowflakeClient:
+        connection = FakeConnection()
+        monkeypatch.setattr(snowflake.connector, "connect", lambda **kwargs: connection)
+        monkeypatch.setattr(hilo_snowflake, "backoff_seconds", lambda attempt: 0)
+        config = SnowflakeConfig(
+            account="acct",
+            user="user",
+            password="secret",
+            warehouse="wh",
+            database="db",
+            schema="sc",
+            **overrides,
+        )
+        return SnowflakeClient(config)
+
+    return make
@@ -0,0 +1,84 @@
+from pathlib import Path
+
+import pyarrow as pa
+
+from hilo_eda.artifacts import (
+    artifact_paths,
+    export_csv,
+    read_artifact,
+    write_artifacts,
+)
+from hilo_eda.columnar import ColumnarTableProfile
+from hilo_eda.models import ColumnProfile, EDAQueryResult, TableProfile
+from hilo_eda.results import QueryResult
+
+
+def _profile() -> TableProfile:
+    return TableProfile(
+        table_fqn='"db"."sc"."t"',
+        row_count=3,
+        columns=[
+            ColumnProfile(
+                name="id",
+                data_type="NUMBER",
+                total_count=3,
+                null_count=0,
+                distinct_count=3,
+                min_value=1,
+                max_value=3,
+            )
+        ],
+    )
+
+
+def test_artifacts_round_trip_and_export_csv(tmp_path: Path) -> None:
+    sample = QueryResult(pa.table({"ID": [1, 2, 3]}))
+    query = EDAQueryResult("Row Count", "SELECT 1", QueryResult(pa.table({"N": [3]})))
+
+    for artifact_format in ("arrow", "parquet"):
+        output_dir = tmp_path / artifact_format
+        paths = write_artifacts(
+            output_dir, _profile(), sample, [query], artifact_format
+        )
+
+        assert [path.name for path in paths] == [
+            f"column_profiles.{artifact_format}",
+            f"sample_rows.{artifact_format}",
+            f"00_row_count.{artifact_format}",
+        ]
+        restored = ColumnarTableProfile.from_arrow(read_artifact(paths[0]))
+        assert restored.to_profile() == _profile()
+        assert read_artifact(paths[1]).column("ID").to_pylist() == [1, 2, 3]
+
+        exported = export_csv(paths)
+
+        assert {path.name for path in exported} == {
+            "column_profiles.csv",
+            "sample_rows.csv",
+            "00_row_count.csv",
+        }
+        assert (output_dir / "sample_rows.csv").read_text().splitlines() == [
+            '"ID"',
+            "1",
+            "2",
+            "3",
+        ]
+
+
+def test_rerun_replaces_query_artifacts(tmp_path: Path) -> None:
+    sample = QueryResult(pa.table({"ID": [1]}))
+    queries = [
+        EDAQueryResult(title, "SELECT 1", QueryResult(pa.table({"N": [1]})))
+        for title in ("First", "Second")
+    ]
+    write_artifacts(tmp_path, _profile(), sample, queries)
+    export_csv(artifact_paths(tmp_path))
+    # Another table profiled beneath this directory is not this run's output.
+    write_artifacts(tmp_path / "other", _profile(), sample, queries)
+
+    paths = write_artifacts(tmp_path, _profile(), sample, queries[1:])
+
+    assert artifact_paths(tmp_path) == paths
+    assert sorted(path.name for path in (tmp_path / "queries").iterdir()) == [
+        "00_second.arrow"
+    ]
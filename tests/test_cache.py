@@ -0,0 +1,86 @@
+import os
+from pathlib import Path
+
+from hilo_eda.cache import (
+    ProfileCache,
+    QueryResultCache,
+    profile_cache_key,
+    sql_fingerprint,
+)
+from hilo_eda.config import ProfilingConfig
+from hilo_eda.models import ColumnInfo, ColumnProfile, TableMetadata, TableProfile
+from hilo_eda.results import QueryResult
+
+COLUMNS = [ColumnInfo(name="id", data_type="NUMBER", is_nullable=False)]
+
+
+def make_profile() -> TableProfile:
+    column = ColumnProfile(
+        name="id",
+        data_type="NUMBER",
+        total_count=3,
+        null_count=0,
+        distinct_count=3,
+        min_value=1,
+        max_value=3,
+        top_values=[(1, 1)],
+    )
+    return TableProfile(table_fqn='"DB"."SC"."T"', row_count=3, columns=[column])
+
+
+def test_cache_key_changes_with_last_altered() -> None:
+    before = TableMetadata(row_count=3, bytes=1024, last_altered="2024-01-01")
+    after = TableMetadata(row_count=3, bytes=1024, last_altered="2024-01-02")
+    config = ProfilingConfig()
+    key_before = profile_cache_key("t", COLUMNS, before, config)
+    assert key_before == profile_cache_key("t", COLUMNS, before, config)
+    assert key_before != profile_cache_key("t", COLUMNS, after, config)
+
+
+def test_cache_round_trip_and_lru_eviction(tmp_path: Path) -> None:
+    sample = QueryResult.from_rows([{"ID": 1}, {"ID": 2}])
+    cache = ProfileCache(tmp_path, max_bytes=10**9)
+    cache.put("a", make_profile(), sample)
+    cache.put("b", make_profile(), sample)
+
+    table_profile, sample_rows = cache.get("a")
+    assert table_profile == make_profile()
+    assert sample_rows.to_pylist() == [{"ID": 1}, {"ID": 2}]
+
+    entry_size = (tmp_path / "a.profile").stat().st_size
+    os.utime(tmp_path / "b.profile", ns=(0, 0))
+    cache.max_bytes = entry_size * 2
+    cache.put("c", make_profile(), sample)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_sql_fingerprint_ignores_whitespace_and_keyword_case() -> None:
+    assert sql_fingerprint('select  "a"\nFROM t') == sql_fingerprint(
+        'SELECT "a" from T'
+    )
+    assert sql_fingerprint("SELECT 'x'") != sql_fingerprint("SELECT 'X'")
+
+
+def test_result_cache_needs_table_version_and_respects_byte_budget() -> None:
+    cache = QueryResultCache(max_bytes=10**6)
+    sql = 'SELECT COUNT(*) FROM "DB"."SC"."T"'
+    assert cache.key_for(sql) is None
+
+    cache.set_table_version('"DB"."SC"."T"', "v1")
+    key = cache.key_for(sql)
+    result = QueryResult.from_rows([{"N": 1}])
+    assert cache.get(key) is None
+    cache.put(key, result)
+    assert cache.get(key) is result
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.set_table_version('"DB"."SC"."T"', "v2")
+    assert cache.key_for(sql) != key
+
+    cache.max_bytes = result.nbytes
+    cache.put("other", QueryResult.from_rows([{"N": 2}]))
+    assert cache.get(key) is None
+    assert cache.total_bytes <= cache.max_bytes
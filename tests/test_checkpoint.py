@@ -0,0 +1,65 @@
+from concurrent.futures import Future
+from pathlib import Path
+
+import pytest
+
+from hilo_eda.checkpoint import RunCheckpoint
+from hilo_eda.models import EDAQuery
+from hilo_eda.results import QueryResult
+
+
+def test_run_stage_is_skipped_when_resumed(tmp_path: Path) -> None:
+    calls: list[int] = []
+
+    def profile(value: int) -> int:
+        calls.append(value)
+        return value * 2
+
+    first = RunCheckpoint.start(tmp_path)
+    assert first.run_stage("profile", profile, 21) == 42
+
+    resumed = RunCheckpoint.start(tmp_path, first.run_id)
+
+    assert resumed.run_stage("profile", profile, 0) == 42
+    assert calls == [21]
+    assert resumed.load("selections") is None
+
+
+def test_finished_queries_are_saved_as_they_complete(tmp_path: Path) -> None:
+    checkpoint = RunCheckpoint.start(tmp_path).child("orders")
+    finished: Future[QueryResult] = Future()
+    failed: Future[QueryResult] = Future()
+    pending: Future[QueryResult] = Future()
+    for sql, future in (
+        ("SELECT 1", finished),
+        ("SELECT 2", failed),
+        ("SELECT 3", pending),
+    ):
+        checkpoint.track_query(EDAQuery(sql, sql, "t"), future)
+
+    finished.set_result(QueryResult.from_rows([{"N": 1}]))
+    failed.set_exception(RuntimeError("warehouse suspended"))
+
+    completed = checkpoint.completed_queries()
+    assert list(completed) == [EDAQuery("SELECT 1", "SELECT 1", "t")]
+    assert completed[EDAQuery("SELECT 1", "SELECT 1", "t")].to_pylist() == [{"N": 1}]
+
+
+def test_resume_rejects_unknown_run(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        RunCheckpoint.start(tmp_path, "missing")
+    with pytest.raises(ValueError):
+        RunCheckpoint.start(tmp_path, "../elsewhere")
+
+
+def test_finish_removes_the_run(tmp_path: Path) -> None:
+    kept = RunCheckpoint.start(tmp_path)
+    finished = RunCheckpoint.start(tmp_path)
+    finished.child("orders").save("profile", [{"ID": 1}])
+
+    finished.finish()
+    assert not finished.directory.exists()
+    assert kept.directory.is_dir()
+
+    kept.finish()
+    assert not (tmp_path / "runs").exists()
@@ -0,0 +1,42 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+from hilo_eda.columnar import ColumnarTableProfile
+from hilo_eda.models import ColumnProfile, Distribution, TableProfile
+
+
+def test_columnar_profile_round_trips_values_and_types() -> None:
+    profile = TableProfile(
+        table_fqn='"db"."sc"."t"',
+        row_count=10,
+        columns=[
+            ColumnProfile(
+                name="amount",
+                data_type="NUMBER(10,2)",
+                total_count=10,
+                null_count=1,
+                distinct_count=5,
+                min_value=Decimal("1.50"),
+                max_value=Decimal("9.25"),
+                top_values=[(Decimal("1.50"), 3), (None, 1)],
+                precision="sampled",
+                null_count_ci=(0, 3),
+                distribution=Distribution([(0.5, 4.0)], Decimal("1.50"), 9, [4, 5]),
+            ),
+            ColumnProfile(
+                name="created",
+                data_type="DATE",
+                total_count=10,
+                null_count=0,
+                distinct_count=3,
+                min_value=date(2024, 1, 1),
+                max_value=datetime(2024, 2, 1, 12, 30),
+            ),
+        ],
+    )
+
+    columnar = ColumnarTableProfile.from_profile(profile)
+
+    assert len(columnar) == 2
+    assert columnar.column("created") == profile.columns[1]
+    assert columnar.to_profile() == profile
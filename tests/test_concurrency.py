@@ -0,0 +1,67 @@
+import threading
+import time
+
+import pytest
+
+from hilo_eda.concurrency import INITIAL_LIMIT, AimdLimiter
+
+
+def test_limit_grows_additively_without_congestion() -> None:
+    limiter = AimdLimiter(max_limit=16)
+    for _ in range(20):
+        limiter.release(limiter.acquire(), latency=1.0)
+
+    assert INITIAL_LIMIT + 3 < limiter.limit < INITIAL_LIMIT + 5
+    assert limiter.decreases == 0
+
+
+def test_queued_time_halves_the_limit_once_per_window() -> None:
+    limiter = AimdLimiter(max_limit=16)
+    first, second = limiter.acquire(), limiter.acquire()
+
+    limiter.release(first, latency=3.0, queued_seconds=2.0)
+    # Admitted before the cut, so its queueing was already accounted for.
+    limiter.release(second, latency=3.0, queued_seconds=2.0)
+
+    assert limiter.limit == INITIAL_LIMIT / 2
+    assert limiter.decreases == 1
+
+
+def test_rising_execution_latency_counts_as_congestion() -> None:
+    limiter = AimdLimiter(max_limit=16)
+    for _ in range(10):
+        limiter.release(limiter.acquire(), latency=1.0)
+    before = limiter.limit
+    for _ in range(3):
+        limiter.release(limiter.acquire(), latency=10.0)
+
+    assert limiter.decreases >= 1
+    assert limiter.limit < before
+
+
+def test_acquire_blocks_at_the_limit() -> None:
+    limiter = AimdLimiter(max_limit=1)
+    started = limiter.acquire()
+    acquired = threading.Event()
+
+    def worker() -> None:
+        limiter.release(limiter.acquire(), latency=None)
+        acquired.set()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    time.sleep(0.05)
+    assert not acquired.is_set()
+    limiter.release(started, latency=0.1)
+    thread.join(timeout=1)
+    assert acquired.is_set()
+
+
+def test_fixed_limits_do_not_adapt() -> None:
+    limiter = AimdLimiter(max_limit=8, min_limit=8)
+    limiter.release(limiter.acquire(), latency=5.0, queued_seconds=5.0)
+
+    assert not limiter.adaptive
+    assert limiter.limit == 8
+    with pytest.raises(ValueError):
+        AimdLimiter(max_limit=2, min_limit=3)
@@ -0,0 +1,21 @@
+import math
+
+from hilo_eda.correlation import correlation_matrix, correlation_selects, top_pairs
+from hilo_eda.results import QueryResult
+
+
+def test_correlation_matrix_from_one_wide_result() -> None:
+    columns = ["a", "b", "c"]
+    selects = correlation_selects(columns)
+    assert len(selects) == 3
+    assert selects[0] == 'CORR("a", "b") AS "a__CORR__b"'
+
+    result = QueryResult.from_rows(
+        [{"a__CORR__b": 0.2, "a__CORR__c": -0.9, "b__CORR__c": None, "a__AVG": 1}]
+    )
+    matrix = correlation_matrix(columns, [result])
+
+    assert matrix[0, 0] == 1.0
+    assert matrix[2, 0] == -0.9
+    assert math.isnan(matrix[1, 2])
+    assert top_pairs(columns, matrix) == [("a", "c", -0.9), ("a", "b", 0.2)]
@@ -0,0 +1,65 @@
+from typing import Any
+
+from hilo_eda.config import TableConfig
+from hilo_eda.discovery import fetch_schema_tables, fetch_table_metadata
+
+
+class FakeClient:
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self.rows = rows
+        self.queries: list[str] = []
+
+    def execute_query(self, sql: str) -> list[dict[str, Any]]:
+        self.queries.append(sql)
+        return self.rows
+
+
+def column_row(table: str, column: str, data_type: str) -> dict[str, Any]:
+    return {
+        "TABLE_NAME": table,
+        "COLUMN_NAME": column,
+        "DATA_TYPE": data_type,
+        "IS_NULLABLE": "YES",
+        "ROW_COUNT": 10,
+        "BYTES": 2048,
+        "LAST_ALTERED": "2024-01-01",
+    }
+
+
+def test_fetch_schema_tables_groups_columns_in_one_query() -> None:
+    client = FakeClient(
+        [
+            column_row("ORDERS", "ID", "NUMBER"),
+            column_row("ORDERS", "STATUS", "TEXT"),
+            column_row("ORDER_ITEMS", "SKU", "TEXT"),
+            column_row("CUSTOMERS", "ID", "NUMBER"),
+        ]
+    )
+    tables = fetch_schema_tables(client, "SALES", pattern="order*")
+
+    assert len(client.queries) == 1
+    assert "c.TABLE_SCHEMA = 'SALES'" in client.queries[0]
+    assert "c.TABLE_NAME ILIKE 'order%' ESCAPE '!'" in client.queries[0]
+    assert list(tables) == ["ORDERS", "ORDER_ITEMS"]
+    metadata, columns = tables["ORDERS"]
+    assert metadata.bytes == 2048
+    assert [column.name for column in columns] == ["ID", "STATUS"]
+
+
+def test_fetch_table_metadata_quotes_names() -> None:
+    client = FakeClient([])
+
+    metadata = fetch_table_metadata(client, TableConfig("DB", "O'BRIEN", "T'1"))
+
+    assert metadata is None
+    assert "TABLE_SCHEMA = 'O''BRIEN' AND TABLE_NAME = 'T''1'" in client.queries[0]
+
+
+def test_fetch_schema_tables_escapes_pattern() -> None:
+    client = FakeClient([column_row("A_B'1", "ID", "NUMBER")])
+
+    tables = fetch_schema_tables(client, "S'X", pattern="A_B'?")
+
+    assert list(tables) == ["A_B'1"]
+    assert "c.TABLE_SCHEMA = 'S''X'" in client.queries[0]
+    assert "ILIKE 'A!_B''_' ESCAPE '!'" in client.queries[0]
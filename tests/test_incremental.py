@@ -0,0 +1,87 @@
+import json
+from pathlib import Path
+from typing import Any
+
+from hilo_eda.config import TableConfig
+from hilo_eda.incremental import IncrementalStore
+from hilo_eda.models import ColumnInfo
+from hilo_eda.profiling import profile_table_incremental
+from hilo_eda.results import QueryResult
+from hilo_eda.sketches import HyperLogLog
+
+COLUMNS = [
+    ColumnInfo(name="event_ts", data_type="NUMBER", is_nullable=False),
+    ColumnInfo(name="kind", data_type="TEXT", is_nullable=True),
+]
+TABLE = TableConfig(database="db", schema="sc", table="events")
+
+
+def export(indices: list[int]) -> str:
+    return json.dumps(
+        {
+            "version": 4,
+            "precision": 12,
+            "sparse": {"indices": indices, "maxLzCounts": [1] * len(indices)},
+        }
+    )
+
+
+class FakeClient:
+    def __init__(self, watermark: int, rows: int, indices: list[int]) -> None:
+        self.watermark = watermark
+        self.rows = rows
+        self.indices = indices
+        self.queries: list[str] = []
+
+    def execute_arrow(self, sql: str) -> QueryResult:
+        self.queries.append(sql)
+        if "AS WATERMARK" in sql:
+            return QueryResult.from_rows([{"WATERMARK": self.watermark}])
+        if sql.startswith("SELECT *"):
+            return QueryResult.from_rows([{"EVENT_TS": 1}])
+        row: dict[str, Any] = {"TOTAL_COUNT": self.rows}
+        for index in range(2):
+            row[f"C{index}_NON_NULL"] = self.rows
+            row[f"C{index}_HLL"] = export(self.indices)
+            row[f"C{index}_TOP"] = json.dumps([["click", self.rows]])
+            row[f"C{index}_MIN"] = self.watermark - 1
+            row[f"C{index}_MAX"] = self.watermark
+        return QueryResult.from_rows([row])
+
+    def execute_many(self, sqls: list[str]) -> list[QueryResult]:
+        return [self.execute_arrow(sql) for sql in sqls]
+
+
+def test_hyperloglog_merge_takes_register_max() -> None:
+    left = HyperLogLog.from_export(export([1, 2, 3]))
+    right = HyperLogLog.from_export(export([3, 4]))
+    left.merge(right)
+    assert left.estimate() == 4
+
+
+def test_incremental_profile_scans_only_new_rows(tmp_path: Path) -> None:
+    store = IncrementalStore(tmp_path)
+    first = FakeClient(watermark=10, rows=5, indices=[1, 2, 3])
+    profile, _ = profile_table_incremental(first, TABLE, COLUMNS, store, "event_ts")
+    assert profile.row_count == 5
+
+    second = FakeClient(watermark=20, rows=3, indices=[3, 4])
+    profile, _ = profile_table_incremental(second, TABLE, COLUMNS, store, "event_ts")
+
+    wide = [sql for sql in second.queries if "TOTAL_COUNT" in sql]
+    assert '"event_ts" > 10 AND "event_ts" <= 20' in wide[0]
+    assert profile.row_count == 8
+    assert profile.columns[0].min_value == 9
+    assert profile.columns[0].max_value == 20
+    assert profile.columns[0].distinct_count == 4
+    assert profile.columns[1].top_values == [("click", 8)]
+
+
+def test_incremental_profile_skips_scan_without_new_rows(tmp_path: Path) -> None:
+    store = IncrementalStore(tmp_path)
+    client = FakeClient(watermark=10, rows=5, indices=[1])
+    profile_table_incremental(client, TABLE, COLUMNS, store, "event_ts")
+    rerun = FakeClient(watermark=10, rows=5, indices=[1])
+    profile, _ = profile_table_incremental(rerun, TABLE, COLUMNS, store, "event_ts")
+    assert not any("TOTAL_COUNT" in sql for sql in rerun.queries)
+    assert profile.row_count == 5
@@ -1,4 +1,4 @@
-from hilo_eda.inference import infer_behavior
+from hilo_eda.inference import infer_all, infer_behavior
 from hilo_eda.models import ColumnProfile
 
 
@@ -30,3 +30,61 @@ def test_infer_constant() -> None:
     )
     result = infer_behavior(profile, row_count=50)
     assert result.behavior_class == "constant"
+
+
+def test_infer_marks_approximate_estimates() -> None:
+    profile = ColumnProfile(
+        name="country",
+        data_type="TEXT",
+        total_count=1000,
+        null_count=0,
+        distinct_count=12,
+        min_value=None,
+        max_value=None,
+        precision="approx",
+        distinct_error=0.0162,
+    )
+    result = infer_behavior(profile, row_count=1000)
+    assert result.behavior_class == "low-cardinality categorical"
+    assert result.confidence == 0.6
+    assert result.rationale.endswith("(estimated)")
+
+
+def test_metadata_profile_skips_distinct_rules() -> None:
+    profile = ColumnProfile(
+        name="status",
+        data_type="TEXT",
+        total_count=100,
+        null_count=0,
+        distinct_count=0,
+        min_value=None,
+        max_value=None,
+        precision="metadata",
+    )
+    assert infer_behavior(profile, 100).behavior_class == "text"
+
+
+def test_infer_all_matches_scalar_rules() -> None:
+    profiles = [
+        ColumnProfile(
+            name=f"c{index}",
+            data_type=data_type,
+            total_count=100,
+            null_count=nulls,
+            distinct_count=distinct,
+            min_value=None,
+            max_value=None,
+            precision=precision,
+        )
+        for index, (data_type, nulls, distinct, precision) in enumerate(
+            (data_type, nulls, distinct, precision)
+            for data_type in ("VARIANT", "BOOLEAN", "TEXT", "DATE", "NUMBER", "BINARY")
+            for nulls in (0, 95)
+            for distinct in (1, 5, 95)
+            for precision in ("exact", "approx", "metadata")
+        )
+    ]
+    for row_count in (0, 100):
+        assert infer_all(profiles, row_count) == [
+            infer_behavior(profile, row_count) for profile in profiles
+        ]
@@ -0,0 +1,213 @@
+import signal
+import threading
+from concurrent.futures import Future
+from contextlib import nullcontext
+from pathlib import Path
+
+import pytest
+
+from hilo_eda import orchestrator
+from hilo_eda.concurrency import AimdLimiter
+from hilo_eda.config import OutputConfig, SnowflakeConfig, TableConfig
+from hilo_eda.models import (
+    ColumnInfo,
+    ColumnProfile,
+    EDAQuery,
+    TableMetadata,
+    TableProfile,
+)
+from hilo_eda.orchestrator import _build_eda_queries, _run_queries, run_schema_eda
+from hilo_eda.results import QueryResult
+from hilo_eda.snowflake import QueryCounters
+
+TABLE = TableConfig(database="db", schema="sc", table="orders")
+
+
+def column(name: str, data_type: str, **overrides: object) -> ColumnProfile:
+    values = {
+        "name": name,
+        "data_type": data_type,
+        "total_count": 100,
+        "null_count": 0,
+        "distinct_count": 50,
+        "min_value": 1,
+        "max_value": 99,
+        "top_values": [("a", 60), ("b", 40)],
+    }
+    values.update(overrides)
+    return ColumnProfile(**values)
+
+
+def test_eda_reuses_profile_and_fuses_new_aggregates() -> None:
+    profile = TableProfile(
+        table_fqn='"db"."sc"."orders"',
+        row_count=100,
+        columns=[
+            column("amount", "NUMBER"),
+            column("qty", "NUMBER"),
+            column("status", "TEXT", distinct_count=2, min_value=None, max_value=None),
+            column("note", "TEXT", min_value=None, max_value=None, top_values=[]),
+            column("created", "TIMESTAMP_NTZ"),
+        ],
+    )
+
+    answered, queries = _build_eda_queries(
+        TABLE, profile, ["amount", "qty"], ["status", "note"], "created"
+    )
+
+    assert [result.title for result in answered] == [
+        "Summary stats for amount",
+        "Summary stats for qty",
+        "Top values for status",
+        "Recent range for created",
+    ]
+    assert all(result.source == "profile" for result in answered)
+    assert answered[2].rows.to_pylist()[0] == {"VALUE": "a", "COUNT": 60}
+
+    assert queries[0].title == "Top values for note"
+    fused = [query for query in queries if query.title.startswith("Aggregates")]
+    assert len(fused) == 1
+    assert 'AVG("amount")' in fused[0].sql
+    assert 'CORR("amount", "qty")' in fused[0].sql
+    assert "MIN(" not in fused[0].sql
+    assert fused[0].aliases == (
+        "amount__AVG",
+        "amount__STDDEV",
+        "qty__AVG",
+        "qty__STDDEV",
+        "amount__CORR__qty",
+    )
+
+
+def test_eda_requeries_top_values_cut_short_by_top_k() -> None:
+    top_values = [(f"v{index}", 20 - index) for index in range(5)]
+    profile = TableProfile(
+        table_fqn='"db"."sc"."orders"',
+        row_count=100,
+        columns=[column("status", "TEXT", top_values=top_values)],
+    )
+
+    answered, queries = _build_eda_queries(TABLE, profile, [], ["status"], None)
+
+    assert answered == []
+    assert queries[0].title == "Top values for status"
+    assert queries[0].sql.endswith("LIMIT 10")
+
+
+def test_eda_queries_columns_profiled_as_estimates() -> None:
+    profile = TableProfile(
+        table_fqn='"db"."sc"."orders"',
+        row_count=100,
+        columns=[
+            column("amount", "NUMBER", precision="sampled"),
+            column("status", "TEXT", distinct_count=2, precision="approx"),
+        ],
+    )
+
+    answered, queries = _build_eda_queries(TABLE, profile, ["amount"], ["status"], None)
+
+    assert answered == []
+    assert [query.title for query in queries] == [
+        "Top values for status",
+        "Aggregates: moments of amount",
+    ]
+    assert 'MIN("amount")' in queries[1].sql
+
+
+class RecordingClient:
+    def __init__(self) -> None:
+        self.submitted: list[str] = []
+        self.cancelled: list[Future[QueryResult]] = []
+
+    def submit(self, sql: str) -> Future[QueryResult]:
+        self.submitted.append(sql)
+        future: Future[QueryResult] = Future()
+        future.set_result(
+            QueryResult.from_rows([{"x__AVG": 1, "y__AVG": 2, "z__AVG": 3}])
+        )
+        return future
+
+    def cancel(self, future: Future[QueryResult]) -> None:
+        self.cancelled.append(future)
+        future.cancel()
+
+
+def test_run_queries_reuses_prefetched_superset() -> None:
+    client = RecordingClient()
+    speculative = EDAQuery(
+        "Aggregates: moments of x, moments of y, moments of z",
+        'SELECT AVG("x") AS "x__AVG", AVG("y") AS "y__AVG", AVG("z") AS "z__AVG" '
+        "FROM t",
+        "t",
+        ("x__AVG", "y__AVG", "z__AVG"),
+    )
+    unused: Future[QueryResult] = Future()
+    prefetched = {
+        speculative: client.submit(speculative.sql),
+        EDAQuery("Top values for z", "SELECT 2", "t"): unused,
+    }
+    query = EDAQuery(
+        "Aggregates: moments of y, moments of x",
+        'SELECT AVG("y") AS "y__AVG", AVG("x") AS "x__AVG" FROM t',
+        "t",
+        ("y__AVG", "x__AVG"),
+    )
+
+    executed = _run_queries(client, [query], prefetched)
+
+    assert client.submitted == [speculative.sql]
+    assert executed[0].rows.table.column_names == ["y__AVG", "x__AVG"]
+    assert executed[0].rows.to_pylist() == [{"y__AVG": 2, "x__AVG": 1}]
+    # The report shows the statement that ran, not the subset it stood in for.
+    assert executed[0].sql == speculative.sql
+    assert client.cancelled == [unused]
+    assert unused.cancelled()
+
+
+class InterruptibleClient:
+    result_cache = None
+
+    def __init__(self) -> None:
+        self.counters = QueryCounters()
+        self.limiter = AimdLimiter(8)
+        self.cancelled = threading.Event()
+
+    def run_deadline(self, seconds: int | None) -> nullcontext[None]:
+        return nullcontext()
+
+    def cancel_running(self) -> None:
+        self.cancelled.set()
+
+
+def test_interrupted_schema_run_drops_queued_tables(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    client = InterruptibleClient()
+    discovered = (TableMetadata(10, 100, "x"), [ColumnInfo("ID", "NUMBER", False)])
+    profiled: list[str] = []
+
+    def profile_stage(session: object, table: TableConfig, *args: object) -> None:
+        # Interrupt the main thread while the first table is still profiling;
+        # the table only finishes once the run cancels its queries.
+        profiled.append(table.table)
+        signal.pthread_kill(threading.main_thread().ident, signal.SIGINT)
+        client.cancelled.wait(timeout=5)
+        raise RuntimeError("query cancelled")
+
+    monkeypatch.setattr(
+        orchestrator,
+        "fetch_schema_tables",
+        lambda *args: {"A": discovered, "B": discovered},
+    )
+    monkeypatch.setattr(orchestrator, "_profile_stage", profile_stage)
+    snowflake = SnowflakeConfig(
+        account="a", user="u", password="p", warehouse="w", database="db", schema="sc"
+    )
+
+    with pytest.raises(KeyboardInterrupt):
+        run_schema_eda(
+            snowflake, "db", "sc", OutputConfig(tmp_path), workers=1, client=client
+        )
+
+    assert client.cancelled.is_set()
+    assert profiled == ["A"]
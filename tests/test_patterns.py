@@ -0,0 +1,43 @@
+from hilo_eda.models import InferenceResult
+from hilo_eda.patterns import apply_patterns, detect_patterns
+from hilo_eda.results import QueryResult
+
+
+def test_detect_patterns_classifies_string_columns() -> None:
+    sample = QueryResult.from_rows(
+        [
+            {
+                "EMAIL": f"user{index}@example.com",
+                "CODE": f"ORD-{1000 + index}",
+                "DAY": f"2024-01-{index + 1:02d}",
+                "NOTE": "free text",
+                "AMOUNT": index,
+            }
+            for index in range(20)
+        ]
+    )
+    detected = detect_patterns(sample)
+
+    assert detected["EMAIL"] == ("email", 1.0)
+    assert detected["CODE"] == ("identifier", 1.0)
+    assert detected["DAY"][0] == "iso-date"
+    assert "NOTE" not in detected
+    assert "AMOUNT" not in detected
+
+
+def test_apply_patterns_overrides_only_generic_behaviors() -> None:
+    inferences = [
+        InferenceResult("EMAIL", "text", 0.6, "Text type"),
+        InferenceResult("STATUS", "low-cardinality categorical", 0.7, "Low distinct"),
+    ]
+    detected = {"EMAIL": ("email", 1.0), "STATUS": ("numeric-string", 0.95)}
+    email, status = apply_patterns(inferences, detected)
+
+    assert (email.behavior_class, email.confidence, email.pattern) == (
+        "email",
+        0.9,
+        "email",
+    )
+    assert status.behavior_class == "low-cardinality categorical"
+    assert status.pattern == "numeric-string"
+    assert status.rationale.startswith("Low distinct; 95%")
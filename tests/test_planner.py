@@ -0,0 +1,42 @@
+from hilo_eda.models import ColumnInfo, EDAQuery
+from hilo_eda.planner import ScanBudget, plan_columns, plan_queries
+
+COLUMNS = [
+    ColumnInfo(name="id", data_type="NUMBER", is_nullable=False),
+    ColumnInfo(name="status", data_type="TEXT", is_nullable=True),
+    ColumnInfo(name="note", data_type="TEXT", is_nullable=True),
+]
+
+
+def test_plan_columns_downgrades_as_budget_runs_out() -> None:
+    budget = ScanBudget(limit_bytes=350)
+    plans = plan_columns(
+        COLUMNS,
+        column_bytes=100,
+        row_count=1_000,
+        budget=budget,
+        preferred_mode="exact",
+        target_sample_rows=100,
+        sample_method="SYSTEM",
+    )
+
+    assert [(plan.mode, plan.estimated_bytes) for plan in plans] == [
+        ("exact", 200),
+        ("approx", 100),
+        ("sampled", 10),
+    ]
+    assert budget.remaining_bytes == 40
+
+    skipped = plan_columns(COLUMNS[:1], 100, 1_000, budget, "approx", 100, "BERNOULLI")
+    assert skipped[0].mode == "metadata"
+
+
+def test_plan_queries_skips_what_does_not_fit() -> None:
+    budget = ScanBudget(limit_bytes=150)
+    queries = [
+        EDAQuery("Aggregates", 'SELECT AVG("id"), AVG("status") FROM t', "t"),
+        EDAQuery("Top values for note", 'SELECT "note" FROM t GROUP BY 1', "t"),
+    ]
+    kept, skipped = plan_queries(queries, COLUMNS, 100, budget)
+    assert [query.title for query in kept] == ["Top values for note"]
+    assert skipped == ["Aggregates"]
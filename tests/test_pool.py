@@ -0,0 +1,73 @@
+from typing import Any
+
+import snowflake.connector
+
+from hilo_eda.config import SnowflakeConfig
+from hilo_eda.pool import ConnectionPool, get_pool
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    def close(self) -> None:
+        self.closed = True
+
+
+CONFIG = SnowflakeConfig(
+    account="acct",
+    user="user",
+    password="secret",
+    warehouse="wh",
+    database="db",
+    schema="sc",
+)
+
+
+def patch_connect(monkeypatch: Any) -> list[FakeConnection]:
+    connections: list[FakeConnection] = []
+
+    def connect(**kwargs: Any) -> FakeConnection:
+        connections.append(FakeConnection())
+        return connections[-1]
+
+    monkeypatch.setattr(snowflake.connector, "connect", connect)
+    return connections
+
+
+def test_pool_reuses_warm_sessions(monkeypatch: Any) -> None:
+    connections = patch_connect(monkeypatch)
+    pool = ConnectionPool(CONFIG, max_size=2)
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+    assert first is second
+    assert len(connections) == 1
+    pool.close()
+    assert connections[0].closed
+
+
+def test_pool_replaces_unhealthy_and_expired_sessions(monkeypatch: Any) -> None:
+    connections = patch_connect(monkeypatch)
+    pool = ConnectionPool(CONFIG, max_size=2, idle_timeout=0.0)
+    with pool.connection():
+        pass
+    with pool.connection():
+        pass
+    assert len(connections) == 2
+    assert connections[0].closed
+
+    pool.idle_timeout = 60.0
+    with pool.connection():
+        connections[1].closed = True
+    with pool.connection():
+        pass
+    assert len(connections) == 3
+
+
+def test_get_pool_is_keyed_by_config() -> None:
+    assert get_pool(CONFIG) is get_pool(CONFIG)
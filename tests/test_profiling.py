@@ -0,0 +1,162 @@
+from concurrent.futures import Future
+from typing import Any
+
+from hilo_eda.config import TableConfig
+from hilo_eda.models import ColumnInfo
+from hilo_eda.profiling import (
+    profile_distributions,
+    profile_table,
+    refine_profile,
+    resolve_mode,
+)
+from hilo_eda.results import QueryResult
+
+
+class FakeClient:
+    def __init__(self, row_count: int = 10) -> None:
+        self.queries: list[str] = []
+        self.row_count = row_count
+
+    def rows_for(self, sql: str) -> list[dict[str, Any]]:
+        self.queries.append(sql)
+        if "GROUP BY" in sql:
+            return [{"VALUE": "a", "COUNT": 6}, {"VALUE": "b", "COUNT": 4}]
+        if sql.startswith("SELECT *"):
+            return [{"ID": 1}]
+        row: dict[str, Any] = {"TOTAL_COUNT": 10, "ROW_COUNT": self.row_count}
+        for index in range(3):
+            row[f"C{index}_NON_NULL"] = 8
+            row[f"C{index}_DISTINCT"] = 2
+            row[f"C{index}_MIN"] = 1
+            row[f"C{index}_MAX"] = 9
+            row[f"C{index}_TOP"] = '[["a", 6], ["b", 4]]'
+            row[f"C{index}_MEDIAN"] = 5
+            row[f"C{index}_Q500"] = 5
+            for quantile in (10, 50, 250, 750, 950, 990):
+                row[f"C{index}_Q{quantile}"] = quantile
+            for bucket in range(1, 11):
+                row[f"C{index}_B{bucket}"] = bucket
+        return [row]
+
+    def execute_arrow(self, sql: str) -> QueryResult:
+        return QueryResult.from_rows(self.rows_for(sql))
+
+    def submit(self, sql: str) -> Future[QueryResult]:
+        future: Future[QueryResult] = Future()
+        future.set_result(self.execute_arrow(sql))
+        return future
+
+    def execute_many(self, sqls: list[str]) -> list[QueryResult]:
+        return [self.execute_arrow(sql) for sql in sqls]
+
+
+COLUMNS = [
+    ColumnInfo(name="id", data_type="NUMBER", is_nullable=False),
+    ColumnInfo(name="status", data_type="TEXT", is_nullable=True),
+    ColumnInfo(name="created", data_type="TIMESTAMP_NTZ", is_nullable=True),
+]
+TABLE = TableConfig(database="db", schema="sc", table="t")
+
+
+def test_profile_table_batches_wide_aggregates() -> None:
+    client = FakeClient()
+    profile, sample_rows = profile_table(
+        client, TABLE, COLUMNS, batch_size=2, mode="exact"
+    )
+
+    wide = [sql for sql in client.queries if "TOTAL_COUNT" in sql]
+    assert len(wide) == 2
+    assert "C2_MIN" in wide[1]
+    assert profile.row_count == 10
+    assert [col.null_count for col in profile.columns] == [2, 2, 2]
+    assert profile.columns[0].min_value == 1
+    assert profile.columns[1].min_value is None
+    assert profile.columns[1].top_values == [("a", 6), ("b", 4)]
+    assert sample_rows.to_pylist() == [{"ID": 1}]
+
+
+def test_profile_table_approx_is_single_pass() -> None:
+    client = FakeClient()
+    profile, _ = profile_table(client, TABLE, COLUMNS, mode="approx")
+
+    assert not any("GROUP BY" in sql for sql in client.queries)
+    assert any("APPROX_COUNT_DISTINCT" in sql for sql in client.queries)
+    assert profile.columns[1].top_values == [("a", 6), ("b", 4)]
+    assert profile.columns[0].median_value == 5
+    assert profile.columns[1].median_value is None
+    assert all(col.is_approximate for col in profile.columns)
+
+
+def test_resolve_mode_uses_row_threshold() -> None:
+    assert resolve_mode("auto", 100, approx_row_threshold=1_000) == "exact"
+    assert resolve_mode("auto", 5_000, approx_row_threshold=1_000) == "approx"
+    assert resolve_mode("exact", 5_000, approx_row_threshold=1_000) == "exact"
+
+
+def test_profile_table_sampled_scales_with_bounds() -> None:
+    client = FakeClient(row_count=1_000)
+    profile, _ = profile_table(
+        client, TABLE, COLUMNS, mode="sampled", target_sample_rows=10
+    )
+
+    assert any("TABLESAMPLE BERNOULLI (1.000000) SEED" in sql for sql in client.queries)
+    column = profile.columns[1]
+    assert profile.row_count == 1_000
+    assert column.precision == "sampled"
+    assert column.null_count == 200
+    assert column.distinct_count == 2
+    low, high = column.null_count_ci
+    assert low < 200 < high
+    assert column.top_values == [("a", 600), ("b", 400)]
+
+    refined = refine_profile(client, profile, COLUMNS, ["status"])
+    assert refined.columns[1].precision == "exact"
+    assert refined.columns[0].precision == "sampled"
+
+
+def test_profile_table_sampled_small_table_is_exact() -> None:
+    client = FakeClient(row_count=10)
+    profile, _ = profile_table(client, TABLE, COLUMNS, mode="sampled")
+
+    assert not any("TABLESAMPLE" in sql for sql in client.queries)
+    assert all(col.precision == "exact" for col in profile.columns)
+
+
+def test_profile_table_metadata_tier_skips_scans() -> None:
+    client = FakeClient()
+    profile, _ = profile_table(client, TABLE, COLUMNS, mode="metadata", row_count=12)
+
+    assert not any("DISTINCT" in sql or "TOP_K" in sql for sql in client.queries)
+    assert not any("ROW_COUNT" in sql for sql in client.queries)
+    assert profile.columns[0].max_value == 9
+    assert profile.row_count == 12
+    assert profile.columns[1].null_count == 4
+    assert not any(col.has_distinct for col in profile.columns)
+
+
+def test_profile_distributions_batches_quantiles_and_buckets() -> None:
+    client = FakeClient()
+    profile, _ = profile_table(client, TABLE, COLUMNS, mode="exact")
+    client.queries.clear()
+
+    profile = profile_distributions(client, profile, COLUMNS, ["id", "status"])
+
+    assert len(client.queries) == 1
+    assert 'WIDTH_BUCKET("id", 1.0, 9.0, 10) <= 1) AS C0_B1' in client.queries[0]
+    assert 'WIDTH_BUCKET("id", 1.0, 9.0, 10) >= 10) AS C0_B10' in client.queries[0]
+    distribution = profile.columns[0].distribution
+    assert distribution.quantiles[3] == (0.5, 5)
+    assert len(distribution.counts) == 10
+    assert profile.columns[1].distribution is None
+
+
+def test_profile_distributions_skips_sampled_ranges() -> None:
+    client = FakeClient(row_count=10_000_000)
+    profile, _ = profile_table(
+        client, TABLE, COLUMNS, mode="sampled", target_sample_rows=1_000
+    )
+    client.queries.clear()
+
+    assert profile.columns[0].precision == "sampled"
+    assert profile_distributions(client, profile, COLUMNS, ["id"]) == profile
+    assert client.queries == []
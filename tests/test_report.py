@@ -0,0 +1,82 @@
+import json
+from pathlib import Path
+
+import pyarrow as pa
+
+from hilo_eda.html_report import write_html_report
+from hilo_eda.models import (
+    ColumnProfile,
+    EDAQueryResult,
+    HumanSelections,
+    InferenceResult,
+    TableProfile,
+)
+from hilo_eda.report import (
+    MARKDOWN_COLUMN_LIMIT,
+    write_json_report,
+    write_markdown_report,
+)
+from hilo_eda.results import QueryResult
+
+
+def _inputs(columns: int) -> tuple:
+    profile = TableProfile(
+        table_fqn='"db"."sc"."wide"',
+        row_count=10,
+        columns=[
+            ColumnProfile(f"C{i}", "NUMBER", 10, 0, 10, 1, float("nan"))
+            for i in range(columns)
+        ],
+    )
+    inferences = [
+        InferenceResult(f"C{i}", "numeric measure", 0.6, "numeric")
+        for i in range(columns)
+    ]
+    human = HumanSelections(None, None, None, [], "behavior-based exploration")
+    queries = [
+        EDAQueryResult("Row Count", "SELECT 1", QueryResult(pa.table({"N": [10]})))
+    ]
+    return profile, inferences, human, queries
+
+
+def test_json_report_streams_every_column(tmp_path: Path) -> None:
+    path = tmp_path / "eda_report.json"
+    write_json_report(path, *_inputs(3))
+
+    report = json.loads(path.read_text())
+
+    assert [column["name"] for column in report["columns"]] == ["C0", "C1", "C2"]
+    assert report["columns"][0]["max_value"] is None
+    assert report["queries"][0]["preview"] == [[10]]
+    assert report["plan"] is None
+
+
+def test_markdown_report_caps_listed_columns(tmp_path: Path) -> None:
+    path = tmp_path / "eda_report.md"
+    write_markdown_report(path, *_inputs(MARKDOWN_COLUMN_LIMIT + 5))
+
+    text = path.read_text()
+
+    assert f"**C{MARKDOWN_COLUMN_LIMIT - 1}** (NUMBER)" in text
+    assert f"**C{MARKDOWN_COLUMN_LIMIT}** (NUMBER)" not in text
+    assert "5 more columns" in text
+
+
+def test_html_report_pages_large_sections(tmp_path: Path) -> None:
+    path = tmp_path / "eda_report.html"
+    write_html_report(path, *_inputs(450), page_size=200)
+
+    pages = sorted(p.name for p in (tmp_path / "eda_report_pages").iterdir())
+
+    assert pages == [
+        "columns_0.js",
+        "columns_1.js",
+        "columns_2.js",
+        "inferences_0.js",
+        "inferences_1.js",
+        "inferences_2.js",
+        "queries_0.js",
+    ]
+    html = path.read_text()
+    assert 'id="columns" data-pages="3"' in html
+    assert "C449" not in html
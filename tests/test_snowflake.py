@@ -0,0 +1,124 @@
+import time
+from collections.abc import Callable
+from concurrent.futures import CancelledError
+
+import pytest
+from snowflake.connector.constants import QueryStatus
+from snowflake.connector.errors import OperationalError, ProgrammingError
+
+from hilo_eda.snowflake import SnowflakeClient
+
+MakeClient = Callable[..., SnowflakeClient]
+
+
+def test_execute_many_preserves_order(make_client: MakeClient) -> None:
+    client = make_client(max_concurrency=4)
+    sqls = [f"SELECT {index}" for index in range(20)]
+    results = client.execute_many(sqls)
+    client.close()
+    assert [result.value("SQL") for result in results] == sqls
+
+
+def test_execute_query_returns_row_dicts(make_client: MakeClient) -> None:
+    client = make_client()
+    rows = client.execute_query("SELECT 1")
+    client.close()
+    assert rows == [{"SQL": "SELECT 1"}]
+
+
+def test_retryable_errors_are_retried_then_succeed(make_client: MakeClient) -> None:
+    client = make_client(max_retries=2)
+    client._connection.statuses = [OperationalError("reset"), OperationalError("reset")]
+
+    assert client.execute_query("SELECT 1") == [{"SQL": "SELECT 1"}]
+    client.close()
+
+    assert client.counters.retries == 2
+    assert client.counters.failed == 0
+
+
+def test_sql_errors_are_not_retried(make_client: MakeClient) -> None:
+    client = make_client(max_retries=2)
+    client._connection.statuses = [ProgrammingError("invalid identifier")]
+
+    with pytest.raises(ProgrammingError):
+        client.execute_query("SELECT nope")
+    client.close()
+
+    assert client.counters.retries == 0
+    assert client.counters.failed == 1
+
+
+def test_timed_out_query_is_cancelled_server_side(
+    make_client: MakeClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = make_client()
+    # Zero seconds left once the query is sent, while it is still queued.
+    monkeypatch.setattr(client, "_timeout", lambda: 0.0)
+    client._connection.statuses = [QueryStatus.QUEUED]
+
+    with pytest.raises(TimeoutError):
+        client.execute_query("SELECT 1")
+    client.close()
+
+    assert client._connection.executed[-1] == "SELECT SYSTEM$CANCEL_QUERY('01-query')"
+    assert client.counters.timeouts == 1
+    assert client.counters.cancelled == 1
+
+
+def test_run_deadline_stops_new_queries(make_client: MakeClient) -> None:
+    client = make_client()
+
+    with client.run_deadline(0), pytest.raises(TimeoutError):
+        client.execute_query("SELECT 1")
+    client.close()
+
+    assert client._connection.executed == []
+
+
+def test_queued_time_is_reported_to_the_limiter(
+    make_client: MakeClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = make_client()
+    client._connection.statuses = [QueryStatus.QUEUED, QueryStatus.QUEUED]
+    released: list[tuple[float | None, float]] = []
+    release = client.limiter.release
+
+    def record(started: float, latency: float | None, queued: float) -> None:
+        released.append((latency, queued))
+        release(started, latency, queued)
+
+    monkeypatch.setattr(client.limiter, "release", record)
+
+    client.execute_query("SELECT 1")
+    client.close()
+
+    [(latency, queued)] = released
+    assert latency is not None
+    assert 0 < queued <= latency
+
+
+def test_cancel_running_drops_queries_waiting_for_a_slot(
+    make_client: MakeClient,
+) -> None:
+    client = make_client(max_concurrency=4)
+    client.limiter.limit = 1.0
+    connection = client._connection
+    connection.statuses = [QueryStatus.RUNNING] * 1_000
+    futures = [client.submit(f"SELECT {index}") for index in range(4)]
+    deadline = time.monotonic() + 5
+    while connection.executed != ["SELECT 0"] or not all(
+        future.running() for future in futures
+    ):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    client.cancel_running()
+    connection.statuses.clear()
+
+    futures[0].result()
+    for future in futures[1:]:
+        with pytest.raises(CancelledError):
+            future.result()
+    client.close()
+    assert [sql for sql in connection.executed if "CANCEL" not in sql] == ["SELECT 0"]
@@ -0,0 +1,25 @@
+import json
+from collections.abc import Callable
+from pathlib import Path
+
+from hilo_eda.snowflake import SnowflakeClient
+from hilo_eda.tracing import Tracer, stage, tracing
+
+
+def test_tracer_records_stage_across_worker_threads(
+    make_client: Callable[..., SnowflakeClient], tmp_path: Path
+) -> None:
+    client = make_client(max_concurrency=2)
+    tracer = Tracer()
+    with tracing(tracer), stage("profiling"):
+        client.execute_many(["SELECT 1", "SELECT 2"])
+    client.close()
+
+    assert [record.stage for record in tracer.queries] == ["profiling"] * 2
+    assert tracer.query_ids() == ["01-query", "01-query"]
+    assert tracer.summary()[0].queries == 2
+    assert [span.name for span in tracer.spans] == ["profiling"]
+
+    tracer.write(tmp_path / "trace.json")
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    assert {event["ph"] for event in events} == {"M", "X"}